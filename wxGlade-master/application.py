@@ -8,10 +8,10 @@ Application class to store properties of the application being created
 """
 
 
-import os, sys, random, re, logging, time
+import os, sys, random, re, logging, threading, time
 import wx
 
-import common, config, misc, plugins, compat
+import common, config, misc, plugins, compat, profiling, stats
 import bugdialog
 import new_properties as np
 
@@ -127,6 +127,22 @@ class EditRoot(np.PropertyOwner):
         # add a . to the file extensions
         attrs["source_extension"] = '.' + self.properties["source_extension"].get_string_value()
         attrs["header_extension"] = '.' + self.properties["header_extension"].get_string_value()
+        if self.share_resources:
+            attrs["share_resources"] = 1  # written only if set, to keep existing files unchanged
+        if self.embed_images:
+            attrs["embed_images"] = 1
+        if self.properties["table_threshold"].is_active():
+            attrs["table_threshold"] = self.table_threshold
+        if self.choices_file:
+            attrs["choices_file"] = 1
+        if self.lazy_imports:
+            attrs["lazy_imports"] = 1
+        if self.minimal_includes:
+            attrs["minimal_includes"] = 1
+        if self.precompiled_header:
+            attrs["precompiled_header"] = 1
+        if self.xrc_archive:
+            attrs["xrc_archive"] = 1
 
         inner_xml = []
 
@@ -171,6 +187,77 @@ class EditRoot(np.PropertyOwner):
         return None
 
 
+class _CodeGenerationCancelled(Exception):
+    pass
+
+
+class _CodeGenerationThread(threading.Thread):
+    """Runs the code writer for Application.generate_code(background=True).
+    The application modal progress dialog freezes editing while the writer reads the project, so no copy is required.
+    Progress, errors and the completion are passed to the GUI thread via wx.CallAfter.
+    Cancelling is possible before each toplevel window; files already written are kept."""
+
+    def __init__(self, app, writer, widget):
+        threading.Thread.__init__(self, name="wxGlade code generation")
+        self.daemon = True
+        self.app = app
+        self.writer = writer
+        self.widget = widget
+        self.count = len(app.children)
+        self.cancelled = False  # set by the GUI thread
+        self.dialog = wx.ProgressDialog( _("Generate Code"), _("Please wait while generating the code") + " "*20,
+                                         self.count+1, common.main, wx.PD_APP_MODAL|wx.PD_CAN_ABORT )
+
+    def run(self):
+        # worker thread
+        exc_info = None
+        completed = False
+        self.writer.progress = self.on_progress
+        try:
+            # profile here, as the profiler only covers the thread that enables it
+            with profiling.profile("generate_code"):
+                self.writer.generate_code(self.app, self.widget)
+                self.on_progress(None, self.count, self.count)
+                with stats.timer("finalize"):
+                    self.writer.finalize()
+            completed = True
+        except _CodeGenerationCancelled:
+            pass
+        except Exception:
+            exc_info = sys.exc_info()
+        finally:
+            self.writer.progress = None
+            self.writer.clean_up(self.widget or self.app)
+        wx.CallAfter(self.finished, completed, exc_info)
+
+    def on_progress(self, name, index, count):
+        # worker thread; called by the writer before each toplevel and here before writing the files
+        if self.cancelled: raise _CodeGenerationCancelled()
+        wx.CallAfter(self.show_progress, name, index)
+
+    def show_progress(self, name, index):
+        if self.dialog is None: return  # finished already
+        if name is None:
+            msg = _("Writing files...")
+        else:
+            msg = _("Generating code for %s (%d/%d)")%(name, index+1, self.count)
+        common.main.user_message(msg)
+        ret = self.dialog.Update(index, msg)
+        if isinstance(ret, tuple): ret = ret[0]  # Phoenix returns (continue, skip)
+        if not ret: self.cancelled = True
+
+    def finished(self, completed, exc_info):
+        self.dialog.Destroy()
+        self.dialog = None
+        self.app._code_generation = None
+        if exc_info:
+            self.app._code_generation_failed(exc_info[1], exc_info)
+        elif completed:
+            self.app._code_generation_done()
+        else:
+            common.main.user_message(_("Code generation cancelled"))
+
+
 class Application(EditRoot):
     "Properties of the application being created"
 
@@ -179,7 +266,9 @@ class Application(EditRoot):
                          "Generate source files for wxWidgets version 3.0\nOld style import are not supported anymore.")
 
     PROPERTIES = ["Application", "name", "class", "encoding", "use_gettext", "top_window", "multiple_files",
-                                 "language", "for_version", "overwrite", "mark_blocks",
+                                 "language", "for_version", "overwrite", "mark_blocks", "share_resources",
+                                 "embed_images", "table_threshold", "choices_file", "lazy_imports",
+                                 "minimal_includes", "precompiled_header", "xrc_archive",
                                  "output_path", "generate_code",
                   "Settings",    "indent_mode", "indent_amount", "source_extension", "header_extension"]
     _PROPERTY_LABELS = {"source_extension":     'C++ source file ext',
@@ -189,6 +278,14 @@ class Application(EditRoot):
                         "multiple_files":       "Code Generation",
                         "overwrite":            "Keep user code",
                         "mark_blocks":          "Mark code blocks",
+                        "share_resources":      "Share fonts, colours, bitmaps",
+                        "embed_images":         "Embed images",
+                        "table_threshold":      "Data tables from",
+                        "choices_file":         "Choices from data file",
+                        "lazy_imports":         "Import wx submodules lazily",
+                        "minimal_includes":     "Minimal includes",
+                        "precompiled_header":   "Precompiled header",
+                        "xrc_archive":          "XRS archive",
                         "generate_code":        "Generate Source"}
     _PROPERTY_HELP = {"name":            'Name of the instance created from "Class";\n'
                                          ' also used as (main) file name in case of "Separate file for each class"',
@@ -205,7 +302,35 @@ class Application(EditRoot):
                       "output_path": "Output file or directory: absolute or relative path",
                       "mark_blocks":"Mark auto-generated code blocks with BEGIN/END wxGlade comments.\n"
                                     "This allows to identify user code in source files.\n"
-                                    "Therefore it can not be disabled if 'Keep user code' is selected."
+                                    "Therefore it can not be disabled if 'Keep user code' is selected.",
+                      "share_resources":"Create identical fonts, colours and bitmaps only once per class.\n"
+                                        "They are stored in local variables at the beginning of the constructor.\n"
+                                        "For Python, C++ and Perl only.",
+                      "embed_images":"Store the image files in a generated module and load the bitmaps from there.\n"
+                                     "Each image is stored once and decoded on first use only.\n"
+                                     "For Python and C++ only.",
+                      "table_threshold":"Generate grid rows and columns and list control columns as data table\n"
+                                        "plus loop if at least this number of entries is to be set.\n"
+                                        "For Python and C++ only. Choice lists are a single list or array anyway;\n"
+                                        "see 'Choices from data file'.",
+                      "choices_file":"Store choice lists with at least 'Data tables from' entries in a data file\n"
+                                     "that is loaded by the constructor.\n"
+                                     "For Python only. The strings in the data file are not found by xgettext.",
+                      "lazy_imports":"Import wx submodules like wx.grid in the constructors of the classes that use\n"
+                                     "them instead of at module level. This reduces the start-up time of\n"
+                                     "applications that don't create these windows right away.\n"
+                                     "For Python only.",
+                      "minimal_includes":"Include only the headers a class needs in its header file and use forward\n"
+                                         "declarations where possible; the other headers are included by the source\n"
+                                         "file. This reduces the rebuilds if a header changes.\n"
+                                         "For C++ with separate files for each class only.",
+                      "precompiled_header":"Generate a header file <name>_pch.h with the headers of all classes and\n"
+                                           "include it as first header in the source files.\n"
+                                           "For C++ with separate files for each class and 'Minimal includes' only.",
+                      "xrc_archive":"Write the XRC files and the index file also into a ZIP archive <name>.xrs.\n"
+                                    "A single window can be loaded from the archive with\n"
+                                    "XmlResource.Load('<name>.xrs#zip:<window>.xrc').\n"
+                                    "For XRC with separate files for each class only."
                       }
     if sys.platform=="win32":
         _PROPERTY_HELP["output_path"] = "Output file or directory; double click label to show in Explorer"
@@ -251,6 +376,14 @@ class Application(EditRoot):
         self.overwrite = np.InvCheckBoxProperty(config.default_overwrite)
         # YYY 
         self.mark_blocks = np.CheckBoxProperty(True)
+        self.share_resources = np.CheckBoxProperty(False)
+        self.embed_images = np.CheckBoxProperty(False)
+        self.table_threshold = np.SpinPropertyD(100, val_range=(1, 100000), default_value=100)
+        self.choices_file = np.CheckBoxProperty(False)
+        self.lazy_imports = np.CheckBoxProperty(False)
+        self.minimal_includes = np.CheckBoxProperty(False)
+        self.precompiled_header = np.CheckBoxProperty(False)
+        self.xrc_archive = np.CheckBoxProperty(False)
 
         # output language
         languages = sorted( common.code_writers.keys() )
@@ -272,7 +405,8 @@ class Application(EditRoot):
         # top window name for the generated app
         self.top_window = prop = np.ListBoxProperty("", choices=[])
         prop.auto_activated = True
-        self.generate_code = np.ActionButtonProperty(self.generate_code)
+        self.generate_code = np.ActionButtonProperty(lambda: self.generate_code(background=True))
+        self._code_generation = None  # the running _CodeGenerationThread, if any
 
         self.widget = None  # always None, just to keep interface to Tree similar to other editors
         self.children = []  # the toplevel windows
@@ -436,6 +570,14 @@ class Application(EditRoot):
         p["indent_amount"].set(config.default_indent_amount)
         p["source_extension"].set('cpp')
         p["header_extension"].set('h')
+        p["share_resources"].set(False)
+        p["embed_images"].set(False)
+        p["table_threshold"].set(100, deactivate=True)
+        p["choices_file"].set(False)
+        p["lazy_imports"].set(False)
+        p["minimal_includes"].set(False)
+        p["precompiled_header"].set(False)
+        p["xrc_archive"].set(False)
         if config.default_multiple_files:
             p["output_path"].set("wxglade_out")
         else:
@@ -461,7 +603,13 @@ class Application(EditRoot):
         self._init()
         self.properties_changed(None)
 
-    def generate_code(self, preview=False, out_path=None, widget=None):
+    def generate_code(self, preview=False, out_path=None, widget=None, background=False):
+        """background: run the code writer in a worker thread while an application modal progress dialog freezes
+        editing; only with GUI and not for preview; used by the menu, toolbar and button"""
+        if self._code_generation is not None:
+            return  # still running
+        if config.use_gui and common.main.is_loading():
+            return misc.error_message( _("The project is still loading") )
         if config.use_gui:
             common.property_panel.flush()
         else:
@@ -492,33 +640,53 @@ class Application(EditRoot):
         else:
             writer = common.code_writers[self.language]#.copy()
 
-        error = writer.new_project(self, out_path, preview)
+        with stats.timer("new_project"):
+            error = writer.new_project(self, out_path, preview)
         if error:
             # prerequisites were checked and there is a problem
             misc.error_message( _("Error generating code:\n%s")%error )
             return
 
+        if background and config.use_gui and not preview:
+            self._code_generation = _CodeGenerationThread(self, writer, widget)
+            self._code_generation.start()
+            return
+
         try:
-            writer.generate_code(self, widget)
+            self._run_code_writer(writer, widget)
+        except Exception as inst:
+            self._code_generation_failed(inst)
+            return
+        finally:
+            writer.clean_up(widget or self)
+
+        if preview or not config.use_gui: return
+        self._code_generation_done()
+
+    @profiling.profiled("generate_code")
+    def _run_code_writer(self, writer, widget):
+        # synchronous code generation; for background=True, _CodeGenerationThread.run() profiles the writer
+        writer.generate_code(self, widget)
+        with stats.timer("finalize"):
             writer.finalize()
-        except EnvironmentError as inst:
+
+    def _code_generation_failed(self, inst, exc_info=None):
+        "show an error of the code writer; exc_info is passed if the error was caught in the worker thread"
+        if isinstance(inst, EnvironmentError):
             bugdialog.ShowEnvironmentError(_('An IO related error has occurred:'), inst)
-            return
-        except UnicodeEncodeError as inst:
+        elif isinstance(inst, UnicodeEncodeError):
             msg = _("Could not convert generated source code to encoding %s.\n"
                     '(characters "%s")')
             chars = inst.object[inst.start:inst.end] # .encode('unicode-escape')
             msg = msg%(self.encoding, chars)
             misc.error_message( msg )
-            return
-        except Exception as inst:
+        elif exc_info:
+            bugdialog.ShowEI(exc_info[0], exc_info[1], exc_info[2], _('Generate Code'))
+        else:
             # unexpected / internal error
             bugdialog.Show(_('Generate Code'), inst)
-            return
-        finally:
-            writer.clean_up(widget or self)
 
-        if preview or not config.use_gui: return
+    def _code_generation_done(self):
         if config.preferences.show_completion:
             # Show informational dialog
             misc.info_message("Code generation completed successfully")
@@ -528,7 +696,6 @@ class Application(EditRoot):
             frame = app.GetTopWindow()
             frame.user_message(_('Code generated'))
 
-
     def is_visible(self):
         return True
 
@@ -741,7 +908,7 @@ class Application(EditRoot):
     def _create_popup_menu(self, widget):
         menu = misc.wxGladePopupMenu("Application")
         i = misc.append_menu_item( menu, -1, _('Generate Code') )
-        misc.bind_menu_item_after(widget, i, self.generate_code)  # a property, but it can be called
+        misc.bind_menu_item_after(widget, i, lambda: self.generate_code(background=True))
         return menu
 
     def check_drop_compatibility(self):
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+"""
+Generator for large synthetic .wxg projects, e.g. for benchmarks and stress tests
+
+The projects are generated from parameters and a random seed, i.e. the same command line always creates the same
+file. All widget bases that are registered in common.widgets_from_xml are used.
+
+Each toplevel window has a tree of nested sizers of all types with the given depth and widgets per panel.
+Frames have a menu bar, a tool bar and a status bar, a number of notebooks and a splitter window.
+Each notebook page and each splitter pane is a panel with the same tree of sizers.
+
+Usage:
+  python benchmarks/generate_project.py -o big.wxg
+  python benchmarks/generate_project.py -o huge.wxg --toplevels 50 --widgets 40 --depth 4 --menu-items 5000
+  python benchmarks/generate_project.py -o big.wxg --check   # load, save and generate code to verify the file
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import math, optparse, os, random, shutil, sys, tempfile
+from xml.sax.saxutils import escape, quoteattr
+
+from run_benchmarks import init, languages
+
+
+# bases that are not used as simple widgets inside a sizer
+TOPLEVEL_BASES = ["EditFrame", "EditDialog", "EditTopLevelPanel", "EditTopLevelScrolledWindow", "EditMDIChildFrame"]
+SIZER_BASES = ["EditBoxSizer", "EditGridBagSizer", "EditFlexGridSizer", "EditStaticBoxSizer", "EditGridSizer",
+               "EditWrapSizer"]
+STRUCTURE_BASES = set( TOPLEVEL_BASES + SIZER_BASES +
+                       ["EditStdDialogButtonSizer", "EditMenuBar", "EditToolBar", "EditStatusBar",
+                        "EditNotebook", "EditSplitterWindow", "EditPanel", "EditScrolledWindow",
+                        "NotebookPane", "SplitterPane"] )
+
+# class names for bases where it can't be derived from WX_CLASS
+CLASS_NAMES = {"EditTopLevelPanel":"wxPanel", "EditTopLevelScrolledWindow":"wxScrolledWindow",
+               "EditScrolledWindow":"wxScrolledWindow", "CustomWidget":"CustomWidget", "EditSpacer":"spacer"}
+
+# additional properties to make the widgets a bit more realistic; %(name)s is replaced with the widget name
+_CHOICES = ["<choices>", ["<choice>one</choice>", "<choice>two</choice>", "<choice>three</choice>"], "</choices>"]
+WIDGET_PROPERTIES = {
+    "EditButton":        ["<label>%(name)s</label>"],
+    "EditToggleButton":  ["<label>%(name)s</label>"],
+    "EditCheckBox":      ["<label>%(name)s</label>"],
+    "EditRadioButton":   ["<label>%(name)s</label>"],
+    "EditStaticText":    ["<label>%(name)s</label>", "<attribute>1</attribute>"],
+    "EditHyperlinkCtrl": ["<label>%(name)s</label>", "<url>http://wxglade.sf.net</url>"],
+    "EditRadioBox":      ["<label>%(name)s</label>", "<selection>0</selection>"] + _CHOICES,
+    "EditChoice":        ["<selection>0</selection>"] + _CHOICES,
+    "EditComboBox":      ["<selection>0</selection>"] + _CHOICES,
+    "EditListBox":       ["<selection>0</selection>"] + _CHOICES,
+    "EditCheckListBox":  ["<selection>0</selection>"] + _CHOICES,
+    "EditBitmapButton":  ["<bitmap>empty:16,16</bitmap>"],
+    "EditStaticBitmap":  ["<bitmap>empty:16,16</bitmap>"],
+    "EditListCtrl":      ["<style>wxLC_REPORT|wxSUNKEN_BORDER</style>"],
+    "EditSpacer":        ["<width>20</width>", "<height>20</height>"],
+}
+
+
+class ProjectGenerator(object):
+    "Writes a synthetic project as list of lines; see generate()"
+
+    def __init__(self, toplevels=10, widgets=20, depth=3, span=2, notebooks=1, pages=3, menu_items=100, seed=0):
+        import common
+        self.toplevels = toplevels    # number of toplevel windows
+        self.widgets = widgets        # number of widgets per panel, distributed over the nested sizers
+        self.depth = max(1, depth)    # nesting depth of sizers per panel
+        self.span = max(1, span)      # maximum row and col span of items in GridBagSizers
+        self.notebooks = notebooks    # number of notebooks per frame
+        self.pages = max(1, pages)    # number of pages per notebook
+        self.menu_items = menu_items  # number of menu items per frame
+        self.random = random.Random(seed)
+
+        registered = common.widgets_from_xml
+        self.toplevel_bases = [base for base in TOPLEVEL_BASES if base in registered]
+        self.sizer_bases = [base for base in SIZER_BASES if base in registered]
+        self.widget_bases = sorted( base for base in registered if base not in STRUCTURE_BASES )
+        self.class_names = dict(CLASS_NAMES)
+        for base, cls in common.widget_classes.items():
+            if base not in self.class_names and getattr(cls, "WX_CLASS", None):
+                self.class_names[base] = cls.WX_CLASS
+
+        self._names = {}       # name prefix -> last number
+        self._widget_index = 0  # the widget bases are used in turn
+        self._sizer_index = 0
+        self.lines = []
+        self.top_window = None
+
+    # helpers ##########################################################################################################
+    def get_name(self, prefix):
+        number = self._names[prefix] = self._names.get(prefix, 0) + 1
+        return "%s_%d" % (prefix, number)
+
+    def get_class(self, base):
+        if base in self.class_names: return self.class_names[base]
+        return "wx" + base[4:] if base.startswith("Edit") else base
+
+    def add(self, tabs, *lines):
+        for line in lines:
+            if isinstance(line, list):
+                self.add(tabs+1, *line)
+            else:
+                self.lines.append( "    "*tabs + line + "\n" )
+
+    def open_object(self, tabs, base, name, klass=None):
+        self.add( tabs, '<object class=%s name=%s base=%s>'%(quoteattr(klass or self.get_class(base)),
+                                                               quoteattr(name), quoteattr(base)) )
+
+    def close_object(self, tabs):
+        self.add(tabs, "</object>")
+
+    # widgets and sizers ###############################################################################################
+    def add_widget(self, tabs, in_gridbag=False):
+        base = self.widget_bases[self._widget_index % len(self.widget_bases)]
+        self._widget_index += 1
+        if in_gridbag and base=="EditSpacer":
+            # the Lisp code generator does not support spacers in GridBagSizers
+            return self.add_widget(tabs, in_gridbag)
+        name = self.get_name( "spacer" if base=="EditSpacer" else base.replace("Edit", "", 1).lower() )
+        self.open_object(tabs, base, name)
+        for line in WIDGET_PROPERTIES.get(base, []):
+            self.add( tabs+1, *(line if isinstance(line, list) else [line % {"name":escape(name)}]) )
+        self.close_object(tabs)
+
+    def add_sizeritem(self, tabs, add_child, span=None, proportion=1, flag="wxEXPAND"):
+        self.add( tabs, '<object class="sizeritem">', ["<option>%d</option>"%proportion, "<border>0</border>",
+                                                       "<flag>%s</flag>"%flag] )
+        if span and span!=(1, 1):
+            self.add( tabs+1, "<span>%d, %d</span>"%span )
+        add_child(tabs+1)
+        self.close_object(tabs)
+
+    def add_sizer(self, tabs, depth, widgets):
+        "add a sizer with the given nesting depth; widgets are distributed over the levels"
+        base = self.sizer_bases[self._sizer_index % len(self.sizer_bases)]
+        self._sizer_index += 1
+        count = widgets if depth==1 else max(1, widgets//depth)
+        if base=="EditGridBagSizer":
+            children = [lambda tabs: self.add_widget(tabs, True)]*count
+        else:
+            children = [self.add_widget]*count
+        if depth > 1:
+            children.append( lambda tabs: self.add_sizer(tabs, depth-1, widgets-count) )
+
+        self.open_object( tabs, base, self.get_name("sizer") )
+        if base in ("EditGridSizer", "EditFlexGridSizer", "EditGridBagSizer"):
+            cols = int( math.ceil(math.sqrt(len(children))) )
+            if base=="EditGridBagSizer":
+                cells = self._place_items(len(children), cols)
+                rows = max(row for row, col in cells) + 1
+            else:
+                rows = int( math.ceil(len(children)/float(cols)) )
+            self.add( tabs+1, "<rows>%d</rows>"%rows, "<cols>%d</cols>"%cols, "<vgap>0</vgap>", "<hgap>0</hgap>" )
+            if base!="EditGridSizer":
+                self.add( tabs+1, "<growable_rows>0</growable_rows>", "<growable_cols>0</growable_cols>" )
+            if base=="EditGridBagSizer":
+                # one entry per cell, row by row; cells that are covered by spans are written as slots
+                for row in range(rows):
+                    for col in range(cols):
+                        if (row, col) in cells:
+                            index, span = cells[(row, col)]
+                            self.add_sizeritem(tabs+1, children[index], span)
+                        else:
+                            self.add( tabs+1, '<object class="sizerslot" />' )
+            else:
+                for child in children:
+                    self.add_sizeritem(tabs+1, child)
+                for i in range(rows*cols - len(children)):
+                    self.add( tabs+1, '<object class="sizerslot" />' )
+        else:
+            orient = "wxVERTICAL" if depth%2 else "wxHORIZONTAL"
+            self.add( tabs+1, "<orient>%s</orient>"%orient )
+            if base=="EditStaticBoxSizer":
+                self.add( tabs+1, "<label>%s</label>"%self._names["sizer"] )
+            for child in children:
+                self.add_sizeritem(tabs+1, child)
+        self.close_object(tabs)
+
+    def _place_items(self, count, cols):
+        "place count items in a grid with cols columns, with random spans; returns {(row,col):(index,span)}"
+        occupied = set()
+        cells = {}
+        row = col = 0
+        for index in range(count):
+            while (row, col) in occupied:
+                col += 1
+                if col==cols: row, col = row+1, 0
+            # the span may extend to the right up to the next occupied cell and downwards without limit
+            max_colspan = 1
+            while max_colspan < self.span and col+max_colspan < cols and (row, col+max_colspan) not in occupied:
+                max_colspan += 1
+            span = ( self.random.randint(1, self.span), self.random.randint(1, max_colspan) )
+            cells[(row, col)] = (index, span)
+            for r in range(row, row+span[0]):
+                for c in range(col, col+span[1]):
+                    occupied.add( (r, c) )
+        return cells
+
+    # containers #######################################################################################################
+    def add_panel(self, tabs, name, base="EditPanel"):
+        self.open_object(tabs, base, name)
+        self.add( tabs+1, "<style>wxTAB_TRAVERSAL</style>" )
+        if base=="EditScrolledWindow":
+            self.add( tabs+1, "<scrollable>1</scrollable>", "<scroll_rate>10, 10</scroll_rate>" )
+        self.add_sizer(tabs+1, self.depth, self.widgets)
+        self.close_object(tabs)
+
+    def add_notebook(self, tabs):
+        name = self.get_name("notebook")
+        pages = ["%s_pane_%d"%(name, i+1) for i in range(self.pages)]
+        self.open_object(tabs, "EditNotebook", name)
+        self.add( tabs+1, "<tabs>", ['<tab window=%s>Page %d</tab>'%(quoteattr(page), i+1)
+                                     for i, page in enumerate(pages)], "</tabs>" )
+        for page in pages:
+            self.add_panel(tabs+1, page)
+        self.close_object(tabs)
+
+    def add_splitter(self, tabs):
+        name = self.get_name("splitter")
+        panes = ["%s_pane_1"%name, "%s_pane_2"%name]
+        self.open_object(tabs, "EditSplitterWindow", name)
+        self.add( tabs+1, "<orientation>wxSPLIT_VERTICAL</orientation>",
+                  "<window_1>%s</window_1>"%panes[0], "<window_2>%s</window_2>"%panes[1] )
+        self.add_panel(tabs+1, panes[0])
+        self.add_panel(tabs+1, panes[1], "EditScrolledWindow" if "EditScrolledWindow" in self.class_names else "EditPanel")
+        self.close_object(tabs)
+
+    # bars #############################################################################################################
+    def add_menubar(self, tabs, name, klass="wxMenuBar"):
+        self.open_object(tabs, "EditMenuBar", name, klass)
+        self.add(tabs+1, "<menus>")
+        per_menu = 50
+        for m in range( max(1, int(math.ceil(self.menu_items/float(per_menu)))) ):
+            items = min(per_menu, self.menu_items - m*per_menu)
+            self.add( tabs+2, '<menu label=%s name="">'%quoteattr("Menu %d"%(m+1)) )
+            submenu = items//5  # the last fifth of the items is in a sub menu
+            for i in range(items - submenu):
+                self._add_menu_item(tabs+3, m, i)
+            if submenu:
+                self.add( tabs+3, '<menu label="More" name="">' )
+                for i in range(items - submenu, items):
+                    self._add_menu_item(tabs+4, m, i)
+                self.add( tabs+3, "</menu>" )
+            self.add( tabs+2, "</menu>" )
+        self.add(tabs+1, "</menus>")
+        self.close_object(tabs)
+
+    def _add_menu_item(self, tabs, menu, i):
+        item = ["<label>Item %d.%d</label>"%(menu+1, i+1), "<id>mn_ID_%d_%d=?</id>"%(menu+1, i+1)]
+        if i%10==0:
+            item.append("<handler>on_menu_%d_%d</handler>"%(menu+1, i+1))
+        elif i%10==5:
+            item.append("<checkable>1</checkable>")
+        self.add(tabs, "<item>", item, "</item>")
+
+    def add_toolbar(self, tabs, name, klass="wxToolBar"):
+        self.open_object(tabs, "EditToolBar", name, klass)
+        self.add(tabs+1, "<tools>")
+        for i in range(10):
+            self.add( tabs+2, "<tool>", ["<id>tb_ID_%d=?</id>"%(i+1), "<label>Tool %d</label>"%(i+1),
+                                         "<type>0</type>", "<bitmap1>empty:16,16</bitmap1>", "<bitmap2 />"],
+                      "</tool>" )
+        self.add(tabs+1, "</tools>")
+        self.close_object(tabs)
+
+    def add_statusbar(self, tabs, name):
+        self.open_object(tabs, "EditStatusBar", name)
+        self.add( tabs+1, "<fields>", ['<field width="-2">%s</field>'%name, '<field width="-1" />'], "</fields>" )
+        self.close_object(tabs)
+
+    # toplevels ########################################################################################################
+    def add_toplevel(self, tabs, index):
+        base = self.toplevel_bases[index % len(self.toplevel_bases)]
+        name = self.get_name( base.replace("Edit", "", 1).lower() )
+        if self.top_window is None: self.top_window = name
+        self.open_object( tabs, base, name, "My%s%d"%(base.replace("Edit", "", 1), index+1) )
+        if base in ("EditFrame", "EditMDIChildFrame"):
+            has_statusbar = base=="EditFrame"  # MDI child frames have no status bar
+            self.add( tabs+1, "<size>800, 600</size>", "<title>%s</title>"%name,
+                      "<style>wxDEFAULT_FRAME_STYLE</style>", "<menubar>1</menubar>", "<toolbar>1</toolbar>" )
+            if has_statusbar: self.add( tabs+1, "<statusbar>1</statusbar>" )
+            self.add_menubar(tabs+1, "%s_menubar"%name)
+            if has_statusbar: self.add_statusbar(tabs+1, "%s_statusbar"%name)
+            self.add_toolbar(tabs+1, "%s_toolbar"%name)
+            # frame -> sizer -> panel -> sizer -> notebooks, splitter and widgets
+            self.open_object( tabs+1, "EditBoxSizer", self.get_name("sizer") )
+            self.add( tabs+2, "<orient>wxVERTICAL</orient>" )
+            self.add_sizeritem(tabs+2, self._add_frame_panel)
+            self.close_object(tabs+1)
+        elif base=="EditDialog":
+            self.add( tabs+1, "<title>%s</title>"%name, "<style>wxDEFAULT_DIALOG_STYLE</style>" )
+            self.open_object( tabs+1, "EditBoxSizer", self.get_name("sizer") )
+            self.add( tabs+2, "<orient>wxVERTICAL</orient>" )
+            self.add_sizeritem( tabs+2, lambda tabs: self.add_sizer(tabs, self.depth, self.widgets) )
+            self.add_sizeritem( tabs+2, self._add_dialog_buttons, proportion=0, flag="wxALIGN_RIGHT|wxALL" )
+            self.close_object(tabs+1)
+        else:
+            self.add( tabs+1, "<style>wxTAB_TRAVERSAL</style>" )
+            if base=="EditTopLevelScrolledWindow":
+                self.add( tabs+1, "<scrollable>1</scrollable>", "<scroll_rate>10, 10</scroll_rate>" )
+            self.add_sizer(tabs+1, self.depth, self.widgets)
+        self.close_object(tabs)
+
+    def _add_frame_panel(self, tabs):
+        self.open_object( tabs, "EditPanel", self.get_name("panel") )
+        self.open_object( tabs+1, "EditBoxSizer", self.get_name("sizer") )
+        self.add( tabs+2, "<orient>wxVERTICAL</orient>" )
+        for i in range(self.notebooks):
+            self.add_sizeritem(tabs+2, self.add_notebook)
+        self.add_sizeritem(tabs+2, self.add_splitter)
+        self.add_sizeritem( tabs+2, lambda tabs: self.add_sizer(tabs, self.depth, self.widgets) )
+        self.close_object(tabs+1)
+        self.close_object(tabs)
+
+    def _add_dialog_buttons(self, tabs):
+        self.open_object( tabs, "EditStdDialogButtonSizer", self.get_name("sizer") )
+        self.add( tabs+1, "<orient>wxHORIZONTAL</orient>" )
+        for stockitem in ("OK", "CANCEL"):
+            def add_button(tabs, stockitem=stockitem):
+                self.open_object( tabs, "EditButton", self.get_name("button") )
+                self.add( tabs+1, "<stockitem>%s</stockitem>"%stockitem )
+                self.close_object(tabs)
+            self.add_sizeritem(tabs+1, add_button, proportion=0, flag="wxALL")
+        self.close_object(tabs)
+
+    def generate(self):
+        "returns the project as list of lines"
+        self.lines = []
+        body = self.lines
+        for i in range(self.toplevels):
+            self.add_toplevel(1, i)
+        # bars may be toplevels as well
+        self.add_menubar(1, self.get_name("menubar"), "MyMenuBar")
+        self.add_toolbar(1, self.get_name("toolbar"), "MyToolBar")
+
+        header = ['<?xml version="1.0"?>\n',
+                  '<!-- generated by benchmarks/generate_project.py -->\n', '\n',
+                  '<application class="MyApp" encoding="UTF-8" for_version="3.0" header_extension=".h" '
+                  'indent_amount="4" indent_symbol="space" is_template="0" language="python" mark_blocks="1" '
+                  'name="app" option="0" overwrite="1" path="" source_extension=".cpp" top_window=%s '
+                  'use_gettext="1" use_new_namespace="1">\n' % quoteattr(self.top_window or "")]
+        return header + body + ["</application>\n"]
+
+
+def check(filename):
+    "load, save and generate code for all languages; the saved file must load and save identically"
+    import common, application, wxglade
+    directory = tempfile.mkdtemp(prefix="wxglade_generated_")
+    try:
+        saved = []
+        for i in range(2):
+            common.root = application.Application()
+            if not wxglade._guiless_open_app(filename):
+                raise ValueError("could not load %s" % filename)
+            buffer = []
+            common.root.write(buffer)
+            saved.append( "".join(buffer[1:]) )  # without the header with the time stamp
+            filename = os.path.join(directory, "saved_%d.wxg"%i)
+            common.save_file(filename, buffer, "wxg")
+        if saved[0]!=saved[1]:
+            raise ValueError("saved project differs after reloading")
+
+        app = common.root
+        for language, extension in languages:
+            if language=="lisp" and app.for_version!="2.8":
+                app.properties["for_version"].set("2.8")  # Lisp supports wx 2.8 only
+            app.properties["language"].set(language)
+            out_path = os.path.join(directory, "app" + extension)
+            app.generate_code(out_path=out_path)
+            if not os.path.isfile(out_path):
+                raise ValueError("no code generated for %s" % language)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def parse_command_line():
+    parser = optparse.OptionParser(usage="%prog [options] -o FILE")
+    parser.add_option("-o", "--output", metavar="FILE", dest="output", help="the .wxg file to write")
+    parser.add_option("--toplevels", type="int", dest="toplevels", default=10,
+                      help="number of toplevel windows (default: 10)")
+    parser.add_option("--widgets", type="int", dest="widgets", default=20,
+                      help="number of widgets per panel (default: 20)")
+    parser.add_option("--depth", type="int", dest="depth", default=3, help="nesting depth of sizers (default: 3)")
+    parser.add_option("--span", type="int", dest="span", default=2,
+                      help="maximum row and column span in GridBagSizers (default: 2)")
+    parser.add_option("--notebooks", type="int", dest="notebooks", default=1,
+                      help="number of notebooks per frame (default: 1)")
+    parser.add_option("--pages", type="int", dest="pages", default=3,
+                      help="number of pages per notebook (default: 3)")
+    parser.add_option("--menu-items", type="int", dest="menu_items", default=100,
+                      help="number of menu items per frame (default: 100)")
+    parser.add_option("--seed", type="int", dest="seed", default=0, help="random seed (default: 0)")
+    parser.add_option("--check", action="store_true", dest="check",
+                      help="load and save the file and generate code for all languages")
+    options, args = parser.parse_args()
+    if not options.output:
+        parser.error("output file name required")
+    return options
+
+
+def main():
+    options = parse_command_line()
+    init()
+    generator = ProjectGenerator( options.toplevels, options.widgets, options.depth, options.span,
+                                  options.notebooks, options.pages, options.menu_items, options.seed )
+    lines = generator.generate()
+    with open(options.output, "w") as f:
+        f.writelines(lines)
+    print( "%s: %d lines, %d widgets" % (options.output, len(lines), sum(generator._names.values())) )
+    if options.check:
+        check(options.output)
+        print( "%s: loaded, saved and generated code for %s" % (options.output,
+                                                                ", ".join(language for language, ext in languages)) )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit( main() )
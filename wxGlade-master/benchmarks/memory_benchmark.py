@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Memory benchmark for loading projects, using tracemalloc
+
+Each case file is loaded without GUI while tracemalloc is tracing. Reported are the memory that is allocated by the
+loaded project, the number of widgets and properties and the memory per property, i.e. the allocations made by
+new_properties.py divided by the number of properties. The latter is the figure to watch when changing the storage
+of the properties.
+
+Usage:
+  python benchmarks/memory_benchmark.py                        # run the default cases
+  python benchmarks/memory_benchmark.py ComplexExample Grid    # run selected cases
+  python benchmarks/memory_benchmark.py big.wxg                # run a file, e.g. from generate_project.py
+  python benchmarks/memory_benchmark.py --top 10 big.wxg       # also print the top 10 allocating source lines
+
+Python 3.4 or later is required.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import gc, json, logging, optparse, os, sys
+from collections import OrderedDict
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # Python 2
+
+from run_benchmarks import init, case_directory, default_cases
+
+
+def measure(filename, top=0):
+    "load filename while tracing; returns an OrderedDict with the results and the top allocating lines"
+    import application, common, depfile, wxglade
+    common.root = application.Application()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        if not wxglade._guiless_open_app(filename):
+            raise ValueError("could not load %s" % filename)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    widgets = list( depfile.iter_widgets(common.root) )
+    properties = set()
+    for obj in [common.root] + widgets:
+        properties.update( id(prop) for prop in obj.properties.values() )
+
+    stats = after.compare_to(before, "lineno")
+    total = sum(stat.size_diff for stat in stats)
+    in_properties = sum( stat.size_diff for stat in stats
+                         if os.path.basename(stat.traceback[0].filename)=="new_properties.py" )
+
+    ret = OrderedDict()
+    ret["widgets"] = len(widgets)
+    ret["properties"] = len(properties)
+    ret["allocated/kB"] = total / 1024.0
+    ret["peak/kB"] = peak / 1024.0
+    ret["properties/kB"] = in_properties / 1024.0
+    ret["bytes/property"] = in_properties / float(len(properties) or 1)
+    return ret, stats[:top]
+
+
+def parse_command_line():
+    parser = optparse.OptionParser(usage="%prog [options] [case file basenames or .wxg files]")
+    parser.add_option("--all", action="store_true", dest="all", help="run all .wxg files from tests/casefiles")
+    parser.add_option("--top", type="int", dest="top", default=0,
+                      help="print the source lines with the largest allocations (default: 0)")
+    parser.add_option("--json", metavar="FILE", dest="json", help="write all results as JSON")
+    return parser.parse_args()
+
+
+def main():
+    if tracemalloc is None:
+        print("Python 3.4 or later is required")
+        return 1
+    options, cases = parse_command_line()
+    if options.all:
+        cases = sorted( os.path.splitext(fn)[0] for fn in os.listdir(case_directory) if fn.endswith(".wxg") )
+    elif not cases:
+        cases = default_cases
+
+    init()
+    import config
+    logging.disable(logging.WARNING)  # the case files contain deliberately unsupported things
+
+    results = OrderedDict()
+    columns = ["widgets", "properties", "allocated/kB", "peak/kB", "properties/kB", "bytes/property"]
+    print( "%-28s" % "case" + "".join("%15s" % column for column in columns) )
+    for case in cases:
+        if case.endswith(".wxg"):
+            filename = case
+            case = os.path.splitext(os.path.basename(case))[0]
+        else:
+            filename = os.path.join(case_directory, case + ".wxg")
+        try:
+            values, top = measure(filename, options.top)
+        except Exception as inst:
+            if config.debugging: raise
+            print( "%s: failed: %s" % (case, inst) )
+            continue
+        results[case] = values
+        print( "%-28s" % case + "".join( ("%15d" if isinstance(values[column], int) else "%15.1f") % values[column]
+                                         for column in columns ) )
+        for stat in top:
+            print( "    %8.1f kB  %s" % (stat.size_diff/1024.0, stat.traceback[0]) )
+
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit( main() )
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+"""
+Benchmarks for loading, saving and code generation using the case files from tests/casefiles
+
+Each case file is loaded without GUI, saved again and code is generated for all five languages. Every step is
+repeated and the median and the standard deviation of the wall times are reported.
+
+Usage:
+  python benchmarks/run_benchmarks.py                            # run the default cases
+  python benchmarks/run_benchmarks.py ComplexExample Grid        # run selected cases
+  python benchmarks/run_benchmarks.py --all                      # run all .wxg files from tests/casefiles
+  python benchmarks/run_benchmarks.py big.wxg                    # run a file, e.g. from generate_project.py
+  python benchmarks/run_benchmarks.py --save-baseline base.json  # store the medians as baseline
+  python benchmarks/run_benchmarks.py --baseline base.json --threshold 0.2
+                                  # compare with baseline; exit code 1 if a median is more than 20% slower
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import gettext, json, logging, math, optparse, os, shutil, sys, tempfile, time
+from collections import OrderedDict
+
+# make the wxGlade modules importable
+wxglade_path = os.path.dirname( os.path.dirname(os.path.abspath(__file__)) )
+sys.path.insert(1, wxglade_path)
+
+t = gettext.translation(domain="wxglade", localedir="locale", fallback=True)
+t.install("wxglade")
+
+
+case_directory = os.path.join(wxglade_path, "tests", "casefiles")
+
+# a selection of case files with many different widgets, sizers and bases
+default_cases = ["AllWidgets_30", "Sizers_classattr", "ComplexExample", "ComplexExample_30", "BasesEtc",
+                 "MenuTest", "Notebook_w_tabs", "Grid"]
+
+languages = [("python", ".py"), ("perl", ".pl"), ("C++", ".cpp"), ("XRC", ".xrc"), ("lisp", ".lisp")]
+
+
+def init():
+    "initialise wxGlade in batch mode"
+    import common, config, log
+    common.init_paths(None)
+    log.init(filename=None, level="WARNING")  # console and string logger only
+    sys.path.insert(0, config.wxglade_path)
+    sys.path.insert(1, config.widgets_path)
+    import wxglade
+    wxglade.init_stage2(False)
+    config.preferences.write_timestamp = False
+    config.preferences.codegen_backup = False
+    config.preferences.wxg_backup = False
+    import application
+    common.root = application.Application()
+
+
+def median(values):
+    values = sorted(values)
+    n = len(values)
+    if n % 2: return values[n//2]
+    return (values[n//2-1] + values[n//2]) / 2.0
+
+
+def stdev(values):
+    if len(values) < 2: return 0.0
+    mean = sum(values) / float(len(values))
+    return math.sqrt( sum((v-mean)**2 for v in values) / (len(values)-1) )
+
+
+def run_case(filename, repeat, warmup, out_directory):
+    "load, save and generate repeat+warmup times; returns an OrderedDict phase -> list of durations"
+    import application, common, wxglade
+    basename = os.path.splitext(os.path.basename(filename))[0]
+    timings = OrderedDict()
+
+    def add(phase, start):
+        duration = time.time() - start
+        if n >= warmup:
+            timings.setdefault(phase, []).append(duration)
+
+    for n in range(warmup + repeat):
+        # start with an empty output directory, otherwise unchanged files would not be written again
+        if os.path.isdir(out_directory): shutil.rmtree(out_directory)
+        os.makedirs(out_directory)
+
+        common.root = application.Application()  # a fresh one; in batch mode there's no tree to clear
+        start = time.time()
+        if not wxglade._guiless_open_app(filename):
+            raise ValueError("could not load %s" % filename)
+        add("load", start)
+
+        start = time.time()
+        buffer = []
+        common.root.write(buffer)
+        common.save_file( os.path.join(out_directory, basename + ".wxg"), buffer, "wxg" )
+        add("save", start)
+
+        app = common.root
+        for language, extension in languages:
+            if language=="lisp" and app.for_version!="2.8":
+                app.properties["for_version"].set("2.8")  # Lisp supports wx 2.8 only
+            app.properties["language"].set(language)
+            if app.multiple_files:
+                out_path = os.path.join(out_directory, language)
+                os.makedirs(out_path)
+            else:
+                out_path = os.path.join(out_directory, basename + extension)
+            start = time.time()
+            app.generate_code(out_path=out_path)
+            add("generate %s" % language, start)
+
+    return timings
+
+
+def compare(results, baseline, threshold, min_delta):
+    "returns a list of (case, phase, baseline median, current median) for all regressions"
+    regressions = []
+    for case, phases in results.items():
+        for phase, values in phases.items():
+            base = baseline.get(case, {}).get(phase)
+            if base is None: continue
+            current = values["median"]
+            if current > base*(1.0+threshold) and current-base > min_delta:
+                regressions.append( (case, phase, base, current) )
+    return regressions
+
+
+def print_results(results, baseline=None):
+    print( "%-28s %-18s %10s %10s %10s %8s" % ("case", "phase", "median/ms", "stdev/ms", "base/ms", "change") )
+    for case, phases in results.items():
+        for phase, values in phases.items():
+            line = "%-28s %-18s %10.2f %10.2f" % (case, phase, values["median"]*1000, values["stdev"]*1000)
+            base = baseline and baseline.get(case, {}).get(phase)
+            if base:
+                line += " %10.2f %+7.1f%%" % (base*1000, (values["median"]/base - 1.0)*100)
+            print(line)
+
+
+def parse_command_line():
+    parser = optparse.OptionParser(usage="%prog [options] [case file basenames]")
+    parser.add_option("--all", action="store_true", dest="all", help="run all .wxg files from tests/casefiles")
+    parser.add_option("-n", "--repeat", type="int", dest="repeat", default=5,
+                      help="number of timed repetitions (default: 5)")
+    parser.add_option("--warmup", type="int", dest="warmup", default=1,
+                      help="number of untimed repetitions before (default: 1)")
+    parser.add_option("--save-baseline", metavar="FILE", dest="save_baseline",
+                      help="store the medians as JSON baseline")
+    parser.add_option("--baseline", metavar="FILE", dest="baseline", help="compare with JSON baseline")
+    parser.add_option("--threshold", type="float", dest="threshold", default=0.25,
+                      help="relative slow down that is reported as regression (default: 0.25)")
+    parser.add_option("--min-delta", type="float", dest="min_delta", default=0.002,
+                      help="ignore slow downs below this number of seconds (default: 0.002)")
+    parser.add_option("--json", metavar="FILE", dest="json", help="write all results as JSON")
+    return parser.parse_args()
+
+
+def main():
+    options, cases = parse_command_line()
+    if options.all:
+        cases = sorted( os.path.splitext(fn)[0] for fn in os.listdir(case_directory) if fn.endswith(".wxg") )
+    elif not cases:
+        cases = default_cases
+
+    init()
+    import config
+    logging.disable(logging.WARNING)  # the case files contain deliberately unsupported things
+
+    out_directory = tempfile.mkdtemp(prefix="wxglade_benchmarks_")
+    results = OrderedDict()
+    try:
+        for case in cases:
+            if case.endswith(".wxg"):
+                filename = case
+                case = os.path.splitext(os.path.basename(case))[0]
+            else:
+                filename = os.path.join(case_directory, case + ".wxg")
+            try:
+                timings = run_case(filename, options.repeat, options.warmup, os.path.join(out_directory, case))
+            except Exception as inst:
+                if config.debugging: raise
+                print( "%s: failed: %s" % (case, inst) )
+                continue
+            results[case] = OrderedDict( (phase, {"median":median(values), "stdev":stdev(values)})
+                                         for phase, values in timings.items() )
+    finally:
+        shutil.rmtree(out_directory, ignore_errors=True)
+
+    baseline = None
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    print_results(results, baseline)
+
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if options.save_baseline:
+        data = {"python": sys.version.split()[0], "repeat": options.repeat,
+                "results": OrderedDict( (case, OrderedDict((phase, values["median"]) for phase, values in phases.items()))
+                                        for case, phases in results.items() ) }
+        with open(options.save_baseline, "w") as f:
+            json.dump(data, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, options.threshold, options.min_delta)
+        for case, phase, base, current in regressions:
+            print( "REGRESSION %s / %s: %.2fms -> %.2fms" % (case, phase, base*1000, current*1000) )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit( main() )
@@ -358,6 +358,42 @@ def _paste(parent, pos, clipboard_data):
         wx.EndBusyCursor()
 
 
+def _paste_multiple(parent, positions, clipboard_data):
+    """Insert a copy of the clipboard data at each of the positions of the sizer parent.
+    The XML is parsed only once and the recorded events are replayed for each copy; the name allocation state is
+    shared between the copies and the tree is re-built only once at the end."""
+    option, span, flag, border, xml_unicode = clipboard2widget( clipboard_data )
+    if not xml_unicode or not positions: return False
+    import xml_parse
+    try:
+        wx.BeginBusyCursor()
+        recorder = xml_parse.XmlEventRecorder()
+        recorder.parse_string( xml_unicode.encode('utf8') )
+        have_names = set(parent.toplevel_parent.names)
+        name_counters = {}
+        object_counter = 0
+        top_obj = None
+        with parent.frozen():
+            for pos in positions:
+                parser = xml_parse.ClipboardXmlWidgetBuilder(parent, pos, option, span, flag, border,
+                                                             have_names, name_counters)
+                recorder.replay(parser)
+                object_counter += parser._object_counter
+                top_obj = top_obj or parser.top_obj
+            if hasattr(parent, "on_child_pasted"):
+                parent.on_child_pasted()
+            if parent.widget: parent.layout()
+        freeze = object_counter>80  # for more objects, we freeze the Tree during re-build
+        misc.rebuild_tree( parent, freeze=freeze, focus=False )
+        misc.set_focused_widget(top_obj)
+        return True
+    except xml_parse.XmlParsingError:
+        if config.debugging: raise
+        return False
+    finally:
+        wx.EndBusyCursor()
+
+
 def check(*formats):
     "check whether wxglade formats are on the clipboard"
     if not wx.TheClipboard.IsOpened():
@@ -6,9 +6,9 @@
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import copy, logging, os, os.path, random, re, sys, time
+import copy, json, logging, os, os.path, random, re, sys, time
 
-import common, config, compat, misc
+import common, config, compat, misc, plugins, stats
 import wcodegen
 from collections import OrderedDict
 
@@ -139,6 +139,12 @@ class ClassLines(object):
         # XXX refactor init and final into init_code, final_code?
         self.init = []            # Lines of code to insert in the __init__ method (for children widgets)
         self.final = []  # to be inserted after children, e.g. Add or AddPage for sizers / notebooks
+        # notebook pages with content to be created on first selection; see BaseLangCodeWriter._is_lazy_page()
+        self.lazy_pages = []      # list of (page, init lines, final lines, (first, last) index into event_handlers)
+        self.methods = []         # list of (name, arguments, body lines); see generate_code_methods()
+        # fonts, colours and bitmaps shared by the constructor code; see BaseLangCodeWriter._get_shared_resource()
+        self.shared_resources = OrderedDict()  # expression -> (kind, index of the placeholder)
+        self.choices_file = False  # True if the constructor loads the choices file; see get_choices_from_file()
 
 
 class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
@@ -261,6 +267,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
     tmpl_empty_string = '""'       # Template for an empty string.
 
     tmpl_func_event_stub = ''      # Statement for a event handler stub -> see generate_code_event_handler()_
+    tmpl_func_method = ''          # Statement for an additional method -> see generate_code_methods()
 
     # Template of the "generated by ..." message ;see create_generated_by(); save_file()
     tmpl_generated_by = "%(comment_sign)s %(generated_by)s\n%(comment_sign)s\n"
@@ -275,6 +282,13 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
     tmpl_toplevel_style = ''      # same for a toplevel object
     tmpl_style0 = ''              # same for style == 0
     tmpl_toplevel_style0 = ''     # same for style == 0
+    tmpl_shared_resource = ''     # Template to define a local variable for a shared font, colour or bitmap
+    shared_resource_prefix = '_'  # Prefix of these variables; see _get_shared_resource()
+    tmpl_embedded_image = ''      # Template to get a bitmap from the generated images module; see get_embedded_image()
+    tmpl_import_images = ''       # Template for the dependency on the images module
+    tmpl_choices_from_file = ''   # Template to get a choice list from the choices file; see get_choices_from_file()
+    tmpl_load_choices = ''        # Template to load the choices file in the constructor
+    tmpl_import_choices = ''      # Template for the dependencies of tmpl_load_choices
 
     # templates used by add_app():
     tmpl_appfile = None           # file header for standalone files with application start code
@@ -284,11 +298,12 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
     tmpl_gettext_simple = None    # simplified application start code with gettext support
 
     _show_warnings = True  # Enable or disable printing of warning messages; see self.warning()
+    progress = None  # callable(name, index, count), called before each toplevel; see Application.generate_code()
 
     def __init__(self):
         "Initialise only instance variables using there defaults"
         wcodegen.BaseCodeWriter.__init__(self)
-        self.obj_builders = {}
+        self.obj_builders = plugins.LazyDict()
         self.obj_properties = {}
         self._property_writers = {}
         self._init_vars()
@@ -302,6 +317,8 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         self.app_name = None
         self.classes = OrderedDict()
         self.curr_tab = 0
+        self.embedded_images = OrderedDict()  # absolute file name -> name in the images module
+        self.choices_data = OrderedDict()  # key -> choice list stored in the choices file
         self.dependencies = set()
         self.for_version = config.for_version
         self.header_lines = []
@@ -310,6 +327,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         self.is_template = 0
         self.lang_mapping = {}
         self.multiple_files = False
+        self.table_threshold = None  # see use_table()
 
         # this is to be more sure to replace the right tags
         self.nonce = self.create_nonce()
@@ -324,6 +342,10 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         self._mark_blocks = True # YYY config.mark_blocks
         self._textdomain = 'app'
         self._use_gettext = config.default_use_gettext
+        self._share_resources = False
+        self._embed_images = False
+        self._choices_file = False
+        self._current_klass = None  # ClassLines instance the code is generated for; see _get_shared_resource()
 
     def new_project(self, app, out_path=None, preview=False):
         "Initialise generic and language independent code generator settings; see init_lang(), init_files()"
@@ -358,11 +380,21 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             self._overwrite = True
             self._mark_blocks = False
             self._use_gettext = False
+            self._share_resources = False
+            self._embed_images = False
+            self._choices_file = False
         else:
             self.multiple_files = app.multiple_files
             self._overwrite = app.overwrite
             self._mark_blocks = True if self._overwrite else app.mark_blocks
             self._use_gettext = app.use_gettext
+            self._share_resources = app.share_resources
+            self._embed_images = app.embed_images and bool(self.tmpl_embedded_image)
+            self._choices_file = app.choices_file and bool(self.tmpl_choices_from_file)
+        if app.properties["table_threshold"].is_active():
+            self.table_threshold = app.table_threshold
+        else:
+            self._choices_file = False
 
         if not preview:
             self.for_version = tuple([int(t) for t in app.for_version.split('.')[:2]])
@@ -376,6 +408,10 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             self.out_dir = out_path or config.default_output_file
         self.out_dir = os.path.normpath( os.path.expanduser(self.out_dir.strip()) )
         self.preview = preview
+        if self._embed_images:
+            self._collect_embedded_images(app)
+        if self._choices_file:
+            self._collect_choices(app)
 
         # any of the following could return an error as string
         return self.init_lang(app) or self.check_values() or self.init_files(self.out_dir)
@@ -457,6 +493,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         # recursively generate code, for anything except application.Application
         # for toplevel widgets or with class different from wx... a class will be added
 
+        self._current_klass = parent_klass
         if obj.IS_SLOT or obj.classname=="spacer":
             if obj.classname!="slot":  # "slot" has no code generator
                 self.add_object(parent_klass, parent, parent_builder, obj)
@@ -466,23 +503,51 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         # first the item
         klass = IS_CLASS and self.add_class(obj) or None
         if not obj.IS_TOPLEVEL:
+            self._current_klass = parent_klass
             builder = self.add_object(parent_klass, parent, parent_builder, obj)
         else:
             builder = None
 
         # then the children
+        lazy_page = not IS_CLASS and self._is_lazy_page(parent, parent_builder, obj)
+        if lazy_page:
+            n_init, n_final = len(parent_klass.init), len(parent_klass.final)
+            n_handlers = len(parent_klass.event_handlers)
         for child in obj.get_all_children():
             self._generate_code(klass or parent_klass, obj, builder, child)
 
+        if lazy_page:
+            # move the code for the page content from the constructor to the notebook; see get_lazy_pages_code()
+            n_final = len(parent_klass.final) - n_final
+            parent_klass.lazy_pages.append( (obj, parent_klass.init[n_init:], parent_klass.final[:n_final],
+                                             (n_handlers, len(parent_klass.event_handlers))) )
+            del parent_klass.init[n_init:]
+            del parent_klass.final[:n_final]
+
+        lines = klass or parent_klass
+        if lines is not None and lines.lazy_pages and hasattr(builder, "get_lazy_pages_code"):
+            pages = [page for page in lines.lazy_pages if page[0].parent is obj]
+            if pages:
+                lines.init.extend( builder.get_lazy_pages_code(obj, pages, lines) )
+                lines.lazy_pages = [page for page in lines.lazy_pages if page[0].parent is not obj]
+
         if IS_CLASS:
             self.finalize_class(obj)
 
+    def _is_lazy_page(self, parent, parent_builder, obj):
+        """True if the content of the notebook page obj is to be created when the page is selected the first time;
+        the notebook writer decides, see e.g. PythonNotebookGenerator.is_lazy_page()"""
+        if parent is None or not hasattr(parent_builder, "is_lazy_page"): return False
+        return parent_builder.is_lazy_page(parent, obj)
+
     def generate_code(self, root, widget=None):
         "entry point for recursive code generation via _generate_code()"
         # root must be application.Application instance for now
-        for c in root.children or []:
+        for i, c in enumerate(root.children or []):
             if widget is not None and c is not widget: continue # for preview
-            self._generate_code(None, None, None, c)
+            if self.progress: self.progress(c.name, i, len(root.children))
+            with stats.timer("generate %s"%c.name):
+                self._generate_code(None, None, None, c)
         if not root.IS_ROOT: return
         topwin = [c for c in root.children if c.name==root.top_window]
         topwin = topwin and topwin[0] or root.children and root.children[0] or None
@@ -490,6 +555,8 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
     def finalize(self):
         "Code generator finalization function"
+        self._write_images_module()
+        self._write_choices_file()
         if self.previous_source:
             # insert all the new custom classes inside the old file
             if self.previous_source.new_classes:
@@ -688,6 +755,9 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
         # end of ctor generation
 
+        # generate code for additional methods, e.g. to create notebook pages
+        method_lines = self.generate_code_methods( code_obj, is_new, tab, prev_src )
+
         # replace code inside existing constructor block
         if prev_src and not is_new:
             # replace the lines inside the ctor wxGlade block with the new ones
@@ -699,7 +769,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             obuffer = []
 
         # generate code for event handler stubs
-        code_lines = self.generate_code_event_handler( code_obj, is_new, tab, prev_src, event_handlers )
+        code_lines = method_lines + self.generate_code_event_handler( code_obj, is_new, tab, prev_src, event_handlers )
 
         # replace code inside existing event handlers
         if prev_src and not is_new:
@@ -886,6 +956,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
         objname = self.format_generic_access(obj)
         color = self._get_colour(obj.background)
+        if obj.background!='wxNullColour': color = self._get_shared_resource('colour', color)
         stmt = tmpl % { 'objname':objname, 'value':color }
         return stmt
 
@@ -897,6 +968,27 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         "Generate code to bind events for 'code_obj'; event_handlers is a list of event handlers (str,str,str)"
         return []
 
+    def generate_code_methods(self, code_obj, is_new, tab, prev_src):
+        """Generate the additional methods of the class, e.g. to create notebook pages on selection;
+        see ClassLines.methods and tmpl_func_method.
+        If the class exists already in prev_src, the methods found there are replaced and only the new ones returned."""
+        klass = self.classes[code_obj]
+        choices_reference = self.tmpl_choices_from_file.split("%")[0]
+        code_lines = []
+        for name, args, body in klass.methods:
+            # the local variables of the constructor are not available
+            body = body[:]
+            body[0:0] = self.generate_code_shared_resources(klass, body)
+            if klass.choices_file and any(choices_reference in line for line in body):
+                body[0:0] = self.generate_code_load_choices(klass)
+            lines = self._generate_function(code_obj, False, tab, name, None, body)
+            if prev_src and not is_new:
+                tag = '<%swxGlade replace %s %s>' % (self.nonce, code_obj.klass, name)
+                if prev_src.replace(tag, lines): continue
+            code_lines.append( self.tmpl_func_method % {'tab':self.tabs(1), 'klass':self.cn_class(code_obj.klass),
+                                                        'name':name, 'args':args, 'content':"".join(lines)} )
+        return code_lines
+
     def generate_code_event_handler(self, code_obj, is_new, tab, prev_src, event_handlers):
         """Generate the event handler stubs for 'code_obj'
 
@@ -965,8 +1057,12 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
             weight = weight.replace('wxFONTWEIGHT_', 'wx')
 
         face = '"%s"' % face.replace('"', r'\"')
-        stmt = tmpl % { 'objname':objname, 'cnfont':cnfont, 'face':face, 'family':self.cn(family), 'size':size,
-                        'style':self.cn(style), 'underlined': underlined, 'weight':self.cn(weight) }
+        values = { 'objname':objname, 'cnfont':cnfont, 'face':face, 'family':self.cn(family), 'size':size,
+                   'style':self.cn(style), 'underlined': underlined, 'weight':self.cn(weight) }
+        tmpl_font = self._get_code_statement('font')
+        if tmpl_font:
+            values['font'] = self._get_shared_resource('font', tmpl_font % values)
+        stmt = tmpl % values
         return stmt
 
     def generate_code_foreground(self, obj):
@@ -980,6 +1076,7 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
 
         objname = self.format_generic_access(obj)
         color = self._get_colour(obj.foreground)
+        if obj.foreground!='wxNullColour': color = self._get_shared_resource('colour', color)
         stmt = tmpl % { 'objname':objname, 'value':color }
         return stmt
 
@@ -1019,6 +1116,157 @@ class BaseLangCodeWriter(wcodegen.BaseCodeWriter):
         out = [l for l in out if l is not None]
         return out
 
+    def _get_shared_resource(self, kind, value):
+        """Returns a placeholder for the font, colour or bitmap created by the expression value;
+        if resources are not shared (application property 'share_resources'), value is returned unchanged.
+
+        Identical expressions within a class share the placeholder. After the constructor code has been generated,
+        generate_code_shared_resources() replaces it with a local variable or, if used only once, with the expression.
+
+        kind: 'font', 'colour' or 'bitmap'"""
+        klass = self._current_klass
+        if not self._share_resources or klass is None or not self.tmpl_shared_resource:
+            return value
+        if value not in klass.shared_resources:
+            klass.shared_resources[value] = (kind, len(klass.shared_resources))
+        return '<%swxGlade shared %d>' % (self.nonce, klass.shared_resources[value][1])
+
+    def generate_code_shared_resources(self, klass, code_lines):
+        """Replaces the placeholders of _get_shared_resource() in the constructor code lines of klass (ClassLines
+        instance); returns the code lines defining the local variables for the resources used more than once"""
+        if not klass.shared_resources: return []
+        placeholder_re = re.compile( r'<%swxGlade shared (\d+)>' % self.nonce )
+        counts = {}
+        for line in code_lines:
+            for index in placeholder_re.findall(line):
+                counts[int(index)] = counts.get(int(index), 0) + 1
+
+        types = {'font':'wxFont', 'colour':'wxColour', 'bitmap':'wxBitmap'}
+        ret = []
+        replacements = {}  # index -> variable name or expression
+        numbers = {}       # kind -> number of variables
+        for value, (kind, index) in klass.shared_resources.items():
+            if counts.get(index, 0)<2:
+                replacements[index] = value
+                continue
+            numbers[kind] = numbers.get(kind, 0) + 1
+            name = "%s%s_%d"%(self.shared_resource_prefix, kind, numbers[kind])
+            ret.append( self.tmpl_shared_resource % {'name':name, 'type':self.cn(types[kind]), 'value':value} )
+            replacements[index] = name
+
+        for i, line in enumerate(code_lines):
+            if self.nonce in line:
+                code_lines[i] = placeholder_re.sub(lambda match: replacements[int(match.group(1))], line)
+        return ret
+
+    def _collect_embedded_images(self, app):
+        # collect the existing image files of the whole project, such that the images module is complete also if the
+        # code is generated for a single toplevel window
+        import depfile
+        for value in depfile.iter_bitmaps(app):
+            filename = misc.get_absolute_path(value)
+            if filename in self.embedded_images: continue
+            if not os.path.isfile(filename):
+                self.warning( _('Bitmap file "%s" not found; it will be loaded at runtime') % filename )
+                continue
+            self.embedded_images[filename] = value
+
+    def _get_output_basename(self):
+        # the base name for additional generated files; it's derived from the application or output file name
+        if self.multiple_files:
+            name = self.app_name or "app"
+        else:
+            name = os.path.splitext( os.path.basename(self.out_dir) )[0]
+        return re.sub(r'\W', '_', name)
+
+    def _get_images_module(self):
+        "Returns the name of the generated images module; it's derived from the application or output file name"
+        return self._get_output_basename() + "_images"
+
+    def _quote_name(self, name):
+        return '"%s"' % name.replace('\\', '\\\\').replace('"', '\\"')
+
+    def get_embedded_image(self, bitmap):
+        """Returns a code fragment to get the bitmap for the file name bitmap from the generated images module;
+        returns None if images are not embedded (application property 'embed_images') or if the file does not exist"""
+        if not self._embed_images: return None
+        name = self.embedded_images.get( misc.get_absolute_path(bitmap) )
+        if name is None: return None
+        module = self._get_images_module()
+        if self._current_klass is not None:
+            self._current_klass.dependencies.add( self.tmpl_import_images % {'module':module} )
+        return self.tmpl_embedded_image % {'module':module, 'name':self._quote_name(name)}
+
+    def _get_embedded_image_data(self):
+        """Returns a list of the file contents and a list of (name, index into the contents) for the embedded images;
+        files with identical content are stored once"""
+        data = []
+        images = []
+        for filename, name in self.embedded_images.items():
+            with open(filename, "rb") as f:
+                content = f.read()
+            if content not in data: data.append(content)
+            images.append( (name, data.index(content)) )
+        return data, images
+
+    def generate_images_module(self, data, images):
+        """Returns the code of the images module as list of (file extension, code lines); see get_embedded_image()
+        data: list of file contents; images: list of (name, index into data)"""
+        raise NotImplementedError
+
+    def _write_images_module(self):
+        if not self._embed_images or not self.embedded_images: return
+        directory = self.out_dir  if self.multiple_files else  os.path.dirname(self.out_dir)
+        module = self._get_images_module()
+        data, images = self._get_embedded_image_data()
+        for extension, lines in self.generate_images_module(data, images):
+            self.save_file( os.path.join(directory, "%s.%s"%(module, extension)), lines )
+
+    def use_table(self, count):
+        """Returns True if count entries, e.g. grid columns, are to be set from a data table in a loop instead of one
+        statement each; see application property 'table_threshold'"""
+        return self.table_threshold is not None and count >= self.table_threshold
+
+    def _get_choices_key(self, obj):
+        # the names are unique within a toplevel window
+        return "%s.%s" % (obj.toplevel_parent.name, obj.name)
+
+    def _collect_choices(self, app):
+        # collect the large choice lists of the whole project, such that the choices file is complete also if the
+        # code is generated for a single toplevel window
+        import depfile
+        for obj in depfile.iter_widgets(app):
+            choices_p = obj.properties.get("choices")
+            if choices_p is None or not self.use_table( len(choices_p.value) ): continue
+            self.choices_data[self._get_choices_key(obj)] = [c[0] for c in choices_p.value]
+
+    def _get_choices_file(self):
+        return self._get_output_basename() + "_choices.json"
+
+    def get_choices_from_file(self, obj):
+        """Returns a code fragment to get the choices of obj from the choices file;
+        returns None if the choice list is to be written to the source file"""
+        if not self._choices_file: return None
+        key = self._get_choices_key(obj)
+        if key not in self.choices_data: return None
+        if self._current_klass is not None:
+            self._current_klass.choices_file = True
+            self._current_klass.dependencies.add( self.tmpl_import_choices )
+        return self.tmpl_choices_from_file % {'key':self._quote_name(key)}
+
+    def generate_code_load_choices(self, klass):
+        "Returns the code lines to load the choices file at the beginning of the constructor of klass (ClassLines)"
+        if not klass.choices_file: return []
+        filename = self._quote_name( self._get_choices_file() )
+        return (self.tmpl_load_choices % {'filename':filename, 'tab':self.tabs(1)}).splitlines(True)
+
+    def _write_choices_file(self):
+        if not self._choices_file or not self.choices_data: return
+        directory = self.out_dir  if self.multiple_files else  os.path.dirname(self.out_dir)
+        content = json.dumps(self.choices_data, indent=1, separators=(',', ': ')) + "\n"
+        self.save_file( os.path.join(directory, self._get_choices_file()), content.splitlines(True),
+                        content_only=True )
+
     def quote_str(self, s):
         """Returns a quoted / escaped version of 's', suitable to insert in a source file as a string object.
         Takes care also of gettext support.
@@ -16,6 +16,34 @@ import config
 import wcodegen
 
 
+# for application property 'minimal_includes': classes that a generated header may declare by a forward declaration;
+# the classes in _CLASS_HEADERS are not listed here, as their headers are included
+_FORWARD_DECLARED = set( ['wxBitmapButton', 'wxButton', 'wxCheckBox', 'wxCheckListBox', 'wxChoice', 'wxComboBox',
+                          'wxGauge', 'wxListBox', 'wxMenu', 'wxMenuItem', 'wxRadioBox', 'wxRadioButton', 'wxSlider',
+                          'wxStaticBitmap', 'wxStaticBox', 'wxStaticText', 'wxTextCtrl',
+                          'wxBoxSizer', 'wxFlexGridSizer', 'wxGridBagSizer', 'wxGridSizer', 'wxStaticBoxSizer',
+                          'wxStdDialogButtonSizer', 'wxWrapSizer'] )
+
+# event types that are declared by <wx/event.h>, which is included by the headers of all windows
+_CORE_EVENTS = set( ['wxCloseEvent', 'wxCommandEvent', 'wxInitDialogEvent', 'wxNavigationKeyEvent',
+                     'wxScrollEvent'] )
+
+# headers for the base classes and the other classes that can't be forward declared,
+# e.g. because they are typedefs or macros in some wx versions or ports
+_CLASS_HEADERS = { 'wxDialog': '<wx/dialog.h>', 'wxFrame': '<wx/frame.h>', 'wxMDIChildFrame': '<wx/mdi.h>',
+                   'wxMenuBar': '<wx/menu.h>', 'wxNotebook': '<wx/notebook.h>', 'wxPanel': '<wx/panel.h>',
+                   'wxScrolledWindow': '<wx/scrolwin.h>', 'wxSearchCtrl': '<wx/srchctrl.h>',
+                   'wxSplitterWindow': '<wx/splitter.h>', 'wxStatusBar': '<wx/statusbr.h>',
+                   'wxToolBar': '<wx/toolbar.h>',
+                   'wxBookCtrlEvent': '<wx/bookctrl.h>', 'wxCalendarEvent': '<wx/calctrl.h>',
+                   'wxDateEvent': '<wx/dateevt.h>', 'wxGridEditorCreatedEvent': '<wx/grid.h>',
+                   'wxGridEvent': '<wx/grid.h>', 'wxGridRangeSelectEvent': '<wx/grid.h>',
+                   'wxGridSizeEvent': '<wx/grid.h>', 'wxHyperlinkEvent': '<wx/hyperlink.h>',
+                   'wxListEvent': '<wx/listctrl.h>', 'wxNotebookEvent': '<wx/notebook.h>',
+                   'wxPropertyGridEvent': '<wx/propgrid/propgrid.h>', 'wxSpinEvent': '<wx/spinbutt.h>',
+                   'wxSplitterEvent': '<wx/splitter.h>', 'wxTreeEvent': '<wx/treectrl.h>' }
+
+
 class SourceFileContent(BaseSourceFileContent):
     """Keeps info about an existing file that has to be updated, to replace only the lines inside a wxGlade block,
     and to keep the rest of the file as it was.
@@ -255,10 +283,10 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
         'disabled':         "%(objname)sEnable(0);\n",
         'extraproperties':  "%(objname)sSet%(propname_cap)s(%(value)s);\n",
         'focused':          "%(objname)sSetFocus();\n",
+        'font':             "wxFont(%(size)s, %(family)s, %(style)s, %(weight)s, %(underlined)s, wxT(%(face)s))",
         'foregroundcolour': "%(objname)sSetForegroundColour(%(value)s);\n",
         'hidden':           "%(objname)sHide();\n",
-        'setfont':          "%(objname)sSetFont(wxFont(%(size)s, %(family)s, "
-                            "%(style)s, %(weight)s, %(underlined)s, wxT(%(face)s)));\n",
+        'setfont':          "%(objname)sSetFont(%(font)s);\n",
         'tooltip':          "%(objname)sSetToolTip(%(tooltip)s);\n",
         'wxcolour':         "wxColour(%(value)s)",
         'wxnullcolour':     "wxNullColour",
@@ -279,14 +307,21 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
     output_header = None  # Temporary storage of header file for writing into (list)
     output_file   = None  # Temporary storage of source file for writing into (list)
 
+    _minimal_includes = False    # see application property 'minimal_includes'
+    _precompiled_header = False  # see application property 'precompiled_header'
+
     shebang = '// -*- C++ -*-\n//\n'
     tmpl_cfunc_end = '}\n\n'
+    tmpl_func_method = '\nvoid %(klass)s::%(name)s(%(args)s)\n{\n%(content)s}\n\n'
 
     tmpl_sizeritem = '%s->Add(%s, %s, %s, %s);\n'
     tmpl_sizeritem_button = '%s->AddButton(%s)\n'
     tmpl_gridbagsizeritem = '%s->Add(%s, wxGBPosition%s, wxGBSpan%s, %s, %s);\n'
     tmpl_gridbagsizerspacer = '%s->Add(%s, %s, wxGBPosition%s, wxGBSpan%s, %s, %s);\n'
     tmpl_spacersize = '%s, %s'
+    tmpl_shared_resource = '%(type)s %(name)s = %(value)s;\n'
+    tmpl_embedded_image = '%(module)s::GetBitmap(%(name)s)'
+    tmpl_import_images = '%(module)s'  # see _format_dependencies()
 
     tmpl_appfile = """\
 %(overwrite)s\
@@ -374,6 +409,12 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
         self._current_extra_code_h = []
         self._current_extra_code_cpp = []
 
+        # application properties 'minimal_includes' and 'precompiled_header'; for separate files only
+        self._minimal_includes = bool(app is not None and self.multiple_files and app.minimal_includes)
+        self._precompiled_header = self._minimal_includes and app.precompiled_header
+        if self._precompiled_header:
+            self._precompiled_headers = self._get_project_headers(app)
+
     def init_files(self, out_path):
         if self.multiple_files:
             self.previous_source = None
@@ -423,6 +464,9 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
         _replace_tag(self.output_header, tag, content)
 
     def finalize(self):
+        self._write_images_module()
+        if self._precompiled_header:
+            self._write_precompiled_header()
         if self.previous_source:
             # insert all the new custom classes inside the old file
             tag = '<%swxGlade insert new_classes>' % self.nonce
@@ -502,6 +546,8 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
     def add_app(self, app_attrs, top_win):
         # add language specific mappings
         self.lang_mapping['filename_top_win_class'] = '%s.%s' % (top_win.klass, self.header_extension)
+        if self._precompiled_header:
+            self.lang_mapping['header_lines'] = self._get_precompiled_header_include()
         BaseLangCodeWriter.add_app(self, app_attrs, top_win)
 
     def add_class(self, code_obj):
@@ -595,6 +641,82 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
         hwrite = header_buffer.append
         swrite = source_buffer.append
 
+        # source file; the constructor code is generated first, as it may add attributes to the class
+        tab = self.tabs(1)
+        # set the window's style
+        style_p = code_obj.properties.get("style")
+        if style_p and style_p.value_set != style_p.default_value:
+            style = mycn_f(style_p.get_string_value())
+            if style:
+                sign_inst = sign_inst.replace('style', '%s' % style)
+
+        # constructor
+        if is_new:
+            base_init = "%s(%s)" % (base, sign_inst)
+            if custom_base:
+                bases = [b.strip() for b in custom_base.split(',')]
+                if bases:
+                    base_init = "%s(%s)" % (bases[0], sign_inst)
+                    rest = ", ".join([b + "()" for b in bases[1:]])
+                    if rest:
+                        base_init += ", " + rest
+
+            swrite('\n%s::%s(%s):\n%s%s\n{\n' % (fmt_klass, fmt_klass, sign_decl2, tab, base_init) )
+
+        if self._mark_blocks:
+            swrite(tab + '// begin wxGlade: %s::%s\n' % (fmt_klass, fmt_klass))
+
+        # the optional initial code from the code properties
+        if not self.preview and code_obj.check_prop("extracode_pre"):
+            for l in code_obj.properties["extracode_pre"].get_lines():
+                swrite(tab + l)
+        shared_resources_pos = len(source_buffer)
+        self._current_klass = klass
+
+        # set size here to avoid problems with splitter windows
+        if 'size' in code_obj.properties and code_obj.properties["size"].is_active():
+            swrite( tab + self.generate_code_size(code_obj) )
+
+        for l in builder.get_properties_code(code_obj):
+            swrite(tab + l)
+
+        for l in klass.init:
+            swrite(tab + l)
+
+        if klass.final:
+            swrite(tab + "\n")
+            for l in klass.final:
+                swrite(tab + l)
+
+        for l in builder.get_layout_code(code_obj):
+            swrite(tab + l)
+
+        # the optional final code from the code properties
+        if not self.preview and code_obj.check_prop("extracode_post"):
+            for l in code_obj.properties["extracode_post"].get_lines():
+                swrite(tab + l)
+
+        # now check if there are extra lines to add to the constructor
+        for l in builder.get_init_code(code_obj):
+            swrite(tab + l)
+
+        # the fonts, colours and bitmaps used by the code above
+        source_buffer[shared_resources_pos:shared_resources_pos] = \
+            [tab + l for l in self.generate_code_shared_resources(klass, source_buffer)]
+
+        swrite( self.tmpl_ctor_call_layout % {'tab':tab} )
+
+        if self._mark_blocks:
+            # end tag
+            swrite('%s%s end wxGlade\n' % (tab, self.comment_sign))
+
+        # write class function end statement
+        if self.tmpl_cfunc_end and is_new:
+            swrite( self.tmpl_cfunc_end % {'tab':tab} )
+
+        # generate code for additional methods, e.g. to create notebook pages
+        method_lines = self.generate_code_methods( code_obj, is_new, tab, prev_src )
+
         # generate constructor code
         if is_new:
             pass
@@ -635,6 +757,8 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
             hwrite(self.tabs(1) + '// begin wxGlade: %s::attributes\n' % fmt_klass)
             for o_type, o_name in klass.sub_objs:
                 hwrite(self.tabs(1) + '%s* %s;\n' % (o_type, o_name))
+            for name, args, body in klass.methods:
+                hwrite(self.tabs(1) + 'void %s(%s);\n' % (name, args))
             hwrite(self.tabs(1) + '// end wxGlade\n')
 
             if event_handlers:
@@ -680,6 +804,9 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
                 hwrite(self.tabs(1) + '// begin wxGlade: %s::attributes\n' % fmt_klass)
             for o_type, o_name in klass.sub_objs:
                 hwrite(self.tabs(1) + '%s* %s;\n' % (o_type, o_name))
+            # the declarations of the additional methods are updated together with the attributes
+            for name, args, body in klass.methods:
+                hwrite(self.tabs(1) + 'void %s(%s);\n' % (name, args))
             if self._mark_blocks:
                 hwrite(self.tabs(1) + '// end wxGlade\n')
             tag = '<%swxGlade replace %s attributes>' % (self.nonce, classname)
@@ -705,73 +832,6 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
                 # no attributes tag found, issue a warning and do nothing
                 self.warning( "wxGlade events block not found for %s, event table code NOT generated" % code_obj.name )
 
-        # source file
-        tab = self.tabs(1)
-        # set the window's style
-        style_p = code_obj.properties.get("style")
-        if style_p and style_p.value_set != style_p.default_value:
-            style = mycn_f(style_p.get_string_value())
-            if style:
-                sign_inst = sign_inst.replace('style', '%s' % style)
-
-        # constructor
-        if is_new:
-            base = "%s(%s)" % (base, sign_inst)
-            if custom_base:
-                bases = [b.strip() for b in custom_base.split(',')]
-                if bases:
-                    base = "%s(%s)" % (bases[0], sign_inst)
-                    rest = ", ".join([b + "()" for b in bases[1:]])
-                    if rest:
-                        base += ", " + rest
-
-            swrite('\n%s::%s(%s):\n%s%s\n{\n' % (fmt_klass, fmt_klass, sign_decl2, tab, base) )
-
-        if self._mark_blocks:
-            swrite(tab + '// begin wxGlade: %s::%s\n' % (fmt_klass, fmt_klass))
-
-        # the optional initial code from the code properties
-        if not self.preview and code_obj.check_prop("extracode_pre"):
-            for l in code_obj.properties["extracode_pre"].get_lines():
-                swrite(tab + l)
-
-        # set size here to avoid problems with splitter windows
-        if 'size' in code_obj.properties and code_obj.properties["size"].is_active():
-            swrite( tab + self.generate_code_size(code_obj) )
-
-        for l in builder.get_properties_code(code_obj):
-            swrite(tab + l)
-
-        for l in klass.init:
-            swrite(tab + l)
-
-        if klass.final:
-            swrite(tab + "\n")
-            for l in klass.final:
-                swrite(tab + l)
-
-        for l in builder.get_layout_code(code_obj):
-            swrite(tab + l)
-
-        # the optional final code from the code properties
-        if not self.preview and code_obj.check_prop("extracode_post"):
-            for l in code_obj.properties["extracode_post"].get_lines():
-                swrite(tab + l)
-
-        # now check if there are extra lines to add to the constructor
-        for l in builder.get_init_code(code_obj):
-            swrite(tab + l)
-
-        swrite( self.tmpl_ctor_call_layout % {'tab':tab} )
-
-        if self._mark_blocks:
-            # end tag
-            swrite('%s%s end wxGlade\n' % (tab, self.comment_sign))
-
-        # write class function end statement
-        if self.tmpl_cfunc_end and is_new:
-            swrite( self.tmpl_cfunc_end % {'tab':tab} )
-
         # replace code inside existing constructor block
         if prev_src and not is_new:
             # replace the lines inside the ctor wxGlade block
@@ -795,7 +855,7 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
             source_buffer.extend(code_lines)
 
         # generate code for event handler stubs
-        code_lines = self.generate_code_event_handler( code_obj, is_new, tab, prev_src, event_handlers )
+        code_lines = method_lines + self.generate_code_event_handler( code_obj, is_new, tab, prev_src, event_handlers )
 
         # replace code inside existing event handlers
         if prev_src and not is_new:
@@ -824,8 +884,14 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
                 # WARNING: there's a double space '  ' between 'replace' and 'dependencies' in the tag below,
                 # because there is no class name (see SourceFileContent, line ~147)
                 tag = '<%swxGlade replace  dependencies>' % self.nonce
-                code = self._format_dependencies(klass.dependencies)
-                prev_src.replace_header(tag, code)
+                header_dependencies = self._minimal_includes and \
+                                      self._get_header_dependencies(code_obj, klass, event_handlers)
+                if header_dependencies:
+                    prev_src.replace_header( tag, self._format_dependencies(*header_dependencies) )
+                    prev_src.replace( tag, self._format_dependencies(klass.dependencies) )
+                else:
+                    code = self._format_dependencies(klass.dependencies)
+                    prev_src.replace_header(tag, code)
 
                 # insert the extra code of this class
                 extra_code_h = "".join(klass.extra_code_h[::-1])
@@ -861,12 +927,18 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
             hout.append('#ifndef %s\n#define %s\n' % (hn, hn))
             hout.append('\n')
 
-            # write the common lines
-            hout.extend( self.header_lines )
-            hout.append('\n')
+            header_dependencies = self._minimal_includes and \
+                                  self._get_header_dependencies(code_obj, klass, event_handlers)
+            if header_dependencies:
+                # only the headers and forward declarations for the class declaration
+                code = self._format_dependencies(*header_dependencies)
+            else:
+                # write the common lines
+                hout.extend( self.header_lines )
+                hout.append('\n')
 
-            # write the module dependencies for this class
-            code = self._format_dependencies(klass.dependencies)
+                # write the module dependencies for this class
+                code = self._format_dependencies(klass.dependencies)
             hout.append(code)
             hout.append('\n')
 
@@ -883,8 +955,17 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
 
             # source file ----------------------------------------------------------------------------------------------
             # write the common lines
-            sout.append(self.header_lines[0])
+            if self._precompiled_header:
+                sout.append( self._get_precompiled_header_include() )
+            elif header_dependencies:
+                sout.extend( self.header_lines )
+            else:
+                sout.append(self.header_lines[0])
             sout.append('#include "%s"\n\n' % os.path.basename(header_file))
+            if header_dependencies:
+                # the headers that are not included by the header file
+                sout.append( self._format_dependencies(klass.dependencies) )
+                sout.append('\n')
 
             # insert the extra code of this class
             extra_code_cpp = "".join(klass.extra_code_cpp[::-1])
@@ -958,7 +1039,7 @@ class CPPCodeWriter(BaseLangCodeWriter, wcodegen.CppMixin):
 
         klass.final[:0] = final
         if self.multiple_files and (obj.IS_CLASS and obj.WX_CLASS != obj.klass):
-            klass.dependencies.append(obj.klass)
+            klass.dependencies.add(obj.klass)
         else:
             if obj.WX_CLASS in self.obj_builders:
                 headers = getattr(self.obj_builders[obj.WX_CLASS], 'import_modules', [])
@@ -1088,6 +1169,56 @@ void %(klass)s::%(handler)s(%(evt_type)s &event)  // wxGlade: %(klass)s.<event_h
             return '%s%s(wxDLG_UNIT(%s, wxSize(%s)));\n' % (objname, method, name2, size[:-1])
         return '%s%s(wxSize(%s));\n' % (objname, method, size)
 
+    def generate_images_module(self, data, images):
+        tab = self.tabs(1)
+        module = self._get_images_module()
+        guard = module.upper() + '_H'
+        header = ['#ifndef %s\n' % guard, '#define %s\n\n' % guard,
+                  '#include <wx/bitmap.h>\n\n',
+                  'namespace %s {\n' % module,
+                  '%s// Returns the bitmap for the image file name; the image is decoded on first use only\n' % tab,
+                  '%sconst wxBitmap& GetBitmap(const char* name);\n' % tab,
+                  '}\n\n',
+                  '#endif // %s\n' % guard]
+
+        source = ['#include <wx/image.h>\n', '#include <wx/mstream.h>\n', '#include <string.h>\n',
+                  '#include "%s.%s"\n\n' % (module, self.header_extension),
+                  'namespace %s {\n\n' % module]
+        for i, content in enumerate(data):
+            source.append( '// %d: %s\n' % (i, ", ".join(name for name, index in images if index==i)) )
+            source.append( 'static const unsigned char data_%d[] = {\n' % i )
+            content = bytearray(content)
+            for pos in range(0, len(content), 16):
+                source.append( '%s%s,\n' % (tab, ", ".join("0x%02x"%b for b in content[pos:pos+16])) )
+            source.append( '};\n\n' )
+        source.append( 'static const unsigned char* const data[] = {%s};\n' %
+                       ", ".join("data_%d"%i for i in range(len(data))) )
+        source.append( 'static const size_t sizes[] = {%s};\n\n' %
+                       ", ".join("sizeof(data_%d)"%i for i in range(len(data))) )
+        source.append( 'static const struct {\n' )
+        source.append( '%sconst char* name;\n%sint index;  // into data\n' % (tab, tab) )
+        source.append( '} images[] = {\n' )
+        for name, index in images:
+            source.append( '%s{%s, %d},\n' % (tab, self._quote_name(name), index) )
+        source.append( '};\n\n' )
+
+        source.append( 'const wxBitmap& GetBitmap(const char* name)\n{\n' )
+        source.append( '%s// the bitmaps are not deleted, as they may be used until the application exits\n' % tab )
+        source.append( '%sstatic wxBitmap* bitmaps[%d];\n' % (tab, len(data)) )
+        source.append( '%sfor (size_t i = 0; i < sizeof(images) / sizeof(images[0]); i++) {\n' % tab )
+        source.append( '%sif (strcmp(images[i].name, name) != 0) continue;\n' % (tab*2) )
+        source.append( '%sint index = images[i].index;\n' % (tab*2) )
+        source.append( '%sif (!bitmaps[index]) {\n' % (tab*2) )
+        source.append( '%swxMemoryInputStream stream(data[index], sizes[index]);\n' % (tab*3) )
+        source.append( '%sbitmaps[index] = new wxBitmap(wxImage(stream, wxBITMAP_TYPE_ANY));\n' % (tab*3) )
+        source.append( '%s}\n' % (tab*2) )
+        source.append( '%sreturn *bitmaps[index];\n' % (tab*2) )
+        source.append( '%s}\n' % tab )
+        source.append( '%sreturn wxNullBitmap;\n' % tab )
+        source.append( '}\n\n' )
+        source.append( '} // namespace %s\n' % module )
+        return [(self.header_extension, header), (self.source_extension, source)]
+
     def quote_path(self, s):
         return 'wxT(%s)' % super(CPPCodeWriter, self).quote_path(s)
 
@@ -1101,16 +1232,84 @@ void %(klass)s::%(handler)s(%(evt_type)s &event)  // wxGlade: %(klass)s.<event_h
             return ''
         return '%s->' % obj.name
 
-    def _format_dependencies(self, dependencies):
-        "Format a list of header files for the dependencies output"
+    def _format_dependencies(self, dependencies, declarations=()):
+        "Format a list of header files and optionally forward declarations for the dependencies output"
         dep_list = []
         for dependency in sorted(dependencies):  # unique and sorted
             if dependency and ('"' != dependency[0] != '<'):
-                dep_list.append('#include "%s.h"\n' % dependency)
+                dep_list.append('#include "%s.%s"\n' % (dependency, self.header_extension))
             else:
                 dep_list.append('#include %s\n' % dependency)
+        if declarations:
+            dep_list.append('\n')
+            dep_list.extend( 'class %s;\n' % name for name in sorted(declarations) )
         return self._tagcontent( '::dependencies', dep_list )
 
+    def _get_header_dependencies(self, code_obj, klass, event_handlers):
+        """Returns the headers and the forward declarations that the header file of the class needs, as tuple of two
+        sets; returns None if the minimal set can't be determined, e.g. for custom base classes or extra code"""
+        if klass.extra_code_h: return None
+        custom_base = getattr(code_obj, 'custom_base', code_obj.properties.get('custom_base', None))
+        if custom_base and custom_base.strip(): return None
+
+        headers = set()
+        declarations = set()
+        # the base class must be complete
+        base = code_obj.WX_CLASS
+        base_headers = getattr(self.obj_builders.get(base), 'import_modules', None) or []
+        if base in _CLASS_HEADERS:
+            headers.add(_CLASS_HEADERS[base])
+        elif not base_headers:
+            return None
+        headers.update(base_headers)
+
+        local_classes = set( dep for dep in klass.dependencies if dep and dep[0] not in '"<' )
+        for o_type, o_name in klass.sub_objs:
+            if o_type in local_classes:
+                headers.add(o_type)  # a class generated into its own file
+            elif o_type in _CLASS_HEADERS:
+                headers.add(_CLASS_HEADERS[o_type])
+            elif o_type in _FORWARD_DECLARED:
+                declarations.add(o_type)
+            elif getattr(self.obj_builders.get(o_type), 'import_modules', None):
+                headers.update(self.obj_builders[o_type].import_modules)
+            else:
+                return None  # e.g. a custom widget
+
+        for win_id, evt, handler, evt_type in event_handlers:
+            if evt_type in _CLASS_HEADERS:
+                headers.add(_CLASS_HEADERS[evt_type])
+            elif evt_type not in _CORE_EVENTS:
+                return None
+        return headers, declarations
+
+    def _get_precompiled_header(self):
+        "Returns the name of the precompiled header file; see application property 'precompiled_header'"
+        return self._get_output_basename() + "_pch." + self.header_extension
+
+    def _get_precompiled_header_include(self):
+        return '#include "%s"\n' % self._get_precompiled_header()
+
+    def _get_project_headers(self, app):
+        "returns the wx headers of all widgets of the project, also of those that are not generated now"
+        import common, depfile
+        headers = set()
+        for obj in depfile.iter_widgets(app):
+            builder = self.obj_builders.get( common.class_names.get(obj.__class__.__name__, obj.WX_CLASS) )
+            headers.update( h for h in getattr(builder, 'import_modules', None) or [] if h.startswith('<') )
+        return headers
+
+    def _write_precompiled_header(self):
+        "write the precompiled header with the common lines and the wx headers used by the project"
+        name = self._get_precompiled_header()
+        guard = name.upper().replace('.', '_')
+        lines = ['#ifndef %s\n' % guard, '#define %s\n' % guard, '\n']
+        lines.extend(self.header_lines)
+        lines.append('\n')
+        lines.extend( '#include %s\n' % header for header in sorted(self._precompiled_headers) )
+        lines.append('\n#endif // %s\n' % guard)
+        self.save_file( os.path.join(self.out_dir, name), lines )
+
 writer = CPPCodeWriter()  # The code writer is an instance of CPPCodeWriter
 
 language = writer.language  # Language generated by this code generator
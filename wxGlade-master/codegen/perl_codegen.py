@@ -151,10 +151,10 @@ class PerlCodeWriter(BaseLangCodeWriter, wcodegen.PerlMixin):
         'disabled':         "%(objname)s->Enable(0);\n",
         'extraproperties':  "%(objname)s->Set%(propname_cap)s(%(value)s);\n",
         'focused':          "%(objname)s->SetFocus();\n",
+        'font':             "Wx::Font->new(%(size)s, %(family)s, %(style)s, %(weight)s, %(underlined)s, %(face)s)",
         'foregroundcolour': "%(objname)s->SetForegroundColour(%(value)s);\n",
         'hidden':           "%(objname)s->Show(0);\n",
-        'setfont':          "%(objname)s->SetFont(Wx::Font->new(%(size)s, %(family)s, "
-                            "%(style)s, %(weight)s, %(underlined)s, %(face)s));\n",
+        'setfont':          "%(objname)s->SetFont(%(font)s);\n",
         'tooltip':          "%(objname)s->SetToolTipString(%(tooltip)s);\n",
         'tooltip_3':        "%(objname)s->SetToolTip(%(tooltip)s);\n",
         'wxcolour':         "Wx::Colour->new(%(value)s)",
@@ -188,6 +188,8 @@ class PerlCodeWriter(BaseLangCodeWriter, wcodegen.PerlMixin):
 
     tmpl_class_end = '\n%(comment)s end of class %(klass)s\n\n1;\n\n'
     tmpl_class_end_nomarker = '\n\n1;\n\n'
+    tmpl_shared_resource = 'my %(name)s = %(value)s;\n'
+    shared_resource_prefix = '$_'
 
     tmpl_func_event_stub = """\
 
@@ -375,6 +377,8 @@ sub %(handler)s {
 
         # class parent constructor
         write(tab + '$self = $self->SUPER::new( %s );\n' % ", ".join(new_signature))
+        shared_resources_pos = len(code_lines)
+        self._current_klass = self.classes[code_obj]
 
         # set size here to avoid problems with splitter windows
         if code_obj.check_prop('size'):
@@ -407,6 +411,10 @@ sub %(handler)s {
             for l in code_obj.properties["extracode_post"].get_lines():
                 write(tab + l)
 
+        # the fonts, colours and bitmaps used by the code above
+        code_lines[shared_resources_pos:shared_resources_pos] = \
+            [tab + l for l in self.generate_code_shared_resources(self.classes[code_obj], code_lines)]
+
         return code_lines
 
     def generate_code_event_bind(self, code_obj, tab, event_handlers):
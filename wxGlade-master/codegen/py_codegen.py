@@ -8,7 +8,7 @@ Python code generator
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import os, os.path, random, re
+import base64, os, os.path, random, re, zlib
 from codegen import BaseLangCodeWriter, BaseSourceFileContent
 import wcodegen
 import compat
@@ -162,10 +162,11 @@ class PythonCodeWriter(BaseLangCodeWriter, wcodegen.PythonMixin):
                         'disabled':         "%(objname)s.Enable(False)\n",
                         'extraproperties':  "%(objname)s.Set%(propname_cap)s(%(value)s)\n",
                         'focused':          "%(objname)s.SetFocus()\n",
+                        'font':             "%(cnfont)s(%(size)s, %(family)s, %(style)s, %(weight)s, "
+                                            "%(underlined)s, %(face)s)",
                         'foregroundcolour': "%(objname)s.SetForegroundColour(%(value)s)\n",
                         'hidden':           "%(objname)s.Hide()\n",
-                        'setfont':          "%(objname)s.SetFont(%(cnfont)s(%(size)s, %(family)s, "
-                                            "%(style)s, %(weight)s, %(underlined)s, %(face)s))\n",
+                        'setfont':          "%(objname)s.SetFont(%(font)s)\n",
                         'tooltip':          "%(objname)s.SetToolTipString(%(tooltip)s)\n",
                         'wxcolour':         "wxColour(%(value)s)",
                         'wxnullcolour':     "wxNullColour"}
@@ -190,6 +191,7 @@ class PythonCodeWriter(BaseLangCodeWriter, wcodegen.PythonMixin):
     tmpl_class_end = '\n%(comment)s end of class %(klass)s\n'
     tmpl_class_end_nomarker = '\n'
     tmpl_func_empty = '%(tab)spass\n'
+    tmpl_func_method = '\n%(tab)sdef %(name)s(%(args)s):\n%(content)s'
     tmpl_sizeritem = '%s.Add(%s, %s, %s, %s)\n'
     tmpl_sizeritem_button = '%s.AddButton(%s)\n'
     tmpl_gridbagsizeritem = '%s.Add(%s, %s, %s, %s, %s)\n'
@@ -201,6 +203,17 @@ class PythonCodeWriter(BaseLangCodeWriter, wcodegen.PythonMixin):
     tmpl_toplevel_style = '%(tab)skwds["style"] = kwds.get("style", 0) | %(style)s\n'
     tmpl_style0 = '%(tab)skwds["style"] = 0\n'
     tmpl_toplevel_style0 = '%(tab)skwds["style"] = kwds.get("style", 0)\n'
+    tmpl_shared_resource = '%(name)s = %(value)s\n'
+    tmpl_embedded_image = '%(module)s.get_bitmap(%(name)s)'
+    tmpl_import_images = 'import %(module)s\n'
+    tmpl_choices_from_file = 'wxglade_choices[%(key)s]'
+    tmpl_load_choices = ('with io.open(os.path.join(os.path.dirname(os.path.abspath(__file__)), %(filename)s), '
+                         'encoding="utf-8") as wxglade_file:\n'
+                         '%(tab)swxglade_choices = json.load(wxglade_file)\n')
+    tmpl_import_choices = 'import io, json, os\n'
+
+    _lazy_imports = False  # import wx submodules in the constructors; see application property 'lazy_imports'
+    _lazy_import_re = re.compile(r'^import (wx\.[\w.]+)\n$')
     tmpl_appfile = """\
 %(overwrite)s\
 %(header_lines)s\
@@ -260,6 +273,7 @@ from %(top_win_module)s import %(top_win_class)s\n\n"""
         return '\n'.join(ret)
 
     def init_lang(self, app):
+        self._lazy_imports = app.lazy_imports and not self.preview
         if self.preview and compat.PYTHON2:
             self.header_lines.append('from __future__ import print_function\n')
         self.header_lines.append('import wx\n')
@@ -308,6 +322,16 @@ from %(top_win_module)s import %(top_win_class)s\n\n"""
             write(self.tmpl_block_begin % {'class_separator': self.class_separator, 'comment_sign': self.comment_sign,
                                            'function':self.name_ctor, 'klass':fmt_klass, 'tab':tab} )
 
+        if self._lazy_imports:
+            # the wx submodules for the children; the class statement may need them at module level
+            klass = self.classes[code_obj]
+            required = set( getattr(builder, 'import_modules', []) )
+            for dependency in sorted(klass.dependencies):
+                match = self._lazy_import_re.match(dependency)
+                if not match or dependency in required or (custom_base and match.group(1) in custom_base): continue
+                write(tab + dependency)
+                klass.dependencies.discard(dependency)
+
         # the optional initial code from the code properties
         if not self.preview and code_obj.check_prop("extracode_pre"):
             for l in code_obj.properties["extracode_pre"].get_lines():
@@ -331,6 +355,8 @@ from %(top_win_module)s import %(top_win_class)s\n\n"""
                     write(tab + '%s.__init__(self)\n' % b)
         else:
             write(tab + '%s.__init__(self, *args, **kwds)\n' % mycn(code_obj.WX_CLASS))
+        shared_resources_pos = len(code_lines)
+        self._current_klass = self.classes[code_obj]
 
         # set size here to avoid problems with splitter windows
         if code_obj.check_prop('size'):
@@ -363,6 +389,12 @@ from %(top_win_module)s import %(top_win_class)s\n\n"""
             for l in code_obj.properties["extracode_post"].get_lines():
                 write(tab + l)
 
+        # the fonts, colours and bitmaps used by the code above and the choices file
+        klass = self.classes[code_obj]
+        code_lines[shared_resources_pos:shared_resources_pos] = \
+            [tab + l for l in self.generate_code_load_choices(klass) +
+                              self.generate_code_shared_resources(klass, code_lines)]
+
         return code_lines
 
     def generate_code_event_bind(self, code_obj, tab, event_handlers):
@@ -457,6 +489,36 @@ from %(top_win_module)s import %(top_win_class)s\n\n"""
         else:
             return '%s.%s((%s))\n' % (objname, method, size)
 
+    def generate_images_module(self, data, images):
+        tab = self.tabs(1)
+        lines = ['import base64, io, zlib\n', 'import wx\n', '\n',
+                 '# zlib compressed and base64 encoded image files\n',
+                 '_data = (\n']
+        for i, content in enumerate(data):
+            encoded = base64.b64encode( zlib.compress(content, 9) ).decode("ascii")
+            chunks = [encoded[pos:pos+76] for pos in range(0, len(encoded), 76)]
+            lines.append( '%s# %d: %s\n' % (tab, i, ", ".join(name for name, index in images if index==i)) )
+            lines.extend( '%sb"%s"\n' % (tab, chunk) for chunk in chunks[:-1] )
+            lines.append( '%sb"%s",\n' % (tab, chunks[-1]) )
+        lines.append( ')\n\n' )
+
+        lines.append( '_images = {\n' )  # file name -> index into _data
+        for name, index in images:
+            lines.append( '%s%s: %d,\n' % (tab, self._quote_name(name), index) )
+        lines.append( '}\n\n' )
+        lines.append( '_bitmaps = {}  # index into _data -> wx.Bitmap\n\n\n' )
+
+        lines.append( 'def get_bitmap(name):\n' )
+        lines.append( '%s"Returns the bitmap for the image file name; the image is decoded on first use only"\n' % tab )
+        lines.append( '%sindex = _images[name]\n' % tab )
+        lines.append( '%sbitmap = _bitmaps.get(index)\n' % tab )
+        lines.append( '%sif bitmap is None:\n' % tab )
+        lines.append( '%sstream = io.BytesIO( zlib.decompress( base64.b64decode(_data[index]) ) )\n' % (tab*2) )
+        lines.append( '%sbitmap = wx.Image(stream, wx.BITMAP_TYPE_ANY).ConvertToBitmap()\n' % (tab*2) )
+        lines.append( '%s_bitmaps[index] = bitmap\n' % (tab*2) )
+        lines.append( '%sreturn bitmap\n' % tab )
+        return [("py", lines)]
+
     def _quote_str(self, s):
         """Escape all unicode characters to there unicode code points in form of \\uxxxx.
         The returned string is a pure ascii string.
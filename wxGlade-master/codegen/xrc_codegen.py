@@ -14,6 +14,7 @@ To be done: write XRC directly instead of using BaseLangCodeWriter as base.
 from xml.sax.saxutils import escape, quoteattr
 from codegen import BaseLangCodeWriter
 from collections import OrderedDict
+import io, os.path, zipfile
 import common
 import new_properties as np
 import wcodegen
@@ -301,20 +302,22 @@ class XRCCodeWriter(BaseLangCodeWriter, wcodegen.XRCMixin):
             XrcObject._format_comment = self._format_comment
 
     def init_lang(self, app):
-        # for now we handle only single-file code generation
-        if self.multiple_files:
-            return "XRC code cannot be split into multiple files"
-
         # overwrite existing sources always
         self._overwrite = True
+        # for separate files, an archive with all files can be written; see application property 'xrc_archive'
+        self._xrc_archive = self.multiple_files and app.xrc_archive
 
         self.output_file_name = app.output_path
         self.out_file = []
         self.out_file.append('\n<resource version="2.3.0.1">\n')
         self.curr_tab = 1
         self.xrc_objects = OrderedDict()
+        self.toplevels = []
 
     def finalize(self):
+        if self.multiple_files:
+            self._write_multiple_files()
+            return
         # write the code for every toplevel object
         for obj in self.xrc_objects.values():
             obj.write(self.out_file, 1)
@@ -323,11 +326,56 @@ class XRCCodeWriter(BaseLangCodeWriter, wcodegen.XRCMixin):
         self.save_file( self.output_file_name, self.out_file )
         self.out_file = None
 
+    def _get_filename(self, obj):
+        "returns the file name for the toplevel window obj in case of separate files"
+        return obj.name + ".xrc"
+
+    def _write_multiple_files(self):
+        """write one XRC file for each toplevel window and an index file; the application can then load only the
+        files of the windows that it is about to show"""
+        for obj, xrc_obj in self.xrc_objects.items():
+            out_file = ['\n<resource version="2.3.0.1">\n']
+            xrc_obj.write(out_file, 1)
+            out_file.append('</resource>\n')
+            self.save_file( os.path.join(self.out_dir, self._get_filename(obj)), out_file )
+        self.out_file = None
+
+        # the index lists all toplevel windows, also those that were not generated now
+        index = ['\n<index>\n']
+        for obj in self.toplevels:
+            index.append( '%s<object class=%s name=%s file=%s/>\n' % (self.tabs(1), quoteattr(obj.WX_CLASS),
+                                                                      quoteattr(obj.name),
+                                                                      quoteattr(self._get_filename(obj))) )
+        index.append('</index>\n')
+        index_filename = self._get_output_basename() + "_index.xml"
+        self.save_file( os.path.join(self.out_dir, index_filename), index )
+
+        if self._xrc_archive:
+            filenames = [self._get_filename(obj) for obj in self.toplevels] + [index_filename]
+            self._write_archive(self._get_output_basename() + ".xrs", filenames)
+
+    def _write_archive(self, archive_filename, filenames):
+        "write the given files from the output directory into a ZIP archive; wxXmlResource can load it as .xrs file"
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, "w", zipfile.ZIP_DEFLATED) as archive:
+            for filename in filenames:
+                path = os.path.join(self.out_dir, filename)
+                if not os.path.isfile(path): continue
+                with open(path, "rb") as f:
+                    content = f.read()
+                # a fixed time stamp keeps the archive unchanged as long as the files are unchanged
+                info = zipfile.ZipInfo(filename, (1980, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, content)
+        common.save_file( os.path.join(self.out_dir, archive_filename), [data.getvalue()], 'codegen' )
+
     def generate_code(self, root, widget=None):
         "entry point for recursive code generation via _generate_code()"
         # root must be application.Application instance for now
-        for c in root.children or []:
+        self.toplevels = list(root.children or [])
+        for i, c in enumerate(root.children or []):
             if widget is not None and c is not widget: continue # for preview
+            if self.progress: self.progress(c.name, i, len(root.children))
             self._generate_code(None, None, None, c)
 
     def _generate_code(self, klass, parent, parent_builder, obj):
@@ -21,14 +21,15 @@ from collections import OrderedDict
 import logging, os, os.path, sys, tempfile
 from xml.sax.saxutils import escape, quoteattr
 
-import config, compat, plugins, misc
+import config, compat, depfile, plugins, misc, stats
 
 
-widget_classes = {}   # EditWidget class name -> EditWidget class
-widgets = {}          # all widgets: EditWidget class name -> factory(parent, pos)
-widgets_from_xml = {} # Factory functions to build objects from a XML file
+# widget modules are imported on first lookup; see plugins.WidgetRegistry
+widget_classes = plugins.LazyDict()   # EditWidget class name -> EditWidget class
+widgets = plugins.LazyDict()          # all widgets: EditWidget class name -> factory(parent, pos)
+widgets_from_xml = plugins.LazyDict() # Factory functions to build objects from a XML file
 
-class_names = {} # maps the name of the classes used by wxGlade to the correspondent classes of wxWindows
+class_names = plugins.LazyDict() # maps the name of the classes used by wxGlade to the correspondent classes of wxWindows
 
 # references to windows:
 main = None            # main window
@@ -81,6 +82,7 @@ def init_codegen():
         else:
             all_widgets[section].extend(sizer_buttons[section])
 
+    plugins.index.save()
     return all_widgets
 
 
@@ -89,17 +91,8 @@ def load_code_writers():
     logging.info('Load code generators:')
     codegen_path = os.path.join(config.wxglade_path, 'codegen')
     sys.path.insert(0, codegen_path)
-    for module in os.listdir(codegen_path):
+    for module in plugins.index.get_codegen_modules(codegen_path):
         name, ext = os.path.splitext(module)
-        # skip __init__
-        if name == "__init__":
-            continue
-        # allow regular files only
-        if not os.path.isfile(os.path.join(codegen_path, module)):
-            continue
-        # ignore none python files
-        if ext not in ['.py', '.pyo', '.pyc']:
-            continue
         # skip already imported modules
         if name in sys.modules:
             continue
@@ -232,6 +225,7 @@ def make_object_button(widget, icon_path, toplevel=False, tip=None):
 
     return: The newly created wxBitmapButton instance"""
     if not config.use_gui: return None
+    if plugins.registry.loading: return None  # imported on first use; the button was created from the manifest
     import wx
     import misc
     from tree import WidgetTree
@@ -312,9 +306,9 @@ def _smart_checksum(content):
     content: Content to generate a checksum for; list of bytes"""
     chksum = md5()  # use md5 to be compatible with Python 2.4
 
-    for i,line in enumerate(content):
-        if isinstance(line, compat.unicode):
-            line = line.encode('utf-8')
+    # the generated content is a list of chunks that may contain several lines each, so split into lines first
+    content = b"".join( [line.encode('utf-8') if isinstance(line, compat.unicode) else line for line in content] )
+    for i,line in enumerate(content.split(b"\n")):
         if b'generated by wxGlade' in line and i<10: continue
         chksum.update(line.rstrip())
 
@@ -340,7 +334,9 @@ def save_file(filename, content, which='wxg'):
 
     filename: Name of the file to create
     content:  list of strings to store into 'filename'
-    which:    Kind of backup: 'wxg' or 'codegen'"""
+    which:    Kind of backup: 'wxg' or 'codegen'
+
+    Returns True if the file was written, False if it was unchanged."""
     if which == 'wxg':
         content = [line.encode('utf-8') for line in content] # encode from unicode to utf-8
         do_backup = config.preferences.wxg_backup
@@ -349,6 +345,22 @@ def save_file(filename, content, which='wxg'):
     else:
         raise NotImplementedError( 'Unknown value "%s" for parameter "which"!' % which )
 
+    with stats.timer("write"):
+        written = _save_file(filename, content, do_backup)
+    if which == 'codegen':
+        depfile.add_output(filename)
+    if stats.active() and which == 'codegen':
+        stats.count("lines emitted", sum(line.count(b"\n") for line in content))
+        if written:
+            stats.count("files written")
+            stats.count("bytes written", sum(len(line) for line in content))
+        else:
+            stats.count("files unchanged")
+    return written
+
+
+def _save_file(filename, content, do_backup):
+    "helper for save_file; content must be a list of byte strings"
     if os.path.isfile(filename):
         # read existing file to check content
         chksum_oldcontent = _smart_checksum( _read_file(filename) )
@@ -356,7 +368,7 @@ def save_file(filename, content, which='wxg'):
         # nothing changed?
         chksum_content = _smart_checksum(content)
         if chksum_oldcontent == chksum_content:
-            return
+            return False
 
     # create the backup file only with the first save
     need_backup = do_backup and filename not in config.backed_up and os.path.isfile(filename)
@@ -384,6 +396,7 @@ def save_file(filename, content, which='wxg'):
     finally:
         if outfile:
             outfile.close()
+    return True
 
 
 ########################################################################################################################
@@ -779,7 +792,8 @@ class Preferences(ConfigParser.ConfigParser):
         'autosave_delay': 120,  # in seconds
         'show_completion': True,
         'write_timestamp': True,
-        'write_generated_from': False
+        'write_generated_from': False,
+        'profile': False  # write cProfile and tracemalloc statistics for loading, code generation and saving
         }
 
     def __init__(self, defaults=None):
@@ -0,0 +1,144 @@
+"""\
+Dependency files for make and ninja; see command line option --depfile
+
+While active, every generated file is recorded as output (see common.save_file). After code generation, the .wxg
+file, the bitmap files referenced by the project and the custom widget modules that generated code are recorded as
+inputs. write() stores a rule "outputs: inputs" in Makefile syntax.
+
+The functions of this module do nothing until start() has been called, so the hooks can stay in place.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import os, sys
+
+import config
+
+
+_current = None  # the active Dependencies instance; see start()
+
+
+class Dependencies(object):
+    def __init__(self):
+        self.inputs = []
+        self.outputs = []
+
+    def add_input(self, filename):
+        filename = os.path.abspath(filename)
+        if filename not in self.inputs: self.inputs.append(filename)
+
+    def add_output(self, filename):
+        filename = os.path.abspath(filename)
+        if filename not in self.outputs: self.outputs.append(filename)
+
+    def format(self):
+        "returns the rule in Makefile syntax; input files that are output files as well are omitted"
+        inputs = [filename for filename in self.inputs if filename not in self.outputs]
+        lines = [" ".join(_escape(filename) for filename in self.outputs) + ":"]
+        lines.extend( _escape(filename) for filename in inputs )
+        return " \\\n  ".join(lines) + "\n"
+
+
+def _escape(filename):
+    # paths below the current directory are written relative to it, like in the build files
+    if filename.startswith(os.getcwd() + os.sep):
+        filename = os.path.relpath(filename)
+    if os.sep=="\\": filename = filename.replace("\\", "/")
+    return filename.replace("$", "$$").replace("#", "\\#").replace(" ", "\\ ")
+
+
+def start():
+    global _current
+    _current = Dependencies()
+    return _current
+
+
+def stop():
+    global _current
+    _current = None
+
+
+def active():
+    return _current is not None
+
+
+def add_output(filename):
+    "record a generated file"
+    if _current is not None:
+        _current.add_output(filename)
+
+
+def add_project(app):
+    "record the .wxg file of app and the files read for it"
+    if _current is None: return
+    if app.filename: _current.add_input(app.filename)
+    for filename in get_bitmaps(app):
+        if os.path.isfile(filename): _current.add_input(filename)
+    for filename in get_widget_modules(app, app.language):
+        _current.add_input(filename)
+
+
+def write(filename):
+    "write the recorded dependencies to filename; returns False if nothing was generated"
+    if _current is None or not _current.outputs: return False
+    with open(filename, "w") as f:
+        f.write(_current.format())
+    return True
+
+
+def iter_widgets(app):
+    "yields all widgets of the project in tree order, without slots"
+    def iter_rec(obj):
+        yield obj
+        for c in obj.get_all_children():
+            if c is None or c.IS_SLOT: continue
+            for child in iter_rec(c):
+                yield child
+    for c in app.children:
+        for obj in iter_rec(c):
+            yield obj
+
+
+def iter_bitmaps(app):
+    "yields the values of all bitmap properties of the project that refer to files, in tree order; may repeat values"
+    import new_properties as np
+    def is_file(value):
+        return value and not value.startswith( ("art:", "code:", "empty:", "var:") )
+    for obj in iter_widgets(app):
+        for prop in obj.properties.values():
+            if isinstance(prop, np.BitmapProperty) and is_file(prop.value): yield prop.value
+        for tool in getattr(obj, "tools", None) or []:
+            if is_file(tool.bitmap1): yield tool.bitmap1
+            if is_file(tool.bitmap2): yield tool.bitmap2
+
+
+def get_bitmaps(app):
+    "returns the absolute filenames of all bitmap files referenced by the project, including missing ones"
+    import misc
+    return sorted( set( misc.get_absolute_path(value) for value in iter_bitmaps(app) ) )
+
+
+def get_widget_modules(app, language):
+    """returns the filenames of the widget modules from outside the wxGlade installation that provide the code
+    generators for the widgets of the project, i.e. the modules from the local widget path; for ZIP files, the ZIP
+    file is returned"""
+    import common
+    ret = set()
+    builders = common.code_writers[language].obj_builders
+    wxglade_path = os.path.abspath(config.wxglade_path) + os.sep
+    for obj in iter_widgets(app):
+        builder = builders.get( common.class_names.get(obj.__class__.__name__, obj.WX_CLASS) )
+        if builder is None: continue
+        cls = builder  if isinstance(builder, type) else  builder.__class__
+        module = sys.modules.get(cls.__module__)
+        filename = getattr(module, "__file__", None)
+        if not filename: continue
+        filename = os.path.abspath(filename)
+        if filename.startswith(wxglade_path): continue
+        if filename.endswith((".pyc", ".pyo")) and os.path.isfile(filename[:-1]):
+            filename = filename[:-1]
+        while filename and not os.path.exists(filename):
+            # a module inside a ZIP file
+            filename = os.path.dirname(filename)
+        if os.path.isfile(filename): ret.add(filename)
+    return sorted(ret)
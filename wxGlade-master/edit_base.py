@@ -2,7 +2,7 @@
 import logging
 import wx
 import new_properties as np
-import common, misc, compat, clipboard, config
+import common, misc, compat, clipboard, config, search
 
 MANAGED_PROPERTIES  = ["pos", "span", "proportion", "border", "flag"]
 
@@ -35,6 +35,7 @@ class EditBase(np.PropertyOwner):
     IS_NAMED = True  # default, only False for Spacer
     #CHILDREN = 1  # 0 or a fixed number or None for e.g. a sizer with a variable number of children; -1 for 0 or 1
     ATT_CHILDREN = None
+    _widgets_deferred = False  # True if only self.widget has been created, but not the ones of the children
 
     def __init__(self, name, parent, pos=None):
         assert self.WX_CLASS
@@ -273,19 +274,39 @@ class EditBase(np.PropertyOwner):
                 assert self.IS_NAMED
             old_name = self.properties["name"].previous_value or None
             self.toplevel_parent.track_contained_name(old_name, self.name)
-            common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
+            if common.app_tree: common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
         elif (not modified or "class" in modified or "name" in modified) and common.app_tree:
             common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
 
     # widget creation and destruction ##################################################################################
     def create_widgets(self):
-        "Shows the widget of the given node and all its children"
+        """Shows the widget of the given node and all its children;
+        for children that are not visible, e.g. notebook pages, see _is_hidden_child() and create_deferred_widgets()"""
         self.create()
+        self._widgets_deferred = False
         if self.children:
             for c in self.children:
-                c.create_widgets()
+                if self._is_hidden_child(c):
+                    c.create()
+                    c._widgets_deferred = True
+                else:
+                    c.create_widgets()
         self.post_load()  # SizerBase uses this for toplevel sizers; also EditNotebook
 
+    def _is_hidden_child(self, child):
+        "returns True if only the widget of child should be created, e.g. for a notebook page that is not selected"
+        return False
+
+    def create_deferred_widgets(self):
+        "create the widgets of the children, if this was deferred by the parent; called when self becomes visible"
+        if not self._widgets_deferred: return
+        self._widgets_deferred = False
+        if not self.widget: return  # destroyed meanwhile
+        with self.toplevel_parent.frozen():
+            self.create_widgets()
+            self.parent.post_load()  # e.g. a notebook may need to update its size
+        self.widget.Layout()
+
     def create(self):
         "create the wx widget"
         if not self.IS_TOPLEVEL and self.parent.widget is None: return
@@ -308,6 +329,7 @@ class EditBase(np.PropertyOwner):
         """Destructor. deallocates the popup menu, the notebook and all the properties.
         Why we need explicit deallocation? Well, basically because otherwise we get a lot of memory leaks... :)"""
         # XXX tell property editor
+        search.remove_owner(self)
         self.destroy_widget()
         if misc.focused_widget is self:
             misc.focused_widget = None
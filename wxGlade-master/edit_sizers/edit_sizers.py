@@ -423,7 +423,7 @@ class SizerBase(Sizer, np.PropertyOwner):
         # "class" and "orient" will only display; "class_orient"
         if modified and "name" in modified:
             previous_name = self.properties["name"].previous_value
-            common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
+            if common.app_tree: common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
             
         if not modified or "class" in modified:
             self.properties["class_orient"].set(self.get_class_orient())
@@ -560,6 +560,18 @@ class SizerBase(Sizer, np.PropertyOwner):
                 misc.bind_menu_item_after(widget, i, self.add_slot, True)
             menu.AppendSeparator()
 
+        if not item.IS_SLOT:
+            # bulk copies of the item
+            if self._can_add_insert_slots():
+                i = misc.append_menu_item(menu, -1, _('Duplicate...') )
+                misc.bind_menu_item_after(widget, i, self.duplicate_item, item)
+            if "rows" in self.PROPERTIES:
+                i = misc.append_menu_item(menu, -1, _('Fill empty Slots with Copies') )
+                misc.bind_menu_item_after(widget, i, self.duplicate_item, item, True)
+                if not [c for c in self.children if c and c.IS_SLOT and not getattr(c, "overlapped", False)]:
+                    i.Enable(False)
+            menu.AppendSeparator()
+
         ####################################################################################################################
     def _remove(self):
         "removes the sizer from his parent, if it has one"
@@ -768,7 +780,7 @@ class SizerBase(Sizer, np.PropertyOwner):
     def layout(self, recursive=True):
         # update slot labels in tree view
         for c in self.children:
-            if isinstance(c, SizerSlot):
+            if isinstance(c, SizerSlot) and common.app_tree:
                 common.app_tree.refresh(c, refresh_image=False, refresh_label=True) # refresh_name( c.node )
 
         if not self.widget:
@@ -925,6 +937,23 @@ class SizerBase(Sizer, np.PropertyOwner):
             if self.widget: self.layout()
         misc.rebuild_tree(slot, recursive=False)  # rebuild also slots
 
+    def duplicate_item(self, item, fill=False):
+        "insert copies of item after it or, with fill=True, into all empty slots (e.g. to fill a grid)"
+        if fill:
+            positions = [c.pos for c in self.children if c and c.IS_SLOT and not getattr(c, "overlapped", False)]
+        else:
+            if not self._can_add_insert_slots(report=True):
+                return
+            count = wx.GetNumberFromUser(_("Number of copies to be inserted after %s")%item.name, _("Copies:"),
+                                         _("Duplicate"), 1, 1, 1000)
+            if count<=0: return
+            with self.window.frozen():
+                for n in range(count):
+                    self._insert_slot(item.pos+1)
+            positions = list(range(item.pos+1, item.pos+1+count))
+        if positions:
+            clipboard._paste_multiple(self, positions, clipboard.dump_widget(item))
+
     @_frozen
     def _free_slot(self, pos, force_layout=True):
         "Replaces the element at pos with an empty slot"
@@ -1166,7 +1195,9 @@ class EditStaticBoxSizer(BoxSizerBase):
         if not modified or "label" in modified and self.widget:
             self.widget.GetStaticBox().SetLabel(self.label or "")
             #self.layout()
-        if modified and "name" in modified:
+        if not common.app_tree:
+            pass
+        elif modified and "name" in modified:
             common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
         elif not modified or "label" in modified or "name" in modified and self.node:
             common.app_tree.refresh(self, refresh_label=True, refresh_image=False)
@@ -11,7 +11,7 @@ import wx
 import wx.grid
 import re
 
-import common, config
+import common, config, search
 from wcodegen.taghandler import BaseXmlBuilderTagHandler
 import new_properties as np
 
@@ -56,8 +56,18 @@ class EventsProperty(np.GridProperty):
         for key, value in values_dict.items():
             if key in default_events: continue
             self.value.append([key,value])
+        search.update(self)
         self.update_display()
 
+    def get_search_keys(self):
+        # the handlers, as "handler" and with the event name
+        ret = []
+        for event, handler in self.get():
+            if not handler: continue
+            ret.append( ("handler", handler) )
+            ret.append( (event, handler) )
+        return ret
+
     def write(self, output, tabs):
         inner_xml = []
         for event, handler in self.get():
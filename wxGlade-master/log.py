@@ -5,14 +5,17 @@ This module provides a own logger class as well as specific functions to improve
 
 wxGlade uses the python logging instance with three log handler attached.
 
-The first handler StringHandler is used to cache messages later displaying calling getBufferAsList() or
-getBufferAsString().
+The first handler StringHandler is used to cache the last messages (a ring buffer) for later displaying calling
+getBufferAsList() or getBufferAsString().
 
 The second handler logging.StreamHandler to print error messages to sys.stderr.
 
 The third handler logging.FileHandler writes all messages into a file. This
 behaviour is useful to store logged exceptions permanently.
 
+Optionally, a fourth handler writes all messages as JSON lines into a file (see JSONFormatter); this is meant for
+batch mode, where a build script can parse e.g. warnings without scraping the console output.
+
 @todo: Integrate Unicode logging fix.
 
 @copyright: 2013-2016 Carsten Grohmann
@@ -20,7 +23,7 @@ behaviour is useful to store logged exceptions permanently.
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import datetime, inspect
+import collections, datetime, inspect, json
 import logging, logging.handlers
 import os, sys, types, traceback
 
@@ -38,8 +41,10 @@ stringLoggerInstance = None  # Reference to the active StringHandler instance
 exception_orig = logging.exception # Reference to the original implementation of logging.exception
 
 
-class StringHandler(logging.handlers.MemoryHandler):
-    "Stores the log records as a list of strings."
+class StringHandler(logging.Handler):
+    """Stores the last log records in a ring buffer of fixed size.
+
+    The records are formatted only when the buffer is read, i.e. usually never for most of them."""
 
     storeAsUnicode = True  # Store the log records as unicode strings
 
@@ -47,13 +52,14 @@ class StringHandler(logging.handlers.MemoryHandler):
     # The default encoding is used to convert character strings into unicode strings.
     encoding = sys.stdout and sys.stdout.encoding or sys.getfilesystemencoding()
 
-    def __init__(self, storeAsUnicode=True):
+    def __init__(self, storeAsUnicode=True, capacity=1000):
         """Constructor
 
-        storeAsUnicode: Store recorded log records as unicode strings"""
-        self.buffer = []  # The message buffer itself
-        #logging.handlers.MemoryHandler.__init__(self, sys.maxint, 99)
-        logging.handlers.MemoryHandler.__init__(self, 2**31-1, 99)
+        storeAsUnicode: Store recorded log records as unicode strings
+        capacity:       Maximum number of records to keep; older ones will be dropped"""
+        logging.Handler.__init__(self)
+        self.buffer = collections.deque(maxlen=capacity)  # The record buffer itself
+        self.dropped = 0  # number of records that were dropped since the last flush
         self.storeAsUnicode = storeAsUnicode
 
     def _toUnicode(self, msg):
@@ -71,11 +77,17 @@ class StringHandler(logging.handlers.MemoryHandler):
         "Returns all buffered messages"
         self.acquire()
         try:
-            messages = self.buffer[:]
+            records = list(self.buffer)
+            dropped = self.dropped
             if clean:
                 self.flush()
         finally:
             self.release()
+        messages = [self.format(record) for record in records]
+        if self.storeAsUnicode:
+            messages = [self._toUnicode(msg) for msg in messages]
+        if dropped:
+            messages.insert(0, _('(%d older messages dropped)')%dropped)
         return messages
 
     def getBufferAsString(self, clean=True):
@@ -86,18 +98,43 @@ class StringHandler(logging.handlers.MemoryHandler):
         return '\n'.join(msg_list)
 
     def emit(self, record):
-        "Emit a record, i.e. add a formatted log record to the buffer."
-        msg = self.format(record)
-        if self.storeAsUnicode:
-            msg = self._toUnicode(msg)
-        self.buffer.append(msg)
-        if self.shouldFlush(record):
-            self.flush()
+        "Emit a record, i.e. add it to the buffer; formatting is deferred until the buffer is read"
+        if record.exc_info:
+            # format the exception now to not keep the traceback and all its frames alive
+            formatter = self.formatter or logging.Formatter()
+            record = logging.makeLogRecord(record.__dict__)  # other handlers may still need exc_info
+            if not record.exc_text:
+                record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        if len(self.buffer)==self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(record)
 
     def flush(self):
         "Empty the buffer"
-        self.buffer = []
+        self.acquire()
+        try:
+            self.buffer.clear()
+            self.dropped = 0
+        finally:
+            self.release()
+
 
+class JSONFormatter(logging.Formatter):
+    "Formats a record as a single line JSON object, e.g. for parsing warnings in batch builds"
+
+    def format(self, record):
+        entry = {"time":     self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+                 "level":    record.levelname,
+                 "logger":   record.name,
+                 "message":  record.getMessage(),
+                 "module":   record.module,
+                 "line":     record.lineno}
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, sort_keys=True)
 
 
 class ExceptionFormatter(logging.Formatter):
@@ -151,7 +188,7 @@ class ExceptionFormatter(logging.Formatter):
 
 
 
-def init(filename='wxglade.log', encoding='utf-8', level=None):
+def init(filename='wxglade.log', encoding='utf-8', level=None, json_filename=None):
     """Initialise the logging facility
 
     Initialise and configure the logging itself as well as the handlers described above.
@@ -161,6 +198,7 @@ def init(filename='wxglade.log', encoding='utf-8', level=None):
     filename: Name of the log file
     encoding: Encoding of the log file
     level:    Verbosity of messages written in log file e.g. "INFO"
+    json_filename: Name of an additional log file with one JSON object per message; "-" for sys.stdout
 
     see: StringHandler, stringLoggerInstance, installExceptionHandler()"""
     default_formatter = ExceptionFormatter('%(levelname)-8s: %(message)s')
@@ -197,6 +235,17 @@ def init(filename='wxglade.log', encoding='utf-8', level=None):
             file_logger.setLevel(logging.NOTSET)
             logger.addHandler(file_logger)
 
+    # instantiate JSON lines handler
+    if json_filename:
+        if json_filename=="-":
+            json_logger = logging.StreamHandler(sys.stdout)
+        else:
+            json_logger = logging.FileHandler(json_filename, mode="w", encoding=encoding)
+        json_logger.terminator = '\n'
+        json_logger.setFormatter( JSONFormatter() )
+        json_logger.setLevel(logging.NOTSET)
+        logger.addHandler(json_logger)
+
     # instantiate string handler
     string_logger = StringHandler(storeAsUnicode=False)
     string_logger.setLevel(logging.WARNING)
@@ -15,13 +15,13 @@ from xml.sax import SAXParseException
 
 # import project modules
 import application
-import common, config, compat, misc, history
+import common, config, compat, misc, history, profiling, search
 import new_properties as np
 import preferencesdialog, msgdialog, bugdialog, about
 import log
 import template
 from tree import WidgetTree
-from xml_parse import XmlWidgetBuilder, ProgressXmlWidgetBuilder, XmlParsingError
+from xml_parse import XmlWidgetBuilder, ProgressXmlWidgetBuilder, IncrementalXmlWidgetBuilder, XmlParsingError
 
 
 
@@ -370,6 +370,11 @@ class wxGladePalettePanel(wx.Panel):
 
 class wxGladeFrame(wx.Frame):
     "Main frame of wxGlade"
+    _loading = None  # while a project is loaded progressively; see _open_app()
+    _loading_modified = False  # the user has modified the project while it was loading
+    _loading_profile = None  # the profile of a progressive loading, from the first to the last step
+    _search_dialog = None  # the Find / Replace dialog, created on first use
+
     def __init__(self):
         self._logger = logging.getLogger(self.__class__.__name__)
         version = config.version
@@ -507,7 +512,7 @@ class wxGladeFrame(wx.Frame):
         file_menu.AppendSeparator() # ----------------------------------------------------------------------------------
 
         GENERATE_CODE = append_menu_item(file_menu, -1, _("&Generate Code\tCtrl+G"), wx.ART_EXECUTABLE_FILE)
-        misc.bind_menu_item(self, GENERATE_CODE, lambda: common.root.generate_code())
+        misc.bind_menu_item(self, GENERATE_CODE, lambda: common.root.generate_code(background=True))
 
         file_menu.AppendSeparator() # ----------------------------------------------------------------------------------
 
@@ -536,6 +541,10 @@ class wxGladeFrame(wx.Frame):
 
         edit_menu.AppendSeparator() # ----------------------------------------------------------------------------------
 
+        item = append_menu_item(edit_menu, -1, _('Find / Replace...\tCtrl+F'), wx.ART_FIND,
+                                helpString="Search and replace property values, e.g. event handlers, in all widgets")
+        misc.bind_menu_item(self, item, self.show_search_dialog)
+
         item = append_menu_item(edit_menu, -1, _('Template Manager...'))
         misc.bind_menu_item(self, item, self.manage_templates)
 
@@ -687,7 +696,7 @@ class wxGladeFrame(wx.Frame):
 
         tb.AddSeparator()
         t = add(-1, "Generate Code", wx.ART_EXECUTABLE_FILE, wx.ITEM_NORMAL, "Generate Code (Ctrl+G)" )
-        self.Bind(wx.EVT_TOOL, lambda event: common.root.generate_code(), t)
+        self.Bind(wx.EVT_TOOL, lambda event: common.root.generate_code(background=True), t)
         tb.AddSeparator()
         
         t1 = add(-1, "Layout 1", "layout1.xpm", wx.ITEM_RADIO, "Switch layout: Tree", 
@@ -723,6 +732,7 @@ class wxGladeFrame(wx.Frame):
         self.autosave_timer.Start( int(config.preferences.autosave_delay) * 1000 )
 
     def on_autosave_timer(self, event):
+        if self._loading is not None: return
         res = common.autosave_current()
         if res == 2:
             self.user_message(_("Auto saving... done"))
@@ -761,6 +771,15 @@ class wxGladeFrame(wx.Frame):
             dialog.set_preferences()
         dialog.Destroy()
 
+    def show_search_dialog(self):
+        "show the modeless dialog to search and replace property values; see search.py"
+        if self._search_dialog is None:
+            import search_dialog
+            self._search_dialog = search_dialog.SearchDialog(self)
+        self._search_dialog.Show()
+        self._search_dialog.Raise()
+        self._search_dialog.query.SetFocus()
+
     def _get_toplevel(self):
         # return the toplevel for a preview or design window
         if misc.focused_widget and not isinstance(misc.focused_widget, application.Application):
@@ -865,6 +884,13 @@ class wxGladeFrame(wx.Frame):
         """checks whether the current app has changed and needs to be saved:
         if so, prompts the user;
         returns False if the operation has been cancelled"""
+        if self._loading is not None:
+            # a partially loaded project is not worth saving
+            ok = wx.MessageBox(_("The project is still loading. Stop loading?"),
+                               _("Confirm"), wx.YES_NO|wx.CENTRE|wx.ICON_QUESTION)
+            if ok != wx.YES: return False
+            self._stop_loading()
+            return True
         if not common.root.saved:
             ok = wx.MessageBox(_("Save changes to the current app?"),
                                _("Confirm"), wx.YES_NO|wx.CANCEL|wx.CENTRE|wx.ICON_QUESTION)
@@ -942,8 +968,11 @@ class wxGladeFrame(wx.Frame):
                     toplevel = misc.get_toplevel_parent(misc.focused_widget.widget)
                     if toplevel: position = toplevel.GetPosition()
 
-        self._open_app(filename)
+        self._open_app(filename, progressive=True, callback=lambda: self._show_path(path, position))
         self.cur_dir = os.path.dirname(filename)
+
+    def _show_path(self, path, position):
+        # after re-loading, select the previously selected widget again
         if not path: return
         editor = common.root.find_widget_from_path(path)
         if not editor: return
@@ -955,9 +984,14 @@ class wxGladeFrame(wx.Frame):
         if not position or not editor.widget: return
         misc.get_toplevel_parent(editor.widget).SetPosition(position)
 
-    def _open_app(self, filename, use_progress_dialog=True, add_to_history=True):
-        "Load a new wxGlade project"
+    def _open_app(self, filename, use_progress_dialog=True, add_to_history=True, progressive=False, callback=None):
+        """Load a new wxGlade project
+
+        progressive: load a file in steps from wx.CallAfter; each toplevel window is added to the tree as soon as
+                     it is loaded, such that the project can be browsed while the remaining ones are loaded;
+                     returns after the first step and calls callback when the project has been loaded"""
 
+        self._stop_loading()
         error_msg = None
         infile = None
 
@@ -994,46 +1028,69 @@ class wxGladeFrame(wx.Frame):
                 else:
                     common.root.filename = None
 
-                if use_progress_dialog and config.preferences.show_progress:
+                if progressive and infile is not None:
+                    p = IncrementalXmlWidgetBuilder(filename, input_file_version, infile.readlines(),
+                                                    self._on_toplevel_loaded)
+                    self._loading = (p, filename, add_to_history, start, callback)
+                elif use_progress_dialog and config.preferences.show_progress:
                     p = ProgressXmlWidgetBuilder(filename, input_file_version, input_file=infile)
                 else:
                     p = XmlWidgetBuilder(filename, input_file_version)
 
-                if infile is not None:
-                    p.parse(infile)
-                else:
-                    p.parse_string(filename)
-                    filename = None
-            except (EnvironmentError, SAXParseException, XmlParsingError) as msg:
-                if config.debugging: raise
-                if infile is not None:
-                    error_msg = _("Error loading file %s:\n%s") % (misc.wxstr(filename), misc.wxstr(msg))
-                else:
-                    error_msg = _("Error loading from a file-like object:\n%s") % misc.wxstr(msg)
+                if self._loading is None:  # otherwise, see _load_step()
+                    with profiling.profile("load"):
+                        if infile is not None:
+                            p.parse(infile)
+                        else:
+                            p.parse_string(filename)
+                            filename = None
             except Exception as inst:
-                if config.debugging: raise
-                if filename and not isinstance(filename, list):
-                    fn = os.path.basename(filename).encode('ascii','replace')
-                    msg = _('loading file "%s"') % fn
-                else:
-                    msg = _('loading from a file-like object')
-                bugdialog.Show(msg, inst)
+                error_msg = self._get_loading_error(filename, infile is not None, inst)
         finally:
             if infile and filename:
                 infile.close()
 
             if error_msg:
-                common.root.clear()
-                common.root.new()
-                common.root.saved = True
-                common.app_tree.auto_expand = True  # re-enable auto-expansion of nodes
-
-                wx.MessageBox(error_msg, _('Error'), wx.OK | wx.CENTRE | wx.ICON_ERROR)
-
+                self._loading_failed(error_msg)
                 return False
 
+        if self._loading is not None:
+            misc.rebuild_tree(common.root, freeze=True)
+            common.root.saved = True
+            self._loading_modified = False
+            self._loading_profile = profiling.profile("load")
+            self._loading_profile.__enter__()
+            self._load_step()
+            return True
+
         misc.rebuild_tree(common.root, freeze=True)
+        self._loading_done(filename, add_to_history, start)
+        return True
+
+    def _get_loading_error(self, filename, is_file, inst):
+        "returns an error message for the user or None if the bug dialog has been shown"
+        if config.debugging: raise
+        if isinstance(inst, (EnvironmentError, SAXParseException, XmlParsingError)):
+            if is_file:
+                return _("Error loading file %s:\n%s") % (misc.wxstr(filename), misc.wxstr(inst))
+            return _("Error loading from a file-like object:\n%s") % misc.wxstr(inst)
+        if filename and not isinstance(filename, list):
+            fn = os.path.basename(filename).encode('ascii','replace')
+            msg = _('loading file "%s"') % fn
+        else:
+            msg = _('loading from a file-like object')
+        bugdialog.Show(msg, inst)
+        return None
+
+    def _loading_failed(self, error_msg):
+        common.root.clear()
+        common.root.new()
+        common.root.saved = True
+        common.app_tree.auto_expand = True  # re-enable auto-expansion of nodes
 
+        wx.MessageBox(error_msg, _('Error'), wx.OK | wx.CENTRE | wx.ICON_ERROR)
+
+    def _loading_done(self, filename, add_to_history, start):
         common.app_tree.auto_expand = True  # re-enable auto-expansion of nodes
 
         common.app_tree.Expand(common.root.item)
@@ -1061,10 +1118,61 @@ class wxGladeFrame(wx.Frame):
         else:
             self.user_message( _("Loaded in %.2f seconds") % duration )
 
-        return True
+    def _load_step(self):
+        # load the next part of the file; see _open_app(progressive=True)
+        if self._loading is None: return  # stopped
+        p, filename, add_to_history, start, callback = self._loading
+        if not common.root.saved: self._loading_modified = True
+        try:
+            done = p.parse_step()
+        except Exception as inst:
+            self._loading = None
+            self._stop_loading_profile()
+            error_msg = self._get_loading_error(filename, True, inst)
+            if error_msg:
+                self._loading_failed(error_msg)
+                return
+            done = True
+        if not done:
+            common.root.saved = not self._loading_modified  # the loader itself does not modify the project
+            self.user_message( _("Loading %s... %d%%") % (misc.wxstr(os.path.basename(filename)), p.get_progress()) )
+            wx.CallAfter(self._load_step)
+            return
+        self._loading = None
+        self._stop_loading_profile()
+        if misc.focused_widget is common.root:
+            # show the application properties as read at the end of the file
+            misc.set_focused_widget(common.root, force=True)
+        self._loading_done(filename, add_to_history, start)
+        if self._loading_modified: common.root.saved = False
+        if callback: callback()
+
+    def _on_toplevel_loaded(self, editor):
+        # called by IncrementalXmlWidgetBuilder: add the items for the window, such that it can be browsed already
+        common.app_tree.add2(editor, common.root, None)
+        common.app_tree.build(editor)
+        common.app_tree.Expand(common.root.item)
+
+    def is_loading(self):
+        return self._loading is not None
+
+    def _stop_loading(self):
+        # stop a progressive loading; the part that has been loaded is kept
+        if self._loading is None: return
+        self._loading = None
+        self._stop_loading_profile()
+        common.app_tree.auto_expand = True
+
+    def _stop_loading_profile(self):
+        if self._loading_profile is None: return
+        self._loading_profile.__exit__(None, None, None)
+        self._loading_profile = None
 
     def save_app(self, event=None):
         "saves a wxGlade project onto an xml file"
+        if self._loading is not None:
+            self.user_message(_("The project is still loading"))
+            return
         self.property_panel.flush()
         if not common.root.filename or common.root.is_template:
             self.save_app_as()
@@ -1075,6 +1183,7 @@ class wxGladeFrame(wx.Frame):
                 common.root.is_template = True
             self._save_app(common.root.filename)
 
+    @profiling.profiled("save")
     def _save_app(self, filename):
         try:
             obuffer = []
@@ -1098,6 +1207,9 @@ class wxGladeFrame(wx.Frame):
 
     def save_app_as(self):
         "saves a wxGlade project onto an xml file chosen by the user"
+        if self._loading is not None:
+            self.user_message(_("The project is still loading"))
+            return
         # both flags occurs several times
         fn = wx.FileSelector( _("Save project as..."),
                               wildcard="wxGlade files (*.wxg)|*.wxg|wxGlade Template files (*.wgt) |*.wgt|"
@@ -1121,6 +1233,9 @@ class wxGladeFrame(wx.Frame):
 
     def save_app_as_template(self):
         "save a wxGlade project as a template"
+        if self._loading is not None:
+            self.user_message(_("The project is still loading"))
+            return
         data = getattr(common.root, 'template_data', None)
         outfile, data = template.save_template(data)
         if outfile:
@@ -1472,6 +1587,7 @@ def main(filename=None):
     "if filename is not None, loads it"
     logging.info(_("Using wxPython %s"), config.wx_version)
     common.history = history.History()
+    search.start()
     app = wxGlade()
     if filename is not None:
         win = app.GetTopWindow()
@@ -47,9 +47,11 @@ def set_focused_widget(widget, force=False, delayed=False):
     common.main.set_widget(widget)  # to update menu and toolbar
 
     focused_time = time.time()
-    if widget and widget.widget:
-        # ensure that it is visible and selection is displayed, if applicable
+    if widget:
+        # ensure that it is visible, e.g. on a notebook page that has not been shown yet
         show_widget(widget)
+    if widget and widget.widget:
+        # ensure that selection is displayed, if applicable
         widget.update_view(selected=True)
         # set focus in Design window to move away from certain widgets
         if set_focus and hasattr(widget.widget, "HasFocus") and not widget.widget.HasFocus():
@@ -73,7 +75,13 @@ def rebuild_tree(widget=None, recursive=True, focus=True, freeze=False):
 
 def show_widget(widget):
     # ensure that notebook pages are selected such that widget is visible
-    if not widget.widget: return
+    while not widget.widget:
+        # the widgets of a notebook page may not have been created yet; see EditBase.create_widgets()
+        editor = widget.parent
+        while editor is not None and not getattr(editor, "_widgets_deferred", False):
+            editor = editor.parent
+        if editor is None: return
+        editor.create_deferred_widgets()
     while True:
         if not widget.parent: break  # Application.node is None
         parent = widget.parent
@@ -9,7 +9,7 @@ Interface to owner modified; see below for class PropertyOwner
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import common, config, compat, logging, misc
+import common, config, compat, logging, misc, search
 from collections import OrderedDict
 import re, os
 import wx
@@ -63,20 +63,31 @@ class Property(object):
     GROW = False # if this is True, no spacer is added after the control, so it may grow down to the lower edge
     HAS_DATA = True
     min_version = None  # can be overwritten in instances; currently only used by BitmapProperty
+
+    # Defaults for the per-instance state. There are thousands of properties in a large project and most of them
+    # keep these values, so they are stored in the instance only when they are set to something else.
+    previous_value = None  # only set during call of self.owner.properties_modified
+    # when the property is assigned to an instance property, these will be set:
+    owner = None
+    name = None
+    attributename = None
+    modified = False  # either by the user or from loaded file; WidgetStyleProperty.write uses it
+    # this can be set to True by the owner, depending on another property value; value will still be written to XML
+    blocked = False
+    default_value = _DefaultArgument
+    editing = False
+    enabler = None
+
     def __init__(self, value, default_value=_DefaultArgument, name=None):#, write_always=False):
-        self._logger = logging.getLogger(self.__class__.__name__)
         self.value = value
-        self.previous_value = None  # only set during call of self.owner.properties_modified
-        # when the property is assigned to an instance property, these will be set:
-        self.owner = None
-        self.name = name
-        self.attributename = None
-        self.modified = False  # either by the user or from loaded file; WidgetStyleProperty.write uses it
-        # this can be set to True by the owner, depending on another property value; value will still be written to XML
-        self.blocked = False
-        self.default_value = default_value
-        self.controls = None
-        self.editing = False
+        if name is not None: self.name = name
+        if default_value is not _DefaultArgument: self.default_value = default_value
+
+    @property
+    def _logger(self):
+        # not stored in the instance; logging.getLogger returns the same logger for the same name
+        return logging.getLogger(self.__class__.__name__)
+
     def set_owner(self, owner, attributename=None):
         self.owner = owner
         self.attributename = attributename
@@ -93,12 +104,17 @@ class Property(object):
     def _set_converter(self, value):
         return value
 
+    def get_search_keys(self):
+        "returns the (name, value) pairs to find this property with; see search.py"
+        return ()
+
     def set(self, value, activate=None, deactivate=None, notify=False):
         """set the value of the property (note that the property need not be active)
         updates display if editor is visible; doesn't notify owner or application!
         optionally, the property will be activated or deactivated"""
         self.value = self._set_converter(value)
         self.modified = True
+        search.update(self)
         if activate is None and deactivate is None:
             self.update_display()
             if notify: self._notify()
@@ -145,6 +161,7 @@ class Property(object):
         if active and not self.deactivated: return
         if not active and self.deactivated: return
         self.deactivated = not active
+        search.update(self)
         self.update_display()
         self.activate_controls()
 
@@ -363,6 +380,8 @@ class PropertyRO(Property):
 class SpinProperty(Property):
     # int
     CONTROLNAMES = ["enabler", "spin"]
+    val_range = (0,1000)
+    immediate = False
     def __init__(self, value, val_range=(0,1000), immediate=False, default_value=_DefaultArgument, name=None):
         # val_range: (min_value,max_value)
         if isinstance(val_range, (int,float)):    # we allow val_range to be supplied as integer
@@ -373,8 +392,8 @@ class SpinProperty(Property):
                 val_range = (0,val_range)
             else:
                 val_range = (val_range,0)
-        self.val_range = val_range
-        self.immediate = immediate
+        if val_range!=SpinProperty.val_range: self.val_range = val_range
+        if immediate: self.immediate = immediate
         Property.__init__(self, value, default_value, name)
 
     def _set_converter(self, value):
@@ -708,14 +727,17 @@ class InvCheckBoxProperty(CheckBoxProperty):
 class RadioProperty(Property):
     # choice
     CONTROLNAMES = ["options"]
+    aliases = tooltips = None
+    columns = 1
 
     def __init__(self, value, values, labels=None, columns=1, aliases=None, tooltips=None, default_value=_DefaultArgument,
                  name=None):
         self.values = values    # e.g. a list of ints
-        self.aliases = aliases  # e.g. a list of strings, corresponding to values; these can be set and will be written
+        # e.g. a list of strings, corresponding to values; these can be set and will be written
+        if aliases is not None: self.aliases = aliases
         self.labels = labels or aliases or values
-        self.tooltips = tooltips
-        self.columns = columns
+        if tooltips is not None: self.tooltips = tooltips
+        if columns!=1: self.columns = columns
         Property.__init__(self, value, default_value, name)
 
     def _set_converter(self, value):
@@ -771,12 +793,12 @@ class _CheckListProperty(Property):
     # common base class for Flags and WidgetStyleFlags; keeps self.value_set as a set of strings
     CONTROLNAMES = ["enabler", "_choices"]
     EXCLUDES = None
+    _choices = None
 
     def __init__(self, value, default_value=_DefaultArgument, name=None, names=None, values=None):
         self._names = names
         self._values = values  # these will sometimes only be calculated on demand, especially for WidgetStyle
         self.value_set = self._decode_value(value)
-        self.enabler = self._choices = None
         Property.__init__(self, None, default_value, name) # with value=None, as this is to be calculated on demand only
 
     def _ensure_values(self):
@@ -1085,6 +1107,7 @@ class ManagedFlags(_CheckListProperty):
 
 class WidgetStyleProperty(_CheckListProperty):
     # for widget style flags; XXX handle combinations and exclusions
+    _SHARED = {}  # widget writer -> (styles, names)
     def __init__(self):
         # the value will be set later in set_owner()
         _CheckListProperty.__init__(self, value=0)
@@ -1094,9 +1117,12 @@ class WidgetStyleProperty(_CheckListProperty):
         _CheckListProperty.set_owner(self, owner, attname)
         widget_writer = owner.widget_writer
         self.style_defs = widget_writer.style_defs
-        self.styles = OrderedDict()
-        self.styles["Style"] = widget_writer.style_list
-        self._names = sum( self.styles.values(), [] )
+        if widget_writer not in self._SHARED:
+            # the same for all widgets of a class, so it's stored only once
+            styles = OrderedDict()
+            styles["Style"] = widget_writer.style_list
+            self._SHARED[widget_writer] = (styles, sum( styles.values(), [] ))
+        self.styles, self._names = self._SHARED[widget_writer]
         self._values = None
         self.set(widget_writer.default_style)
         self.default_value = set(self.value_set)
@@ -1218,11 +1244,12 @@ class TextProperty(Property):
     control_re = re.compile( r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]" )  # match ASCII control characters for stripping them
     STRIP = False
     _PROPORTION = 1
+    text = None
+    multiline = strip = fixed_height = False  # defaults for the arguments of __init__; see Property
     def __init__(self, value="", multiline=False, strip=False, default_value=_DefaultArgument, name=None, fixed_height=False):
-        self.multiline = multiline
-        self.text = None
-        self.strip = strip
-        self.fixed_height = fixed_height  # don't grow the edit field in vertical
+        if multiline: self.multiline = multiline
+        if strip: self.strip = strip
+        if fixed_height: self.fixed_height = fixed_height  # don't grow the edit field in vertical
         Property.__init__(self, value, default_value, name)
 
     def _set_converter(self, value):
@@ -1231,6 +1258,10 @@ class TextProperty(Property):
             value = value.strip()
         return value
 
+    def get_search_keys(self):
+        if not self.value or not isinstance(self.value, compat.basestring): return ()
+        return ( (self.name, self.value), )
+
     def get_string_value(self):
         # for XML file writing: escape newline, \\n, tab and \\t
         return self.get_value().replace("\\n", "\\\\n").replace("\n", "\\n").replace("\\t","\\\\t").replace("\t", "\\t")
@@ -1832,9 +1863,9 @@ class ListBoxPropertyD(ListBoxProperty):
 class DialogProperty(TextProperty):
     # for now, this is only a base class for FileName, Color and FontProperty
     CONTROLNAMES = ["enabler", "text"]#, "button"]
+    dialog = button = None
     def __init__(self, value="", multiline=False, strip=True, default_value=_DefaultArgument, name=None):
         TextProperty.__init__(self, value, multiline, strip, default_value, name)
-        self.dialog = self.button = None
     def create_additional_controls(self, panel, sizer, hsizer):
         # used e.g. by DialogProperty to create the button
         self.button = wx.Button(panel, -1, " ... ", size=(40,-1))
@@ -1988,11 +2019,11 @@ class FileNamePropertyD(FileNameProperty):
 
 
 class BitmapProperty(FileNameProperty):
+    _size = _warning = _error = None
     def __init__(self, value="", name=None, min_version=None):
-        self._size = self._warning = self._error = None
         style = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
         FileNameProperty.__init__(self, value, style, "", name)
-        self.min_version = min_version
+        if min_version is not None: self.min_version = min_version
 
     def set_bitmap(self, bmp):
         if bmp is wx.NullBitmap:
@@ -2046,9 +2077,8 @@ class BitmapProperty(FileNameProperty):
 class BitmapPropertyD(BitmapProperty):
     deactivated = True
     def __init__(self, value="", name=None, min_version=None):
-        self._size = self._warning = self._error = None
         style = wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
-        self.min_version = min_version
+        if min_version is not None: self.min_version = min_version
         FileNameProperty.__init__(self, value, style, '', name)
 
 
@@ -2211,6 +2241,11 @@ class FontProperty(DialogProperty):
         if isinstance(value, compat.basestring): value = self._convert_from_text(value)
         return value
 
+    def get_search_keys(self):
+        # the face name
+        if not self.value or len(self.value)<6 or not self.value[5]: return ()
+        return ( (self.name, self.value[5]), )
+
     def _convert_to_text(self, value):
         return self.normalization%tuple(value)
 
@@ -2242,6 +2277,13 @@ class GridProperty(Property):
     _DEFAULT_VALUES = {STRING:"",  INT:0, FLOAT:0.0, BOOL:False}
 
     CONTROLNAMES = ["btn", "buttons", "grid"]
+    # defaults for the arguments of __init__ and the editor state; see Property
+    with_index = immediate = False
+    can_add = can_remove = can_insert = can_remove_last = True
+    col_sizes = ()
+    cur_row = cur_col = 0
+    editing_values = None  # before pressing Apply; stored here because the editor grid might be deleted
+    grid = None
     GROW = True
     _PROPORTION = 5
     validation_res = None # one per column
@@ -2258,20 +2300,15 @@ class GridProperty(Property):
         if default_row is None:
             default_row = [self._DEFAULT_VALUES[col_def[1]] for col_def in cols]
         self.default_row = default_row  # when a row is inserted, these values will be taken
-        self.with_index = with_index # display index; also provide the original indices to the owner when updating value
+        # display index; also provide the original indices to the owner when updating value
+        if with_index: self.with_index = with_index
         self.col_defs = cols
-        self.immediate = immediate  # e.g. for notebook pages immediate is False
-        self.can_add = can_add
-        self.can_remove = can_remove
-        self.can_insert = can_insert
-        self.can_remove_last = can_remove_last
-        if col_sizes is None:
-            self.col_sizes = []
-        else:
-            self.col_sizes = col_sizes
-        self.cur_row = self.cur_col = 0
-        self.editing_values = None # before pressing Apply; stored here because the editor grid might be deleted
-        self.grid = None
+        if immediate: self.immediate = immediate  # e.g. for notebook pages immediate is False
+        if not can_add: self.can_add = can_add
+        if not can_remove: self.can_remove = can_remove
+        if not can_insert: self.can_insert = can_insert
+        if not can_remove_last: self.can_remove_last = can_remove_last
+        if col_sizes: self.col_sizes = col_sizes
         self._initialize_indices()
 
     def _get_default_row(self, index):
@@ -3136,6 +3173,23 @@ class ActionButtonProperty(Property):
 
 ########################################################################################################################
 
+class _PropertyValue(object):
+    """Descriptor to read the value of a property as attribute of the owner, e.g. obj.name.
+    PropertyOwner.add_property installs it on the owner class; without it, each read would go through a failed
+    attribute lookup and PropertyOwner.__getattr__.
+    This is a non-data descriptor, i.e. values in the instance __dict__ still have precedence."""
+    def __init__(self, attname):
+        self.attname = attname
+    def __get__(self, obj, cls=None):
+        if obj is None: return self
+        try:
+            prop = obj.properties[self.attname]
+        except KeyError:
+            # not a property of this instance; PropertyOwner.__getattr__ will raise the AttributeError
+            raise AttributeError(self.attname)
+        return prop.get()
+
+
 class PropertyOwner(object):
     def __init__(self):
         # property handling
@@ -3152,6 +3206,11 @@ class PropertyOwner(object):
         else:
             self.property_names.append(attname)
         prop.set_owner(self, attname)
+        search.update(prop)
+        cls = self.__class__
+        if not hasattr(cls, attname):
+            # for the first instance of the class: fast access without __getattr__
+            setattr(cls, attname, _PropertyValue(attname))
     def __getattr__(self, attr):
         if attr in self.properties:
             # return the value (either the user-provided or the default value)
@@ -6,7 +6,7 @@ Functions to import modules
 @license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
 """
 
-import os, re, sys, zipfile, logging
+import copy, json, os, re, sys, zipfile, logging
 from collections import OrderedDict
 
 import common, config, misc
@@ -36,7 +36,7 @@ def load_widgets_from_dir(widget_dir, submodule='', default_section='not_set'):
 
     # language code generators e.g. perl_codegen
     widgets_filename = os.path.join(widget_dir, 'widgets.txt')
-    module_info = _modulenames_from_file(widgets_filename, default_section)
+    module_info = index.get_module_info(widget_dir, default_section)
 
     if module_info and config.use_gui and not submodule.endswith('_codegen'):
         if submodule:
@@ -48,6 +48,15 @@ def load_widgets_from_dir(widget_dir, submodule='', default_section='not_set'):
         buttons[section] = []
 
         for module_name in module_names:
+            manifest = registry.get_manifest(widget_dir, module_name)
+            if manifest is not None:
+                # the module will be imported on first use; see WidgetRegistry
+                if not submodule:
+                    registry.add(widget_dir, module_name, manifest)
+                    button = registry.make_button(manifest)
+                    if config.use_gui and button: buttons[section].append(button)
+                continue
+
             if submodule:
                 fqmn = "%s.%s" % (module_name, submodule)
             else:
@@ -85,6 +94,321 @@ def load_widgets_from_dir(widget_dir, submodule='', default_section='not_set'):
     return buttons
 
 
+class PluginIndex(object):
+    """Cache of the plugin layout: the content of widgets.txt, the manifests, the ZIP files and their validity and the
+    code generator modules. It's stored in the application data directory, so repeated launches don't need to scan the
+    directories, read the files and check the ZIP files.
+
+    The cached data of a directory is used if the modification times of the directory, of its widgets.txt, of the
+    manifests and of the ZIP files did not change; i.e. after adding, removing, replacing or editing files. The whole
+    index is discarded if the wxGlade version changes."""
+
+    filename = "plugin_index.json"
+
+    def __init__(self):
+        self.directories = None  # directory -> dict; see _scan_directory(); None until loaded
+        self.modified = False
+        self._validated = set()  # directories that have been checked against the file system in this session
+
+    def _get_filename(self):
+        return os.path.join(config.appdata_path, self.filename)
+
+    def _load(self):
+        self.directories = {}
+        filename = self._get_filename()
+        if not config.appdata_path or not os.path.isfile(filename): return
+        try:
+            with open(filename) as f:
+                data = json.load(f)
+        except (EnvironmentError, ValueError) as inst:
+            logging.debug( _("Can't read file %s file: %s"), filename, inst )
+            return
+        if data.get("version")==config.version:
+            self.directories = data.get("directories", {})
+
+    def save(self):
+        "write the index if it was modified"
+        if not self.modified or not config.appdata_path or config.testing: return
+        filename = self._get_filename()
+        try:
+            with open(filename, "w") as f:
+                json.dump({"version":config.version, "directories":self.directories}, f, indent=1, sort_keys=True)
+            self.modified = False
+        except EnvironmentError as inst:
+            logging.warning( _("Can't write file %s file: %s"), filename, inst )
+
+    @staticmethod
+    def _get_mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _get_stamp(self, directory, filenames=()):
+        return [self._get_mtime(directory)] + [self._get_mtime(os.path.join(directory, fn)) for fn in filenames]
+
+    def _is_outdated(self, entry, directory, filenames):
+        if self._get_stamp(directory, filenames)!=entry["stamp"]: return True
+        # the files read by the scan; a missing file has the modification time None, so adding one is detected
+        for fn, mtime, valid in entry.get("zips", {}).values():
+            if self._get_mtime(fn)!=mtime: return True
+        for fn, mtime in entry.get("manifest_files", []):
+            if self._get_mtime(fn)!=mtime: return True
+        return False
+
+    def _get_directory(self, directory, scan, filenames=()):
+        "returns the cached data for the directory; scan() is called to create it if the cache is missing or outdated"
+        if self.directories is None: self._load()
+        entry = self.directories.get(directory)
+        if directory not in self._validated:
+            self._validated.add(directory)
+            if entry is not None and self._is_outdated(entry, directory, filenames):
+                entry = None
+            if entry is None:
+                entry = scan()
+                entry["stamp"] = self._get_stamp(directory, filenames)
+                self.directories[directory] = entry
+                self.modified = True
+        return entry
+
+    # widget directories ###############################################################################################
+    def _get_widget_directory(self, widget_dir):
+        return self._get_directory(widget_dir, lambda: self._scan_widget_directory(widget_dir), ["widgets.txt"])
+
+    def _scan_widget_directory(self, widget_dir):
+        sections = _modulenames_from_file(os.path.join(widget_dir, 'widgets.txt'), None)
+        hotkeys = dict( (hotkey, section) for hotkey, section in misc.palette_hotkeys.items()
+                        if section in sections )
+        manifests = {}
+        manifest_files = []
+        zips = {}
+        for module_names in sections.values():
+            for module_name in module_names:
+                filename = os.path.join(widget_dir, module_name, WidgetRegistry.manifest_filename)
+                manifest_files.append( [filename, self._get_mtime(filename)] )
+                manifests[module_name] = WidgetRegistry._read_manifest(filename)
+                zip_filename = os.path.join(widget_dir, '%s.zip' % module_name)
+                if os.path.exists(zip_filename):
+                    zips[module_name] = [zip_filename, self._get_mtime(zip_filename),
+                                         is_valid_zip(zip_filename, module_name)]
+        return {"sections":list(sections.items()), "hotkeys":hotkeys, "manifests":manifests,
+                "manifest_files":manifest_files, "zips":zips}
+
+    def get_module_info(self, widget_dir, default_section):
+        """returns OrderedDict with module sections as key and assigned list of module names from widgets.txt;
+        see _modulenames_from_file()"""
+        entry = self._get_widget_directory(widget_dir)
+        misc.palette_hotkeys.update(entry["hotkeys"])
+        return OrderedDict( (section or default_section, module_names) for section, module_names in entry["sections"] )
+
+    def get_manifest(self, widget_dir, module_name):
+        "returns the manifest of a module listed in widgets.txt; see WidgetRegistry.get_manifest()"
+        manifests = self._get_widget_directory(widget_dir)["manifests"]
+        if module_name in manifests:
+            return manifests[module_name]
+        return WidgetRegistry._read_manifest( os.path.join(widget_dir, module_name, WidgetRegistry.manifest_filename) )
+
+    def get_zip(self, widget_dir, module_name):
+        "returns the name of the ZIP file for the module, or None, and whether it's valid"
+        zips = self._get_widget_directory(widget_dir)["zips"]
+        if module_name in zips:
+            zip_filename, mtime, valid = zips[module_name]
+            return zip_filename, valid
+        if module_name in self._get_widget_directory(widget_dir)["manifests"]:
+            return None, False  # module from widgets.txt: no ZIP file at the time of the scan
+        zip_filename = os.path.join(widget_dir, '%s.zip' % module_name)
+        if not os.path.exists(zip_filename): return None, False
+        return zip_filename, is_valid_zip(zip_filename, module_name)
+
+    # code generators ##################################################################################################
+    def get_codegen_modules(self, codegen_path):
+        "returns the file names of the code generator modules"
+        return self._get_directory(codegen_path, lambda: self._scan_codegen_directory(codegen_path))["modules"]
+
+    def _scan_codegen_directory(self, codegen_path):
+        modules = []
+        for module in sorted(os.listdir(codegen_path)):
+            name, ext = os.path.splitext(module)
+            # skip __init__
+            if name == "__init__":
+                continue
+            # allow regular files only
+            if not os.path.isfile(os.path.join(codegen_path, module)):
+                continue
+            # ignore none python files
+            if ext not in ['.py', '.pyo', '.pyc']:
+                continue
+            modules.append(module)
+        return {"modules":modules}
+
+index = PluginIndex()
+
+
+class WidgetRegistry(object):
+    """Widget modules with a file manifest.txt are not imported at startup.
+
+    The manifest lists the bases (e.g. EditButton) and classes (e.g. wxButton) provided by the module, the modules it
+    requires and the palette button. The module with its wconfig and all code generators is imported and initialised
+    when one of its bases or classes is looked up the first time in one of the LazyDict instances, i.e. in
+    common.widgets, common.widgets_from_xml, common.widget_classes, common.class_names or the obj_builders of the code
+    writers. This happens when a project is loaded or when a widget is added from the palette.
+
+    Widget modules without manifest, e.g. from ZIP files, are imported at startup."""
+
+    manifest_filename = "manifest.txt"
+
+    def __init__(self):
+        self.manifests = {}  # (widget_dir, module_name) -> manifest dict or None
+        self.pending = {}    # base or class name -> list of (widget_dir, module_name) that are not yet loaded
+        self.modules = OrderedDict()  # (widget_dir, module_name) -> True if loaded
+        self.loading = 0     # > 0 while modules are being imported
+
+    def get_manifest(self, widget_dir, module_name):
+        "returns the manifest as dict with lists as values or None if the module has no manifest"
+        key = (widget_dir, module_name)
+        if key not in self.manifests:
+            self.manifests[key] = index.get_manifest(widget_dir, module_name)
+        return self.manifests[key]
+
+    @staticmethod
+    def _read_manifest(filename):
+        if not os.path.isfile(filename): return None
+        ret = {}
+        try:
+            with open(filename) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"): continue
+                    key, value = line.split("=", 1)
+                    ret[key.strip()] = value.strip()
+        except (EnvironmentError, ValueError) as inst:
+            logging.warning( _("Can't read file %s file: %s"), filename, inst )
+            return None
+        for key in ("bases", "classes", "requires", "button"):
+            ret[key] = ret.get(key, "").split()
+        return ret
+
+    def add(self, widget_dir, module_name, manifest):
+        key = (widget_dir, module_name)
+        if key in self.modules: return
+        self.modules[key] = False
+        for name in manifest["bases"] + manifest["classes"]:
+            self.pending.setdefault(name, []).append(key)
+
+    def make_button(self, manifest):
+        "create the palette button from the manifest"
+        if not manifest["button"]: return None
+        base, icon = manifest["button"]
+        return common.make_object_button(base, icon, manifest.get("toplevel")=="1", manifest.get("tip"))
+
+    def load(self, name):
+        "import the modules providing name (base or class name); returns True if a module was imported"
+        keys = self.pending.pop(name, None)
+        if not keys: return False
+        for widget_dir, module_name in keys:
+            self.load_module(widget_dir, module_name)
+        return True
+
+    def load_all(self):
+        "import all modules that were not yet used"
+        for widget_dir, module_name in list(self.modules.keys()):
+            self.load_module(widget_dir, module_name)
+
+    def load_module(self, widget_dir, module_name):
+        key = (widget_dir, module_name)
+        if self.modules.get(key, True): return  # loaded already or unknown
+        self.modules[key] = True
+        manifest = self.get_manifest(widget_dir, module_name)
+        for name in manifest["bases"] + manifest["classes"]:
+            keys = self.pending.get(name)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys: del self.pending[name]
+        for required in manifest["requires"]:
+            self.load_module(widget_dir, required)
+
+        self.loading += 1
+        try:
+            # same steps as in load_widgets_from_dir, but the palette button has been created already
+            wconfig = import_module(widget_dir, "%s.wconfig" % module_name)
+            if wconfig: _process_widget_config(wconfig)
+
+            module = import_module(widget_dir, module_name)
+            if not module: return  # error already logged
+            if hasattr(module, 'initialize'):
+                module.initialize()
+            elif not _init_codegen_gui(widget_dir, module_name)[0]:
+                return
+
+            for lang in ['perl', 'lisp']:
+                if lang not in common.code_writers: continue
+                codegen_name = '%s.%s_codegen' % (module_name, common.code_writers[lang].lang_prefix)
+                codegen_module = import_module(widget_dir, codegen_name)
+                if codegen_module and hasattr(codegen_module, 'initialize'):
+                    codegen_module.initialize()
+        finally:
+            self.loading -= 1
+        logging.debug(_('Widget %s imported'), module_name)
+
+registry = WidgetRegistry()
+
+
+class LazyDict(dict):
+    """Dictionary for widget classes, builders and code generators:
+    on lookup of a missing key, the widget modules providing it are imported; see WidgetRegistry.
+    Iterating over keys, values or items imports all modules."""
+    _source = None  # for deep copies: the original instance, as modules register with this one, and the memo dict
+
+    def __missing__(self, key):
+        if registry.load(key) and dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        if self._source is not None and key in self._source[0]:
+            source, memo = self._source
+            value = copy.deepcopy(source[key], memo)
+            dict.__setitem__(self, key, value)
+            return value
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key): return True
+        try:
+            self.__missing__(key)
+        except KeyError:
+            return False
+        return True
+    has_key = __contains__
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        registry.load_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        registry.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        registry.load_all()
+        return dict.values(self)
+
+    def items(self):
+        registry.load_all()
+        return dict.items(self)
+
+    def __deepcopy__(self, memo):
+        ret = self.__class__()
+        memo[id(self)] = ret
+        for key, value in dict.items(self):
+            dict.__setitem__( ret, copy.deepcopy(key, memo), copy.deepcopy(value, memo) )
+        ret._source = (self, memo)
+        return ret
+
+
 def _modulenames_from_file(filename, default_section):
     """Return OrderedDict with module sections as key and assigned list of module names read from given file.
 
@@ -212,17 +536,15 @@ def import_module(widget_dir, module_name):
 
     if widget_dir not in sys.path: sys.path.append(widget_dir)
 
-    zip_filename = os.path.join(widget_dir, '%s.zip' % basemodule)
-    if os.path.exists(zip_filename):
+    zip_filename, valid = index.get_zip(widget_dir, basemodule)
+    if zip_filename:
         # check ZIP file formally
-        if not is_valid_zip(zip_filename, basemodule):
+        if not valid:
             logging.warning( _('ZIP file %s is not a valid ZIP file. Ignoring it.'), zip_filename )
             zip_filename = None
         else:
             # add module temporarily to search path
             sys.path.insert(0, zip_filename)
-    else:
-        zip_filename = None
 
     # import module
     try:
@@ -148,6 +148,10 @@ class wxGladePreferencesUI(wx.Dialog):
         self.write_generated_from = wx.CheckBox(self.notebook_1_pane_2, wx.ID_ANY, _("Insert .wxg file name on generated source files"))
         sizer_5.Add(self.write_generated_from, 0, wx.ALL | wx.EXPAND, 5)
         
+        self.profile = wx.CheckBox(self.notebook_1_pane_2, wx.ID_ANY, _("Profile loading, code generation and saving"))
+        self.profile.SetToolTipString(_("Write cProfile and tracemalloc statistics to the directory 'profiles' in the application data directory"))
+        sizer_5.Add(self.profile, 0, wx.ALL | wx.EXPAND, 5)
+        
         self.wxg_backup = wx.CheckBox(self.notebook_1_pane_2, wx.ID_ANY, _("Create backup wxg files"))
         self.wxg_backup.SetValue(1)
         sizer_5.Add(self.wxg_backup, 0, wx.ALL | wx.EXPAND, 5)
@@ -70,6 +70,7 @@ class wxGladePreferences(wxGladePreferencesUI):
             self.show_completion.SetValue(self.preferences.show_completion)
             self.write_timestamp.SetValue(self.preferences.write_timestamp)
             self.write_generated_from.SetValue( self.preferences.write_generated_from )
+            self.profile.SetValue( self.preferences.profile )
             self._fix_spin_ctrls()
         except Exception as inst:
             bugdialog.Show(_('Read Configuration'), inst)
@@ -130,6 +131,7 @@ class wxGladePreferences(wxGladePreferencesUI):
 
         prefs['write_timestamp'] = self.write_timestamp.GetValue()
         prefs['write_generated_from'] = self.write_generated_from.GetValue()
+        prefs['profile'] = self.profile.GetValue()
 
     def on_widget_path(self, event):
         "Create a file choice dialog"
@@ -0,0 +1,141 @@
+"""\
+Optional profiling of loading, code generation and saving
+
+Profiling is activated by the command line options --profile=DIR and --memprofile or by the preferences setting
+'profile'. For each profiled phase, a file <phase>-<timestamp>.pstats with the cProfile statistics is written.
+With memory profiling, a file <phase>-<timestamp>-memory.txt with the top allocations of the phase is written as well.
+These files can be attached to bug reports.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import cProfile, logging, os, time
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # Python 2
+
+import config
+
+
+directory = None  # output directory, if activated from the command line; see enable()
+memory = False    # take tracemalloc snapshots as well
+top_n = 25        # number of entries in the memory statistics
+
+_active = None    # the currently active _Profile; phases are not nested
+
+
+def enable(output_directory=None, memprofile=False):
+    """Activate profiling from the command line.
+
+    output_directory: directory for the output files; default is <appdata>/profiles
+    memprofile: take tracemalloc snapshots as well"""
+    global directory, memory
+    directory = output_directory or os.path.join(config.appdata_path, "profiles")
+    memory = memprofile
+    if memory and tracemalloc is None:
+        logging.warning( _("Memory profiling requires Python 3.4 or later") )
+        memory = False
+
+
+def _get_settings():
+    # returns output directory and memory flag; the command line has precedence over the preferences
+    if directory:
+        return directory, memory
+    if config.use_gui and config.preferences is not None and config.preferences.profile:
+        return os.path.join(config.appdata_path, "profiles"), tracemalloc is not None
+    return None, False
+
+
+class _Profile(object):
+    "Context manager to profile the enclosed block and write the results"
+
+    def __init__(self, phase, output_directory, memprofile):
+        self.phase = phase
+        self.directory = output_directory
+        self.memory = memprofile
+
+    def __enter__(self):
+        global _active
+        _active = self
+        self._stop_tracing = False
+        self._snapshot = None
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._stop_tracing = True
+            else:
+                self._snapshot = tracemalloc.take_snapshot()
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *args):
+        global _active
+        self.profile.disable()
+        _active = None
+        snapshot = tracemalloc.take_snapshot() if self.memory else None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            now = time.time()
+            basename = "%s-%s-%03d" % (self.phase, time.strftime("%Y%m%d-%H%M%S", time.localtime(now)),
+                                       int(now*1000)%1000)
+            basename = os.path.join(self.directory, basename)
+            self.profile.dump_stats(basename + ".pstats")
+            logging.info( _('Profile of "%s" written to %s'), self.phase, basename + ".pstats" )
+            if self.memory:
+                self._write_memory_statistics(basename + "-memory.txt", snapshot)
+        except EnvironmentError as inst:
+            logging.warning( _('Could not write profile of "%s": %s'), self.phase, inst )
+        finally:
+            if self._stop_tracing:
+                tracemalloc.stop()
+
+    def _write_memory_statistics(self, filename, snapshot):
+        snapshot = snapshot.filter_traces( (tracemalloc.Filter(False, tracemalloc.__file__),
+                                            tracemalloc.Filter(False, cProfile.__file__),
+                                            tracemalloc.Filter(False, "<frozen importlib._bootstrap>")) )
+        if self._snapshot is not None:
+            # tracing was active already: report the difference
+            statistics = snapshot.compare_to(self._snapshot, "lineno")
+        else:
+            statistics = snapshot.statistics("lineno")
+        current, peak = tracemalloc.get_traced_memory()
+        with open(filename, "w") as f:
+            f.write("Phase: %s\n" % self.phase)
+            f.write("Traced memory: current %.1f kB, peak %.1f kB\n" % (current/1024.0, peak/1024.0))
+            f.write("Top %d allocations:\n" % top_n)
+            for stat in statistics[:top_n]:
+                f.write("%s\n" % stat)
+        logging.info( _('Memory statistics of "%s" written to %s'), self.phase, filename )
+
+
+class _DummyProfile(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+_dummy_profile = _DummyProfile()
+
+
+def profile(phase):
+    "Returns a context manager that profiles the enclosed block if profiling is active"
+    if _active is not None: return _dummy_profile  # nested phase: covered by the outer one
+    output_directory, memprofile = _get_settings()
+    if not output_directory: return _dummy_profile
+    return _Profile(phase, output_directory, memprofile)
+
+
+def profiled(phase):
+    "Decorator to profile a function or method as phase"
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            with profile(phase):
+                return func(*args, **kwargs)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+    return decorator
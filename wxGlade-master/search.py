@@ -0,0 +1,185 @@
+"""\
+Inverted index of property values for project-wide search and replace; see command line option --find and
+Edit -> Find / Replace... in the main window
+
+While active, every property is registered under the (name, value) keys returned by its get_search_keys() method,
+e.g. a text property 'label' under ("label", "OK") or an event handler under ("handler", "OnSave") and
+("EVT_BUTTON", "OnSave"). The keys are updated from Property.set() and Property.set_active(), i.e. when loading, when
+editing in the property editor and on undo. So a query is a dictionary lookup instead of a walk through all
+properties of the project.
+
+The functions of this module do nothing until start() has been called, so the hooks can stay in place.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import fnmatch, re
+
+import common, depfile
+
+
+_current = None  # the active PropertyIndex instance; see start()
+
+_query_re = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$")
+
+
+class PropertyIndex(object):
+    def __init__(self):
+        self._keys = {}        # property -> frozenset of (name, value) keys
+        self._properties = {}  # (name, value) key -> set of properties
+
+    def update(self, prop):
+        "re-calculate the keys of prop; also for values that were modified in place"
+        self._set_keys( prop, _get_keys(prop) )
+
+    def remove_owner(self, owner):
+        for prop in owner.properties.values():
+            self._set_keys(prop, frozenset())
+
+    def _set_keys(self, prop, keys):
+        old = self._keys.get(prop, frozenset())
+        if keys==old: return
+        for key in old - keys:
+            properties = self._properties[key]
+            properties.discard(prop)
+            if not properties: del self._properties[key]
+        for key in keys - old:
+            self._properties.setdefault(key, set()).add(prop)
+        if keys:
+            self._keys[prop] = keys
+        else:
+            del self._keys[prop]
+
+    def find(self, name, value):
+        "returns the set of properties with a matching key; see find() for the arguments"
+        if name is not None and not _is_pattern(value):
+            return set( self._properties.get((name, value), ()) )
+        ret = set()
+        for key, properties in self._properties.items():
+            if _matches(key, name, value): ret.update(properties)
+        return ret
+
+
+def _get_keys(prop):
+    if prop.deactivated or getattr(prop.owner, "IS_ROOT", True):
+        return frozenset()  # not active, a property of the Application or not of a widget
+    return frozenset( prop.get_search_keys() )
+
+
+def _is_pattern(value):
+    return "*" in value or "?" in value
+
+
+def _matches(key, name, value):
+    if name is not None and key[0]!=name: return False
+    if _is_pattern(value): return fnmatch.fnmatchcase(key[1], value)
+    return key[1]==value
+
+
+def get_tree_position(widget):
+    # returns a tuple of indices for sorting in tree order or None if the widget is not part of the project any more
+    ret = []
+    item = widget
+    while not item.IS_ROOT:
+        parent = getattr(item, "parent", None)
+        if parent is None: return None
+        try:
+            ret.append( parent._get_child_pos(item) )
+        except ValueError:
+            return None
+        item = parent
+    if item is not common.root: return None
+    ret.reverse()
+    return tuple(ret)
+
+
+def start():
+    "start indexing; the widgets of common.root are indexed immediately"
+    global _current
+    _current = PropertyIndex()
+    if common.root is not None:
+        for widget in depfile.iter_widgets(common.root):
+            for prop in widget.properties.values():
+                _current.update(prop)
+    return _current
+
+
+def stop():
+    global _current
+    _current = None
+
+
+def active():
+    return _current is not None
+
+
+def update(prop):
+    "called when the value or the activation of a property has been modified"
+    if _current is not None:
+        _current.update(prop)
+
+
+def remove_owner(owner):
+    "called when a widget is deleted"
+    if _current is not None:
+        _current.remove_owner(owner)
+
+
+def parse_query(query):
+    """split a query like "handler=OnSave" into name and value; for a query without name, e.g. "OnSave",
+    the name is None"""
+    match = _query_re.match(query)
+    if match: return match.groups()
+    return None, query
+
+
+def find(name, value):
+    """returns a list of (widget, property, name, value) for the property values matching name and value, in tree
+    order; name None matches any property name and value may contain the wildcards * and ?"""
+    if _current is None: return []
+    found = []
+    for prop in _current.find(name, value):
+        position = get_tree_position(prop.owner)
+        if position is None: continue
+        values = set()
+        for key in prop.get_search_keys():
+            # the keys are checked again, as a value might have been set temporarily without Property.set()
+            if key[1] in values or not _matches(key, name, value): continue
+            values.add(key[1])
+            found.append( (position, prop.owner.property_names.index(prop.name), len(found),
+                           (prop.owner, prop, key[0], key[1])) )
+    found.sort()
+    return [item[-1] for item in found]
+
+
+def replace(name, value, new_value):
+    """replace the matching values like the user would do in the property editor, i.e. with history and notification;
+    for event handlers and fonts only the handler or the face name is replaced; returns the number of replacements"""
+    count = 0
+    done = set()
+    for widget, prop, key_name, key_value in find(name, value):
+        if prop in done: continue
+        done.add(prop)
+        count += _replace(prop, name, value, new_value)
+    return count
+
+
+def _replace(prop, name, value, new_value):
+    import new_properties as np
+    if isinstance(prop, np.GridProperty):
+        # event handlers
+        rows = [row[:] for row in prop.value]
+        count = 0
+        for row in rows:
+            if not row[1]: continue
+            if name not in (None, "handler") and name!=row[0]: continue
+            if not _matches((row[0], row[1]), None, value): continue
+            row[1] = new_value
+            count += 1
+        if count: prop.on_value_edited(rows)
+        return count
+    if isinstance(prop, np.FontProperty):
+        new_value = tuple(prop.value[:5]) + (new_value,)
+    elif not prop.check(new_value):
+        return 0
+    return 1 if prop._check_for_user_modification(new_value) else 0
@@ -0,0 +1,86 @@
+"""Modeless dialog to search and replace property values in the whole project; see search.py
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import wx
+import common, compat, misc, search
+
+
+class SearchDialog(wx.Dialog):
+    def __init__(self, parent):
+        wx.Dialog.__init__(self, parent, -1, _("Find / Replace"), style=wx.DEFAULT_DIALOG_STYLE|wx.RESIZE_BORDER)
+        self.results = []  # (widget, property, name, value) as returned by search.find()
+
+        self.query = wx.TextCtrl(self, -1, style=wx.TE_PROCESS_ENTER)
+        compat.SetToolTip(self.query, _("Property name and value, e.g. handler=OnSave or label=Cancel\n"
+                                        "Without name, all properties are searched; * and ? are wildcards."))
+        self.replacement = wx.TextCtrl(self, -1)
+        compat.SetToolTip(self.replacement, _("New value; for event handlers and fonts the handler or face name"))
+        self.list = wx.ListCtrl(self, -1, size=(520, 260), style=wx.LC_REPORT|wx.LC_SINGLE_SEL)
+        for col, (label, width) in enumerate( [(_("Widget"), 260), (_("Property"), 110), (_("Value"), 150)] ):
+            self.list.InsertColumn(col, label, width=width)
+
+        find_button = wx.Button(self, wx.ID_FIND)
+        find_button.SetDefault()
+        self.replace_button = wx.Button(self, wx.ID_REPLACE_ALL)
+        self.replace_button.Disable()
+        close_button = wx.Button(self, wx.ID_CLOSE)
+
+        # layout
+        grid = wx.FlexGridSizer(2, 2, 3, 3)
+        grid.AddGrowableCol(1)
+        grid.Add(wx.StaticText(self, -1, _("Find")), 0, wx.ALIGN_CENTRE_VERTICAL)
+        grid.Add(self.query, 1, wx.EXPAND)
+        grid.Add(wx.StaticText(self, -1, _("Replace with")), 0, wx.ALIGN_CENTRE_VERTICAL)
+        grid.Add(self.replacement, 1, wx.EXPAND)
+        btnbox = wx.BoxSizer(wx.HORIZONTAL)
+        btnbox.Add(find_button, 0, wx.ALL, 3)
+        btnbox.Add(self.replace_button, 0, wx.ALL, 3)
+        btnbox.AddStretchSpacer()
+        btnbox.Add(close_button, 0, wx.ALL, 3)
+        szr = wx.BoxSizer(wx.VERTICAL)
+        szr.Add(grid, 0, wx.EXPAND|wx.ALL, 5)
+        szr.Add(self.list, 1, wx.EXPAND|wx.LEFT|wx.RIGHT, 5)
+        szr.Add(btnbox, 0, wx.EXPAND|wx.ALL, 5)
+        self.SetSizer(szr)
+        szr.Fit(self)
+
+        self.query.Bind(wx.EVT_TEXT_ENTER, self.on_find)
+        find_button.Bind(wx.EVT_BUTTON, self.on_find)
+        self.replace_button.Bind(wx.EVT_BUTTON, self.on_replace)
+        close_button.Bind(wx.EVT_BUTTON, self.on_close)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.list.Bind(wx.EVT_LIST_ITEM_SELECTED, self.on_select)
+
+    def find(self):
+        "run the query and display the results"
+        query = self.query.GetValue().strip()
+        self.results = search.find(*search.parse_query(query))  if query else  []
+        self.list.DeleteAllItems()
+        for i, (widget, prop, name, value) in enumerate(self.results):
+            compat.ListCtrl_InsertStringItem(self.list, i, "/".join(widget.get_path()))
+            compat.ListCtrl_SetStringItem(self.list, i, 1, name)
+            compat.ListCtrl_SetStringItem(self.list, i, 2, value.replace("\n", "\\n"))
+        self.replace_button.Enable( bool(self.results) )
+        common.main.user_message( _("%d matches") % len(self.results) )
+
+    def on_find(self, event):
+        self.find()
+
+    def on_replace(self, event):
+        name, value = search.parse_query( self.query.GetValue().strip() )
+        count = search.replace( name, value, self.replacement.GetValue() )
+        self.find()
+        common.main.user_message( _("%d values replaced") % count )
+
+    def on_select(self, event):
+        index = event.GetIndex()
+        if index<0 or index>=len(self.results): return
+        widget = self.results[index][0]
+        if search.get_tree_position(widget) is None: return  # deleted in the meantime
+        misc.set_focused_widget(widget)
+
+    def on_close(self, event):
+        # keep the dialog with the last query and results
+        self.Hide()
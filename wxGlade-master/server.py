@@ -0,0 +1,511 @@
+"""\
+Code generation server for IDE and build integration; see command line option --server
+
+The server keeps the code writers and widget plugins loaded and speaks JSON-RPC 2.0 on stdin/stdout or on a Unix
+domain socket. Each request and each response is one line of JSON.
+
+Methods:
+  generate(project, language, out_path=None, only=None)
+      load the .wxg file project and generate code; only: optional list of toplevel names (multi-file mode only)
+  check(project, language=None)
+      load the .wxg file and check that code generators are available for all widgets
+  stats()
+      number of requests and processing times of the server
+  shutdown()
+      stop the server after the pending requests
+
+Requests are executed by a pool of worker processes, each with its own loaded wxGlade. Requests for the same project
+are executed one after the other, in the order they were received; others are executed concurrently.
+
+Client is a minimal client for testing and scripting:
+  with server.Client() as client:   # starts "wxglade.py --server" as sub-process
+      print( client.call("generate", project="/path/to/app.wxg", language="python") )
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import inspect, json, logging, multiprocessing, os, socket, stat, subprocess, sys, threading, time
+from collections import OrderedDict, deque
+
+import common, compat, config, stats
+
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+PROJECT_ERROR = -32000  # project could not be loaded or code generation failed
+
+
+class RequestError(Exception):
+    def __init__(self, code, message, data=None):
+        Exception.__init__(self, message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class _LogCapture(logging.Handler):
+    "Collects the warnings and errors that are logged while processing a request"
+
+    def __init__(self):
+        logging.Handler.__init__(self, logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        try:
+            self.messages.append( {"level":record.levelname, "message":record.getMessage()} )
+        except Exception:
+            self.handleError(record)
+
+    def __enter__(self):
+        logging.getLogger().addHandler(self)
+        return self
+
+    def __exit__(self, *args):
+        logging.getLogger().removeHandler(self)
+
+    @property
+    def failed(self):
+        return any(message["level"] in ("ERROR", "CRITICAL") for message in self.messages)
+
+
+########################################################################################################################
+# request processing inside the worker processes
+
+def _init_worker():
+    # with the "fork" start method, the worker has inherited the initialised state of the server process already
+    if common.code_writers: return
+    import log, wxglade
+    common.init_paths(None)
+    log.init(filename=None, level="WARNING")
+    sys.path.insert(0, config.wxglade_path)
+    sys.path.insert(1, config.widgets_path)
+    wxglade.init_stage2(False)
+
+
+def _load(project, capture):
+    import application, wxglade
+    if not os.path.isfile(project):
+        raise RequestError(INVALID_PARAMS, 'Project file "%s" does not exist' % project)
+    common.root = application.Application()
+    if not wxglade._guiless_open_app(project):
+        raise RequestError(PROJECT_ERROR, 'Could not load project "%s"' % project, capture.messages)
+    return common.root
+
+
+def _check_language(language):
+    if language not in common.code_writers:
+        raise RequestError(INVALID_PARAMS, 'Code writer for "%s" is not available' % language)
+
+
+def generate(project, language, out_path=None, only=None):
+    _check_language(language)
+    stats.start("json")
+    try:
+        with _LogCapture() as capture:
+            app = _load(project, capture)
+            widgets = None
+            if only:
+                if not app.multiple_files:
+                    raise RequestError(INVALID_PARAMS, '"only" requires a project in multi-file mode')
+                toplevels = dict( (c.name, c) for c in app.children )
+                unknown = [name for name in only if name not in toplevels]
+                if unknown:
+                    raise RequestError(INVALID_PARAMS, "Unknown toplevel windows: %s" % ", ".join(unknown))
+                widgets = [toplevels[name] for name in only]
+            app.properties["language"].set(language)
+            if out_path:
+                out_path = os.path.abspath(out_path)
+            if widgets is None:
+                app.generate_code(out_path=out_path)
+            else:
+                for widget in widgets:
+                    app.generate_code(out_path=out_path, widget=widget)
+        if capture.failed:
+            raise RequestError(PROJECT_ERROR, "Code generation failed", capture.messages)
+        return OrderedDict( [("messages", capture.messages), ("stats", stats.as_dict())] )
+    finally:
+        stats.stop()
+
+
+def check(project, language=None):
+    languages = [language] if language else sorted(common.code_writers)
+    for language in languages:
+        _check_language(language)
+    with _LogCapture() as capture:
+        app = _load(project, capture)
+
+    def check_rec(obj, problems):
+        if obj.IS_SLOT: return
+        if not obj.IS_ROOT:
+            cname = common.class_names.get(obj.__class__.__name__, obj.WX_CLASS)
+            for language in languages:
+                builders = common.code_writers[language].obj_builders
+                if language=="XRC":
+                    # widgets without builder are written by DefaultXrcObject
+                    ok = builders.get(cname, None) is not common.code_writers["XRC"].NotImplementedXrcObject
+                else:
+                    ok = cname in builders
+                if not ok:
+                    problems.append( {"level":"WARNING", "message":"No %s code generator for %s (of type %s)" % (
+                                                                   language, obj.name, cname)} )
+        for c in obj.get_all_children():
+            if c is not None: check_rec(c, problems)
+
+    problems = []
+    check_rec(app, problems)
+    messages = capture.messages + problems
+    toplevels = [OrderedDict( [("name",c.name), ("class",c.klass), ("base",c.WX_CLASS)] ) for c in app.children]
+    return OrderedDict( [("ok", not messages), ("messages", messages), ("toplevels", toplevels)] )
+
+
+_worker_methods = {"generate":generate, "check":check}
+
+
+def _run(method, params):
+    "executed in a worker process; returns ('result', value) or ('error', code, message, data)"
+    try:
+        func = _worker_methods[method]
+        args, kwargs = ([], params)  if isinstance(params, dict) else  (params, {})
+        try:
+            inspect.getcallargs(func, *args, **kwargs)
+        except TypeError as inst:
+            raise RequestError(INVALID_PARAMS, str(inst))
+        return ("result", func(*args, **kwargs))
+    except RequestError as inst:
+        return ("error", inst.code, inst.message, inst.data)
+    except Exception as inst:
+        if config.debugging: raise
+        logging.exception( _('Internal Error') )
+        return ("error", INTERNAL_ERROR, "%s: %s" % (inst.__class__.__name__, inst), None)
+
+
+########################################################################################################################
+# server
+
+class Server(object):
+    "Reads requests from connections, dispatches them to the worker pool and writes the responses"
+
+    def __init__(self, workers=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.pool = None
+        self.lock = threading.Lock()
+        self.busy = {}      # project -> deque of waiting (connection, request id, method, params)
+        self.pending = 0    # number of submitted requests without response
+        self.idle = threading.Condition(self.lock)
+        self.running = True
+        self.start_time = time.time()
+        self.requests = OrderedDict()  # method -> OrderedDict with number of requests, errors and seconds
+        self.counters = OrderedDict()  # sum of the counters of all code generation requests
+
+    def start(self):
+        self.pool = multiprocessing.Pool(self.workers, _init_worker)
+        logging.info( _("Code generation server started with %d worker processes"), self.workers )
+
+    def stop(self):
+        with self.lock:
+            while self.pending:
+                self.idle.wait()
+        self.pool.close()
+        self.pool.join()
+
+    def handle_line(self, connection, line):
+        "handle a line received from a connection"
+        line = line.strip()
+        if not line: return
+        try:
+            request = json.loads(line)
+        except ValueError as inst:
+            connection.send_error(None, PARSE_ERROR, "Parse error: %s" % inst)
+            return
+        if isinstance(request, list):
+            # batches are processed as individual requests; the responses are not combined into a list
+            if not request:
+                connection.send_error(None, INVALID_REQUEST, "Empty batch")
+            for r in request:
+                self.handle_request(connection, r)
+        else:
+            self.handle_request(connection, request)
+
+    def handle_request(self, connection, request):
+        if not isinstance(request, dict) or request.get("jsonrpc")!="2.0" or \
+                not isinstance(request.get("method"), compat.basestring):
+            connection.send_error(request.get("id") if isinstance(request, dict) else None,
+                                  INVALID_REQUEST, "Invalid request")
+            return
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params", {})
+        if not isinstance(params, (dict, list)):
+            connection.send_error(request_id, INVALID_PARAMS, "params must be an object or an array")
+            return
+
+        if method=="stats":
+            self._respond(connection, request_id, method, time.time(), ("result", self.get_stats()))
+        elif method=="shutdown":
+            self.running = False
+            self._respond(connection, request_id, method, time.time(), ("result", None))
+        elif method not in _worker_methods:
+            connection.send_error(request_id, METHOD_NOT_FOUND, 'Method "%s" not found' % method)
+        else:
+            project = params.get("project") if isinstance(params, dict) else (params[0] if params else None)
+            if not isinstance(project, compat.basestring):
+                connection.send_error(request_id, INVALID_PARAMS, "project must be a file name")
+                return
+            # relative file names are relative to the working directory of the server
+            project = os.path.normpath(os.path.abspath(project))
+            if isinstance(params, dict):
+                params = dict(params, project=project)
+            else:
+                params = [project] + list(params[1:])
+            with self.lock:
+                self.pending += 1
+                if project in self.busy:
+                    self.busy[project].append( (connection, request_id, method, params) )
+                    return
+                self.busy[project] = deque()
+            self._submit(connection, request_id, method, params, project)
+
+    def _submit(self, connection, request_id, method, params, project):
+        start = time.time()
+        def callback(response):
+            # called from a thread of the pool
+            self._respond(connection, request_id, method, start, response)
+            with self.lock:
+                self.pending -= 1
+                if self.busy[project]:
+                    next_request = self.busy[project].popleft()
+                else:
+                    del self.busy[project]
+                    next_request = None
+                self.idle.notify_all()
+            if next_request is not None:
+                self._submit(*(next_request + (project,)))
+        def error_callback(inst):
+            callback( ("error", INTERNAL_ERROR, str(inst), None) )
+        if compat.PYTHON2:
+            # no error_callback; _run catches the exceptions anyway
+            self.pool.apply_async(_run, (method, params), callback=callback)
+        else:
+            self.pool.apply_async(_run, (method, params), callback=callback, error_callback=error_callback)
+
+    def _respond(self, connection, request_id, method, start, response):
+        with self.lock:
+            entry = self.requests.setdefault(method, OrderedDict([("requests",0), ("errors",0), ("seconds",0.0)]))
+            entry["requests"] += 1
+            entry["seconds"] += time.time() - start
+            if response[0]=="error":
+                entry["errors"] += 1
+            elif method=="generate":
+                for name, value in response[1]["stats"]["counters"].items():
+                    self.counters[name] = self.counters.get(name, 0) + value
+        if request_id is None: return  # a notification
+        if response[0]=="result":
+            connection.send( OrderedDict([("jsonrpc","2.0"), ("id",request_id), ("result",response[1])]) )
+        else:
+            connection.send_error(request_id, *response[1:])
+
+    def get_stats(self):
+        with self.lock:
+            return OrderedDict( [("uptime", time.time()-self.start_time),
+                                 ("workers", self.workers),
+                                 ("pending", self.pending),
+                                 ("requests", OrderedDict( (method, dict(entry))
+                                                           for method, entry in self.requests.items() )),
+                                 ("counters", dict(self.counters))] )
+
+
+class _Connection(object):
+    "Writes the JSON responses to a file object; thread safe"
+
+    def __init__(self, outfile):
+        self.outfile = outfile
+        self.lock = threading.Lock()
+
+    def send(self, message):
+        data = json.dumps(message) + "\n"
+        with self.lock:
+            try:
+                self.outfile.write(data)
+                self.outfile.flush()
+            except (EnvironmentError, ValueError):
+                pass  # the client has gone
+
+    def send_error(self, request_id, code, message, data=None):
+        error = OrderedDict( [("code",code), ("message",message)] )
+        if data is not None: error["data"] = data
+        self.send( OrderedDict([("jsonrpc","2.0"), ("id",request_id), ("error",error)]) )
+
+
+def serve_stdio(server, outfile):
+    "serve requests from stdin and write the responses to outfile; returns on end of file or after a shutdown request"
+    connection = _Connection(outfile)
+    while server.running:
+        line = sys.stdin.readline()
+        if not line: break
+        server.handle_line(connection, line)
+
+
+def _is_socket(path):
+    return stat.S_ISSOCK(os.stat(path).st_mode)
+
+
+def serve_unix_socket(server, path):
+    "serve requests from connections to a Unix domain socket; returns after a shutdown request"
+    if os.path.exists(path):
+        # a socket from a previous run; anything else, e.g. a file given by mistake, must not be deleted
+        if not _is_socket(path):
+            raise EnvironmentError('"%s" exists and is not a socket' % path)
+        os.remove(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen(5)
+    listener.settimeout(0.5)  # to check server.running regularly
+
+    def handle_connection(sock):
+        infile = sock.makefile("r")
+        connection = _Connection( sock.makefile("w") )
+        try:
+            for line in iter(infile.readline, ""):
+                server.handle_line(connection, line)
+                if not server.running: break
+        except EnvironmentError:
+            pass
+        finally:
+            infile.close()
+
+    logging.info( _('Listening on "%s"'), path )
+    try:
+        while server.running:
+            try:
+                sock, address = listener.accept()
+            except socket.timeout:
+                continue
+            sock.settimeout(None)
+            thread = threading.Thread(target=handle_connection, args=(sock,))
+            thread.daemon = True
+            thread.start()
+    finally:
+        listener.close()
+        os.remove(path)
+
+
+def run(address="stdio", workers=None):
+    "run a server on stdin/stdout or a Unix domain socket until shutdown; returns the exit code"
+    if address!="stdio" and os.path.exists(address) and not _is_socket(address):
+        logging.error( _('"%s" exists and is not a socket'), address )
+        return 1
+    server = Server(workers)
+    if address=="stdio":
+        outfile = sys.stdout
+        sys.stdout = sys.stderr  # anything printed, also by the workers, would break the protocol
+    server.start()
+    try:
+        if address=="stdio":
+            serve_stdio(server, outfile)
+        else:
+            serve_unix_socket(server, address)
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+    return 0
+
+
+########################################################################################################################
+# client
+
+class RemoteError(Exception):
+    "an error response from the server"
+    def __init__(self, code, message, data=None):
+        Exception.__init__(self, "%s (%s)" % (message, code))
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class Client(object):
+    """Minimal synchronous client.
+
+    Without socket_path, a server process is started that communicates over stdin/stdout."""
+
+    def __init__(self, socket_path=None, workers=None):
+        self.process = self.sock = None
+        self._id = 0
+        if socket_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+            self.infile = self.sock.makefile("r")
+            self.outfile = self.sock.makefile("w")
+        else:
+            args = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "wxglade.py"),
+                    "--server"]
+            if workers: args.append("--server-workers=%d" % workers)
+            self.process = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                            universal_newlines=True)
+            self.infile = self.process.stdout
+            self.outfile = self.process.stdin
+
+    def _send(self, method, params):
+        self._id += 1
+        request = OrderedDict( [("jsonrpc","2.0"), ("id",self._id), ("method",method), ("params",params)] )
+        self.outfile.write(json.dumps(request) + "\n")
+        self.outfile.flush()
+        return self._id
+
+    def _receive(self):
+        line = self.infile.readline()
+        if not line:
+            raise EnvironmentError("Connection closed by the server")
+        return json.loads(line)
+
+    @staticmethod
+    def _get_result(response):
+        if "error" in response:
+            error = response["error"]
+            raise RemoteError(error["code"], error["message"], error.get("data"))
+        return response["result"]
+
+    def call(self, method, **params):
+        "send one request and wait for the result; raises RemoteError"
+        request_id = self._send(method, params)
+        while True:
+            response = self._receive()
+            if response.get("id")==request_id:
+                return self._get_result(response)
+
+    def call_many(self, calls):
+        """send several requests at once, e.g. to have them executed concurrently;
+        calls: list of (method, params dict); returns list of results or RemoteError instances"""
+        ids = [self._send(method, params) for method, params in calls]
+        responses = {}
+        while len(responses) < len(ids):
+            response = self._receive()
+            responses[response.get("id")] = response
+        ret = []
+        for request_id in ids:
+            try:
+                ret.append( self._get_result(responses[request_id]) )
+            except RemoteError as inst:
+                ret.append(inst)
+        return ret
+
+    def close(self):
+        if self.process is not None:
+            self.outfile.close()  # end of file for the server
+            self.process.wait()
+            self.infile.close()
+            self.process = None
+        elif self.sock is not None:
+            self.outfile.close()
+            self.infile.close()
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
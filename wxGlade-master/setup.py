@@ -116,6 +116,7 @@ if 'sdist' in sys.argv:
                                'wxGlade.desktop',
                                'wxglade.pyw',
                                'widgets/widgets.txt',
+                               'widgets/*/manifest.txt',
                                '__init__.py',
                                'test.py'
                                ])
@@ -129,7 +130,7 @@ if 'sdist' in sys.argv:
     }
 else:
     package_data = {
-        'wxglade.widgets': ['widgets.txt'],
+        'wxglade.widgets': ['widgets.txt', '*/manifest.txt'],
         'wxglade': ['res/*.*'],
     }
 
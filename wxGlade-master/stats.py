@@ -0,0 +1,124 @@
+"""\
+Timings and counters of a command line code generation run; see command line option --stats
+
+The functions of this module do nothing until start() has been called, so the hooks can stay in place.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import json, sys, time
+from collections import OrderedDict
+
+
+_current = None  # the active Stats instance; see start()
+
+
+class Stats(object):
+    "Accumulates wall times per phase and counters"
+
+    def __init__(self, output_format="text"):
+        self.output_format = output_format  # "text" or "json"
+        self.start_time = time.time()
+        self.timings = OrderedDict()   # phase name -> seconds; phases may be nested, e.g. "write" inside "finalize"
+        self.counters = OrderedDict()  # counter name -> int
+
+    def add_time(self, phase, seconds):
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self):
+        return OrderedDict( [("total", time.time()-self.start_time),
+                             ("timings", self.timings),
+                             ("counters", self.counters)] )
+
+    def format_text(self):
+        data = self.as_dict()
+        ret = [_("Timings (seconds):")]
+        width = max( [len(phase) for phase in self.timings] + [len(name) for name in self.counters] + [5] )
+        for phase, seconds in self.timings.items():
+            ret.append( "  %-*s %9.4f" % (width, phase, seconds) )
+        ret.append( "  %-*s %9.4f" % (width, "total", data["total"]) )
+        ret.append( _("Counters:") )
+        for name, value in self.counters.items():
+            ret.append( "  %-*s %9d" % (width, name, value) )
+        return "\n".join(ret)
+
+    def format_json(self):
+        return json.dumps(self.as_dict(), indent=2)
+
+
+class _Timer(object):
+    "Context manager to add the wall time of the enclosed block to a phase"
+    def __init__(self, phase):
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, *args):
+        if _current is not None:
+            _current.add_time(self.phase, time.time()-self.start)
+
+
+class _DummyTimer(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+_dummy_timer = _DummyTimer()
+
+
+def start(output_format="text"):
+    "Start collecting; output_format: 'text' or 'json'"
+    global _current
+    _current = Stats(output_format)
+    return _current
+
+
+def stop():
+    global _current
+    _current = None
+
+
+def reset():
+    "Discard the collected timings and counters, e.g. after report() in watch mode"
+    if _current is not None:
+        start(_current.output_format)
+
+
+def active():
+    return _current is not None
+
+
+def as_dict():
+    "Returns the collected timings and counters as OrderedDict or None if not active"
+    if _current is None: return None
+    return _current.as_dict()
+
+
+def timer(phase):
+    "Returns a context manager that adds the wall time of the enclosed block to phase"
+    if _current is None: return _dummy_timer
+    return _Timer(phase)
+
+
+def count(name, n=1):
+    "Increase counter name by n"
+    if _current is not None:
+        _current.count(name, n)
+
+
+def report(stream=None):
+    "Print the collected timings and counters to stream (default: sys.stdout) in the format passed to start()"
+    if _current is None: return
+    stream = stream or sys.stdout
+    if _current.output_format=="json":
+        stream.write( _current.format_json() + "\n" )
+    else:
+        stream.write( _current.format_text() + "\n" )
+    stream.flush()
@@ -0,0 +1,112 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "ChoicesFile.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetTitle(wxT("frame"));
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    notebook_1 = new wxNotebook(this, wxID_ANY);
+    sizer_1->Add(notebook_1, 1, wxEXPAND, 0);
+    notebook_1_pane_1 = new wxPanel(notebook_1, wxID_ANY);
+    notebook_1->AddPage(notebook_1_pane_1, wxT("First"));
+    wxBoxSizer* sizer_2 = new wxBoxSizer(wxVERTICAL);
+    const wxString choice_1_choices[] = {
+        wxT("small"),
+        wxT("medium"),
+        wxT("large"),
+    };
+    choice_1 = new wxChoice(notebook_1_pane_1, wxID_ANY, wxDefaultPosition, wxDefaultSize, 3, choice_1_choices);
+    choice_1->SetSelection(0);
+    sizer_2->Add(choice_1, 0, wxALL, 5);
+    const wxString choice_2_choices[] = {
+        wxT("yes"),
+        wxT("no"),
+    };
+    choice_2 = new wxChoice(notebook_1_pane_1, wxID_ANY, wxDefaultPosition, wxDefaultSize, 2, choice_2_choices);
+    choice_2->SetSelection(0);
+    sizer_2->Add(choice_2, 0, wxALL, 5);
+    notebook_1_pane_2 = new wxPanel(notebook_1, wxID_ANY);
+    notebook_1_pane_2->SetMinSize(wxSize(300, 200));
+    notebook_1->AddPage(notebook_1_pane_2, wxT("Deferred"));
+    notebook_1->Bind(wxEVT_NOTEBOOK_PAGE_CHANGING, &MyFrame::_on_notebook_1_page_changing, this);
+    
+    notebook_1_pane_1->SetSizer(sizer_2);
+    SetSizer(sizer_1);
+    sizer_1->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+void MyFrame::_on_notebook_1_page_changing(wxBookCtrlEvent& event)
+{
+    // begin wxGlade: MyFrame::_on_notebook_1_page_changing
+    // create the content of the page when it is selected the first time
+    int selection = event.GetSelection();
+    wxWindow* page = selection != wxNOT_FOUND ? notebook_1->GetPage(selection) : NULL;
+    if (page == notebook_1_pane_2 && !page->GetSizer()) {
+        _create_notebook_1_page_1();
+    }
+    event.Skip();
+    // end wxGlade
+}
+
+
+void MyFrame::_create_notebook_1_page_1()
+{
+    // begin wxGlade: MyFrame::_create_notebook_1_page_1
+    wxBoxSizer* sizer_3 = new wxBoxSizer(wxVERTICAL);
+    const wxString combo_box_1_choices[] = {
+        wxT("January"),
+        wxT("February"),
+        wxT("March"),
+        wxT("April"),
+        wxT("May"),
+        wxT("June"),
+        wxT("July"),
+        wxT("August"),
+        wxT("September"),
+        wxT("October"),
+        wxT("November"),
+        wxT("December"),
+    };
+    combo_box_1 = new wxComboBox(notebook_1_pane_2, wxID_ANY, wxT(""), wxDefaultPosition, wxDefaultSize, 12, combo_box_1_choices, 0);
+    sizer_3->Add(combo_box_1, 0, wxALL, 5);
+    notebook_1_pane_2->SetSizer(sizer_3);
+    notebook_1_pane_2->Layout();
+    // end wxGlade
+}
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+import io, json, os
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        with io.open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ChoicesFile_choices.json"), encoding="utf-8") as wxglade_file:
+            wxglade_choices = json.load(wxglade_file)
+        self.SetTitle("frame")
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.notebook_1 = wx.Notebook(self, wx.ID_ANY)
+        sizer_1.Add(self.notebook_1, 1, wx.EXPAND, 0)
+        
+        self.notebook_1_pane_1 = wx.Panel(self.notebook_1, wx.ID_ANY)
+        self.notebook_1.AddPage(self.notebook_1_pane_1, "First")
+        
+        sizer_2 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.choice_1 = wx.Choice(self.notebook_1_pane_1, wx.ID_ANY, choices=[s for s in wxglade_choices["frame.choice_1"]])
+        self.choice_1.SetSelection(0)
+        sizer_2.Add(self.choice_1, 0, wx.ALL, 5)
+        
+        self.choice_2 = wx.Choice(self.notebook_1_pane_1, wx.ID_ANY, choices=["yes", "no"])
+        self.choice_2.SetSelection(0)
+        sizer_2.Add(self.choice_2, 0, wx.ALL, 5)
+        
+        self.notebook_1_pane_2 = wx.Panel(self.notebook_1, wx.ID_ANY)
+        self.notebook_1_pane_2.SetMinSize((300, 200))
+        self.notebook_1.AddPage(self.notebook_1_pane_2, "Deferred")
+        
+        self.notebook_1.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGING, self._on_notebook_1_page_changing)
+        
+        self.notebook_1_pane_1.SetSizer(sizer_2)
+        
+        self.SetSizer(sizer_1)
+        sizer_1.Fit(self)
+        
+        self.Layout()
+        # end wxGlade
+
+    def _on_notebook_1_page_changing(self, event):
+        # begin wxGlade: MyFrame._on_notebook_1_page_changing
+        # create the content of the page when it is selected the first time
+        selection = event.GetSelection()
+        page = self.notebook_1.GetPage(selection) if selection != wx.NOT_FOUND else None
+        if page is self.notebook_1_pane_2 and not page.GetSizer():
+            self._create_notebook_1_page_1()
+        event.Skip()
+        # end wxGlade
+
+    def _create_notebook_1_page_1(self):
+        # begin wxGlade: MyFrame._create_notebook_1_page_1
+        with io.open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ChoicesFile_choices.json"), encoding="utf-8") as wxglade_file:
+            wxglade_choices = json.load(wxglade_file)
+        sizer_3 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.combo_box_1 = wx.ComboBox(self.notebook_1_pane_2, wx.ID_ANY, choices=[s for s in wxglade_choices["frame.combo_box_1"]], style=0)
+        sizer_3.Add(self.combo_box_1, 0, wx.ALL, 5)
+        
+        self.notebook_1_pane_2.SetSizer(sizer_3)
+        self.notebook_1_pane_2.Layout()
+        # end wxGlade
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
@@ -0,0 +1,279 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "DataTable.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyMenuBar::MyMenuBar():
+    wxMenuBar()
+{
+    // begin wxGlade: MyMenuBar::MyMenuBar
+    struct wxglade_menu_entry {
+        int type;  // 0: item, 1: separator, 2: begin of a menu or sub menu, 3: end of a menu
+        long id;
+        wxString label;
+        wxString help;
+        wxItemKind kind;
+        wxMenu** menu;      // attribute to store the menu or NULL
+        wxMenuItem** item;  // attribute to store the item or NULL
+        void (MyMenuBar::*handler)(wxCommandEvent&);
+    };
+    const wxglade_menu_entry wxglade_menu_entries[] = {
+        {2, 0, wxT("Edit"), wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {0, wxID_COPY, wxT("Copy"), wxEmptyString, wxITEM_NORMAL, NULL, &item_copy, &MyMenuBar::on_copy},
+        {0, wxID_PASTE, wxT("Paste"), wxEmptyString, wxITEM_NORMAL, NULL, NULL, &MyMenuBar::on_paste},
+        {3, 0, wxEmptyString, wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+    };
+    wxMenu* wxglade_menus[2];
+    size_t wxglade_menu_starts[2];
+    int wxglade_level = -1;
+    for (size_t i = 0; i < sizeof(wxglade_menu_entries) / sizeof(wxglade_menu_entries[0]); i++) {
+        const wxglade_menu_entry& entry = wxglade_menu_entries[i];
+        if (entry.type == 2) {
+            wxglade_menus[++wxglade_level] = new wxMenu();
+            wxglade_menu_starts[wxglade_level] = i;
+            if (entry.menu) *entry.menu = wxglade_menus[wxglade_level];
+        } else if (entry.type == 3) {
+            const wxglade_menu_entry& start = wxglade_menu_entries[wxglade_menu_starts[wxglade_level]];
+            wxMenu* wxglade_tmp_menu = wxglade_menus[wxglade_level--];
+            if (wxglade_level < 0)
+                Append(wxglade_tmp_menu, start.label);
+            else
+                wxglade_menus[wxglade_level]->Append(start.id, start.label, wxglade_tmp_menu, start.help);
+        } else if (entry.type == 1) {
+            wxglade_menus[wxglade_level]->AppendSeparator();
+        } else {
+            wxMenuItem* wxglade_item = wxglade_menus[wxglade_level]->Append(entry.id, entry.label, entry.help, entry.kind);
+            if (entry.item) *entry.item = wxglade_item;
+            if (entry.handler) Bind(wxEVT_MENU, entry.handler, this, wxglade_item->GetId());
+        }
+    }
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyMenuBar, wxMenuBar)
+    // begin wxGlade: MyMenuBar::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyMenuBar::on_copy(wxCommandEvent &event)  // wxGlade: MyMenuBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyMenuBar::on_copy) not implemented yet"));
+}
+
+void MyMenuBar::on_paste(wxCommandEvent &event)  // wxGlade: MyMenuBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyMenuBar::on_paste) not implemented yet"));
+}
+
+
+// wxGlade: add MyMenuBar event handlers
+
+
+MyToolBar::MyToolBar(wxWindow* parent, wxWindowID id, const wxPoint& pos, const wxSize& size, long style):
+    wxToolBar(parent, id, pos, size, style)
+{
+    // begin wxGlade: MyToolBar::MyToolBar
+    struct wxglade_tool_entry {
+        bool separator;
+        long id;
+        wxString label;
+        wxBitmap bitmap;
+        wxBitmap bitmap_disabled;
+        wxItemKind kind;
+        wxString short_help;
+        wxString long_help;
+        void (MyToolBar::*handler)(wxCommandEvent&);
+    };
+    const wxglade_tool_entry wxglade_tool_entries[] = {
+        {false, wxID_COPY, wxT("Copy"), wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, wxEmptyString, wxEmptyString, &MyToolBar::on_copy},
+    };
+    for (size_t i = 0; i < sizeof(wxglade_tool_entries) / sizeof(wxglade_tool_entries[0]); i++) {
+        const wxglade_tool_entry& entry = wxglade_tool_entries[i];
+        if (entry.separator) {
+            AddSeparator();
+            continue;
+        }
+        wxToolBarToolBase* wxglade_tool = AddTool(entry.id, entry.label, entry.bitmap, entry.bitmap_disabled,
+            entry.kind, entry.short_help, entry.long_help);
+        if (entry.handler) Bind(wxEVT_TOOL, entry.handler, this, wxglade_tool->GetId());
+    }
+    Realize();
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyToolBar, wxToolBar)
+    // begin wxGlade: MyToolBar::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyToolBar::on_copy(wxCommandEvent &event)  // wxGlade: MyToolBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyToolBar::on_copy) not implemented yet"));
+}
+
+
+// wxGlade: add MyToolBar event handlers
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetSize(wxSize(400, 300));
+    SetTitle(wxT("frame"));
+    frame_menubar = new wxMenuBar();
+    struct wxglade_menu_entry {
+        int type;  // 0: item, 1: separator, 2: begin of a menu or sub menu, 3: end of a menu
+        long id;
+        wxString label;
+        wxString help;
+        wxItemKind kind;
+        wxMenu** menu;      // attribute to store the menu or NULL
+        wxMenuItem** item;  // attribute to store the item or NULL
+        void (MyFrame::*handler)(wxCommandEvent&);
+    };
+    const wxglade_menu_entry wxglade_menu_entries[] = {
+        {2, 0, wxT("File"), wxEmptyString, wxITEM_NORMAL, &file_menu, NULL, NULL},
+        {0, wxID_OPEN, wxT("Open"), wxEmptyString, wxITEM_NORMAL, NULL, &item_open, &MyFrame::on_open},
+        {2, wxID_ANY, wxT("Recent"), wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {0, wxID_ANY, wxT("Recent 1"), wxT("the last file"), wxITEM_NORMAL, NULL, NULL, &MyFrame::on_recent},
+        {3, 0, wxEmptyString, wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {1, 0, wxEmptyString, wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {0, wxID_EXIT, wxT("Exit"), wxEmptyString, wxITEM_NORMAL, NULL, NULL, &MyFrame::on_exit},
+        {3, 0, wxEmptyString, wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {2, 0, wxT("View"), wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+        {0, wxID_ANY, wxT("Status bar"), wxEmptyString, wxITEM_CHECK, NULL, &item_status_bar, NULL},
+        {3, 0, wxEmptyString, wxEmptyString, wxITEM_NORMAL, NULL, NULL, NULL},
+    };
+    wxMenu* wxglade_menus[3];
+    size_t wxglade_menu_starts[3];
+    int wxglade_level = -1;
+    for (size_t i = 0; i < sizeof(wxglade_menu_entries) / sizeof(wxglade_menu_entries[0]); i++) {
+        const wxglade_menu_entry& entry = wxglade_menu_entries[i];
+        if (entry.type == 2) {
+            wxglade_menus[++wxglade_level] = new wxMenu();
+            wxglade_menu_starts[wxglade_level] = i;
+            if (entry.menu) *entry.menu = wxglade_menus[wxglade_level];
+        } else if (entry.type == 3) {
+            const wxglade_menu_entry& start = wxglade_menu_entries[wxglade_menu_starts[wxglade_level]];
+            wxMenu* wxglade_tmp_menu = wxglade_menus[wxglade_level--];
+            if (wxglade_level < 0)
+                frame_menubar->Append(wxglade_tmp_menu, start.label);
+            else
+                wxglade_menus[wxglade_level]->Append(start.id, start.label, wxglade_tmp_menu, start.help);
+        } else if (entry.type == 1) {
+            wxglade_menus[wxglade_level]->AppendSeparator();
+        } else {
+            wxMenuItem* wxglade_item = wxglade_menus[wxglade_level]->Append(entry.id, entry.label, entry.help, entry.kind);
+            if (entry.item) *entry.item = wxglade_item;
+            if (entry.handler) Bind(wxEVT_MENU, entry.handler, this, wxglade_item->GetId());
+        }
+    }
+    SetMenuBar(frame_menubar);
+    frame_toolbar = new wxToolBar(this, -1);
+    SetToolBar(frame_toolbar);
+    struct wxglade_tool_entry {
+        bool separator;
+        long id;
+        wxString label;
+        wxBitmap bitmap;
+        wxBitmap bitmap_disabled;
+        wxItemKind kind;
+        wxString short_help;
+        wxString long_help;
+        void (MyFrame::*handler)(wxCommandEvent&);
+    };
+    const wxglade_tool_entry wxglade_tool_entries[] = {
+        {false, wxID_OPEN, wxT("Open"), wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, wxT("Open a file"), wxEmptyString, &MyFrame::on_open},
+        {true, 0, wxEmptyString, wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, wxEmptyString, wxEmptyString, NULL},
+        {false, wxID_ANY, wxT("Lock"), wxNullBitmap, wxNullBitmap, wxITEM_CHECK, wxEmptyString, wxEmptyString, NULL},
+    };
+    for (size_t i = 0; i < sizeof(wxglade_tool_entries) / sizeof(wxglade_tool_entries[0]); i++) {
+        const wxglade_tool_entry& entry = wxglade_tool_entries[i];
+        if (entry.separator) {
+            frame_toolbar->AddSeparator();
+            continue;
+        }
+        wxToolBarToolBase* wxglade_tool = frame_toolbar->AddTool(entry.id, entry.label, entry.bitmap, entry.bitmap_disabled,
+            entry.kind, entry.short_help, entry.long_help);
+        if (entry.handler) Bind(wxEVT_TOOL, entry.handler, this, wxglade_tool->GetId());
+    }
+    frame_toolbar->Realize();
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    sizer_1->Add(0, 0, 0, 0, 0);
+    
+    SetSizer(sizer_1);
+    Layout();
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyFrame, wxFrame)
+    // begin wxGlade: MyFrame::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyFrame::on_open(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_open) not implemented yet"));
+}
+
+void MyFrame::on_recent(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_recent) not implemented yet"));
+}
+
+void MyFrame::on_exit(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_exit) not implemented yet"));
+}
+
+
+// wxGlade: add MyFrame event handlers
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
@@ -0,0 +1,94 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#ifndef DATATABLE_H
+#define DATATABLE_H
+
+#include <wx/wx.h>
+#include <wx/image.h>
+
+// begin wxGlade: ::dependencies
+// end wxGlade
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+class MyMenuBar: public wxMenuBar {
+public:
+    // begin wxGlade: MyMenuBar::ids
+    // end wxGlade
+
+    MyMenuBar();
+
+private:
+
+protected:
+    // begin wxGlade: MyMenuBar::attributes
+    wxMenuItem* item_copy;
+    // end wxGlade
+
+    DECLARE_EVENT_TABLE();
+
+public:
+    virtual void on_copy(wxCommandEvent &event); // wxGlade: <event_handler>
+    virtual void on_paste(wxCommandEvent &event); // wxGlade: <event_handler>
+}; // wxGlade: end class
+
+
+class MyToolBar: public wxToolBar {
+public:
+    // begin wxGlade: MyToolBar::ids
+    // end wxGlade
+
+    MyToolBar(wxWindow* parent, wxWindowID id, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxTB_HORIZONTAL|wxNO_BORDER);
+
+private:
+
+protected:
+    // begin wxGlade: MyToolBar::attributes
+    // end wxGlade
+
+    DECLARE_EVENT_TABLE();
+
+public:
+    virtual void on_copy(wxCommandEvent &event); // wxGlade: <event_handler>
+}; // wxGlade: end class
+
+
+class MyFrame: public wxFrame {
+public:
+    // begin wxGlade: MyFrame::ids
+    // end wxGlade
+
+    MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxDEFAULT_FRAME_STYLE);
+
+private:
+
+protected:
+    // begin wxGlade: MyFrame::attributes
+    wxMenu* file_menu;
+    wxMenuItem* item_open;
+    wxMenuItem* item_status_bar;
+    wxMenuBar* frame_menubar;
+    wxToolBar* frame_toolbar;
+    // end wxGlade
+
+    DECLARE_EVENT_TABLE();
+
+public:
+    virtual void on_open(wxCommandEvent &event); // wxGlade: <event_handler>
+    virtual void on_recent(wxCommandEvent &event); // wxGlade: <event_handler>
+    virtual void on_exit(wxCommandEvent &event); // wxGlade: <event_handler>
+}; // wxGlade: end class
+
+
+#endif // DATATABLE_H
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyMenuBar(wx.MenuBar):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyMenuBar.__init__
+        wx.MenuBar.__init__(self, *args, **kwds)
+        def wxglade_append_items(menu, items):
+            for item in items:
+                if item is None:
+                    menu.AppendSeparator()
+                    continue
+                id, label, help_str, kind, name, handler, sub_items = item
+                if sub_items is not None:
+                    sub_menu = wx.Menu()
+                    wxglade_append_items(sub_menu, sub_items)
+                    menu.Append(id, label, sub_menu, help_str)
+                    continue
+                item = menu.Append(id, label, help_str, kind)
+                if name: setattr(self, name, item)
+                if handler: self.Bind(wx.EVT_MENU, handler, id=item.GetId())
+        for label, name, items in (
+                ("Edit", None, (
+                    (wx.ID_COPY, "Copy", "", wx.ITEM_NORMAL, "item_copy", self.on_copy, None),
+                    (wx.ID_PASTE, "Paste", "", wx.ITEM_NORMAL, None, self.on_paste, None),
+                    )),
+                ):
+            wxglade_tmp_menu = wx.Menu()
+            if name: setattr(self, name, wxglade_tmp_menu)
+            wxglade_append_items(wxglade_tmp_menu, items)
+            self.Append(wxglade_tmp_menu, label)
+
+        # end wxGlade
+
+    def on_copy(self, event):  # wxGlade: MyMenuBar.<event_handler>
+        print("Event handler 'on_copy' not implemented!")
+        event.Skip()
+
+    def on_paste(self, event):  # wxGlade: MyMenuBar.<event_handler>
+        print("Event handler 'on_paste' not implemented!")
+        event.Skip()
+
+# end of class MyMenuBar
+
+class MyToolBar(wx.ToolBar):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyToolBar.__init__
+        kwds["style"] = kwds.get("style", 0)
+        wx.ToolBar.__init__(self, *args, **kwds)
+        for tool in (
+                (wx.ID_COPY, "Copy", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_NORMAL, "", "", self.on_copy),
+                ):
+            if tool is None:
+                self.AddSeparator()
+                continue
+            id, label, bmp1, bmp2, kind, short_help, long_help, handler = tool
+            tool = self.AddTool(id, label, bmp1, bmp2, kind, short_help, long_help)
+            if handler: self.Bind(wx.EVT_TOOL, handler, id=tool.GetId())
+        self.Realize()
+
+        # end wxGlade
+
+    def on_copy(self, event):  # wxGlade: MyToolBar.<event_handler>
+        print("Event handler 'on_copy' not implemented!")
+        event.Skip()
+
+# end of class MyToolBar
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        self.SetSize((400, 300))
+        self.SetTitle("frame")
+        
+        # Menu Bar
+        self.frame_menubar = wx.MenuBar()
+        def wxglade_append_items(menu, items):
+            for item in items:
+                if item is None:
+                    menu.AppendSeparator()
+                    continue
+                id, label, help_str, kind, name, handler, sub_items = item
+                if sub_items is not None:
+                    sub_menu = wx.Menu()
+                    wxglade_append_items(sub_menu, sub_items)
+                    menu.Append(id, label, sub_menu, help_str)
+                    continue
+                item = menu.Append(id, label, help_str, kind)
+                if name: setattr(self.frame_menubar, name, item)
+                if handler: self.Bind(wx.EVT_MENU, handler, id=item.GetId())
+        for label, name, items in (
+                ("File", "file_menu", (
+                    (wx.ID_OPEN, "Open", "", wx.ITEM_NORMAL, "item_open", self.on_open, None),
+                    (wx.ID_ANY, "Recent", "", None, None, None, (
+                        (wx.ID_ANY, "Recent 1", "the last file", wx.ITEM_NORMAL, None, self.on_recent, None),
+                        )),
+                    None,
+                    (wx.ID_EXIT, "Exit", "", wx.ITEM_NORMAL, None, self.on_exit, None),
+                    )),
+                ("View", None, (
+                    (wx.ID_ANY, "Status bar", "", wx.ITEM_CHECK, "item_status_bar", None, None),
+                    )),
+                ):
+            wxglade_tmp_menu = wx.Menu()
+            if name: setattr(self, name, wxglade_tmp_menu)
+            wxglade_append_items(wxglade_tmp_menu, items)
+            self.frame_menubar.Append(wxglade_tmp_menu, label)
+        self.SetMenuBar(self.frame_menubar)
+        # Menu Bar end
+        
+        # Tool Bar
+        self.frame_toolbar = wx.ToolBar(self, -1)
+        for tool in (
+                (wx.ID_OPEN, "Open", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_NORMAL, "Open a file", "", self.on_open),
+                None,
+                (wx.ID_ANY, "Lock", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_CHECK, "", "", None),
+                ):
+            if tool is None:
+                self.frame_toolbar.AddSeparator()
+                continue
+            id, label, bmp1, bmp2, kind, short_help, long_help, handler = tool
+            tool = self.frame_toolbar.AddTool(id, label, bmp1, bmp2, kind, short_help, long_help)
+            if handler: self.Bind(wx.EVT_TOOL, handler, id=tool.GetId())
+        self.frame_toolbar.Realize()
+        self.SetToolBar(self.frame_toolbar)
+        # Tool Bar end
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        sizer_1.Add((0, 0), 0, 0, 0)
+        
+        self.SetSizer(sizer_1)
+        
+        self.Layout()
+
+        # end wxGlade
+
+    def on_open(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_open' not implemented!")
+        event.Skip()
+
+    def on_recent(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_recent' not implemented!")
+        event.Skip()
+
+    def on_exit(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_exit' not implemented!")
+        event.Skip()
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
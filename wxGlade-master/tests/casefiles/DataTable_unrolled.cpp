@@ -0,0 +1,171 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "DataTable_unrolled.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyMenuBar::MyMenuBar():
+    wxMenuBar()
+{
+    // begin wxGlade: MyMenuBar::MyMenuBar
+    wxMenu *wxglade_tmp_menu;
+    wxglade_tmp_menu = new wxMenu();
+    item_copy = wxglade_tmp_menu->Append(wxID_COPY, wxT("Copy"), wxEmptyString);
+    Bind(wxEVT_MENU, &MyMenuBar::on_copy, this, wxID_COPY);
+    wxglade_tmp_menu->Append(wxID_PASTE, wxT("Paste"), wxEmptyString);
+    Bind(wxEVT_MENU, &MyMenuBar::on_paste, this, wxID_PASTE);
+    Append(wxglade_tmp_menu, wxT("Edit"));
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyMenuBar, wxMenuBar)
+    // begin wxGlade: MyMenuBar::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyMenuBar::on_copy(wxCommandEvent &event)  // wxGlade: MyMenuBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyMenuBar::on_copy) not implemented yet"));
+}
+
+void MyMenuBar::on_paste(wxCommandEvent &event)  // wxGlade: MyMenuBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyMenuBar::on_paste) not implemented yet"));
+}
+
+
+// wxGlade: add MyMenuBar event handlers
+
+
+MyToolBar::MyToolBar(wxWindow* parent, wxWindowID id, const wxPoint& pos, const wxSize& size, long style):
+    wxToolBar(parent, id, pos, size, style)
+{
+    // begin wxGlade: MyToolBar::MyToolBar
+    AddTool(wxID_COPY, wxT("Copy"), wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, wxEmptyString, wxEmptyString);
+    Bind(wxEVT_MENU, &MyToolBar::on_copy, this, wxID_COPY);
+    Realize();
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyToolBar, wxToolBar)
+    // begin wxGlade: MyToolBar::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyToolBar::on_copy(wxCommandEvent &event)  // wxGlade: MyToolBar.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyToolBar::on_copy) not implemented yet"));
+}
+
+
+// wxGlade: add MyToolBar event handlers
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetSize(wxSize(400, 300));
+    SetTitle(wxT("frame"));
+    frame_menubar = new wxMenuBar();
+    wxMenu *wxglade_tmp_menu;
+    wxMenuItem *wxglade_tmp_item;
+    file_menu = new wxMenu();
+    item_open = file_menu->Append(wxID_OPEN, wxT("Open"), wxEmptyString);
+    Bind(wxEVT_MENU, &MyFrame::on_open, this, wxID_OPEN);
+    wxMenu* file_menu_sub = new wxMenu();
+    wxglade_tmp_item = file_menu_sub->Append(wxID_ANY, wxT("Recent 1"), wxT("the last file"));
+    Bind(wxEVT_MENU, &MyFrame::on_recent, this, wxglade_tmp_item->GetId());
+    file_menu->Append(wxID_ANY, wxT("Recent"), file_menu_sub, wxEmptyString);
+    file_menu->AppendSeparator();
+    file_menu->Append(wxID_EXIT, wxT("Exit"), wxEmptyString);
+    Bind(wxEVT_MENU, &MyFrame::on_exit, this, wxID_EXIT);
+    frame_menubar->Append(file_menu, wxT("File"));
+    wxglade_tmp_menu = new wxMenu();
+    item_status_bar = wxglade_tmp_menu->Append(wxID_ANY, wxT("Status bar"), wxEmptyString, wxITEM_CHECK);
+    frame_menubar->Append(wxglade_tmp_menu, wxT("View"));
+    SetMenuBar(frame_menubar);
+    frame_toolbar = new wxToolBar(this, -1);
+    SetToolBar(frame_toolbar);
+    frame_toolbar->AddTool(wxID_OPEN, wxT("Open"), wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, wxT("Open a file"), wxEmptyString);
+    Bind(wxEVT_MENU, &MyFrame::on_open, this, wxID_OPEN);
+    frame_toolbar->AddSeparator();
+    frame_toolbar->AddTool(wxID_ANY, wxT("Lock"), wxNullBitmap, wxNullBitmap, wxITEM_CHECK, wxEmptyString, wxEmptyString);
+    frame_toolbar->Realize();
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    sizer_1->Add(0, 0, 0, 0, 0);
+    
+    SetSizer(sizer_1);
+    Layout();
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyFrame, wxFrame)
+    // begin wxGlade: MyFrame::event_table
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyFrame::on_open(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_open) not implemented yet"));
+}
+
+void MyFrame::on_recent(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_recent) not implemented yet"));
+}
+
+void MyFrame::on_exit(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_exit) not implemented yet"));
+}
+
+
+// wxGlade: add MyFrame event handlers
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyMenuBar(wx.MenuBar):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyMenuBar.__init__
+        wx.MenuBar.__init__(self, *args, **kwds)
+        wxglade_tmp_menu = wx.Menu()
+        self.item_copy = wxglade_tmp_menu.Append(wx.ID_COPY, "Copy", "")
+        self.Bind(wx.EVT_MENU, self.on_copy, id=wx.ID_COPY)
+        wxglade_tmp_menu.Append(wx.ID_PASTE, "Paste", "")
+        self.Bind(wx.EVT_MENU, self.on_paste, id=wx.ID_PASTE)
+        self.Append(wxglade_tmp_menu, "Edit")
+
+        # end wxGlade
+
+    def on_copy(self, event):  # wxGlade: MyMenuBar.<event_handler>
+        print("Event handler 'on_copy' not implemented!")
+        event.Skip()
+
+    def on_paste(self, event):  # wxGlade: MyMenuBar.<event_handler>
+        print("Event handler 'on_paste' not implemented!")
+        event.Skip()
+
+# end of class MyMenuBar
+
+class MyToolBar(wx.ToolBar):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyToolBar.__init__
+        kwds["style"] = kwds.get("style", 0)
+        wx.ToolBar.__init__(self, *args, **kwds)
+        self.AddTool(wx.ID_COPY, "Copy", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_NORMAL, "", "")
+        self.Bind(wx.EVT_TOOL, self.on_copy, id=wx.ID_COPY)
+        self.Realize()
+
+        # end wxGlade
+
+    def on_copy(self, event):  # wxGlade: MyToolBar.<event_handler>
+        print("Event handler 'on_copy' not implemented!")
+        event.Skip()
+
+# end of class MyToolBar
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        self.SetSize((400, 300))
+        self.SetTitle("frame")
+        
+        # Menu Bar
+        self.frame_menubar = wx.MenuBar()
+        self.file_menu = wx.Menu()
+        self.frame_menubar.item_open = self.file_menu.Append(wx.ID_OPEN, "Open", "")
+        self.Bind(wx.EVT_MENU, self.on_open, id=wx.ID_OPEN)
+        self.file_menu_sub = wx.Menu()
+        item = self.file_menu_sub.Append(wx.ID_ANY, "Recent 1", "the last file")
+        self.Bind(wx.EVT_MENU, self.on_recent, id=item.GetId())
+        self.file_menu.Append(wx.ID_ANY, "Recent", self.file_menu_sub, "")
+        self.file_menu.AppendSeparator()
+        self.file_menu.Append(wx.ID_EXIT, "Exit", "")
+        self.Bind(wx.EVT_MENU, self.on_exit, id=wx.ID_EXIT)
+        self.frame_menubar.Append(self.file_menu, "File")
+        wxglade_tmp_menu = wx.Menu()
+        self.frame_menubar.item_status_bar = wxglade_tmp_menu.Append(wx.ID_ANY, "Status bar", "", wx.ITEM_CHECK)
+        self.frame_menubar.Append(wxglade_tmp_menu, "View")
+        self.SetMenuBar(self.frame_menubar)
+        # Menu Bar end
+        
+        # Tool Bar
+        self.frame_toolbar = wx.ToolBar(self, -1)
+        self.frame_toolbar.AddTool(wx.ID_OPEN, "Open", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_NORMAL, "Open a file", "")
+        self.Bind(wx.EVT_TOOL, self.on_open, id=wx.ID_OPEN)
+        self.frame_toolbar.AddSeparator()
+        self.frame_toolbar.AddTool(wx.ID_ANY, "Lock", wx.Bitmap(16, 16), wx.NullBitmap, wx.ITEM_CHECK, "", "")
+        self.frame_toolbar.Realize()
+        self.SetToolBar(self.frame_toolbar)
+        # Tool Bar end
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        sizer_1.Add((0, 0), 0, 0, 0)
+        
+        self.SetSizer(sizer_1)
+        
+        self.Layout()
+
+        # end wxGlade
+
+    def on_open(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_open' not implemented!")
+        event.Skip()
+
+    def on_recent(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_recent' not implemented!")
+        event.Skip()
+
+    def on_exit(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_exit' not implemented!")
+        event.Skip()
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
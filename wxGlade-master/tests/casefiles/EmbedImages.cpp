@@ -0,0 +1,55 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "EmbedImages.hpp"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetTitle(wxT("frame"));
+    wxIcon _icon;
+    _icon.CopyFromBitmap(EmbedImages_images::GetBitmap("../casefiles/icon.xpm"));
+    SetIcon(_icon);
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    bitmap_button_1 = new wxBitmapButton(this, wxID_ANY, EmbedImages_images::GetBitmap("../casefiles/icon.xpm"), wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_1->SetSize(bitmap_button_1->GetBestSize());
+    sizer_1->Add(bitmap_button_1, 0, wxALL, 5);
+    wxStaticBitmap* bitmap_1 = new wxStaticBitmap(this, wxID_ANY, wxBitmap(wxT("missing.xpm"), wxBITMAP_TYPE_ANY));
+    sizer_1->Add(bitmap_1, 0, wxALL, 5);
+    
+    SetSizer(sizer_1);
+    sizer_1->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
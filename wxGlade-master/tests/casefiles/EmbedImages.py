@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+import EmbedImages_images
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        self.SetTitle("frame")
+        _icon = wx.NullIcon
+        _icon.CopyFromBitmap(EmbedImages_images.get_bitmap("../casefiles/icon.xpm"))
+        self.SetIcon(_icon)
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.bitmap_button_1 = wx.BitmapButton(self, wx.ID_ANY, EmbedImages_images.get_bitmap("../casefiles/icon.xpm"), style=0)
+        self.bitmap_button_1.SetSize(self.bitmap_button_1.GetBestSize())
+        sizer_1.Add(self.bitmap_button_1, 0, wx.ALL, 5)
+        
+        bitmap_1 = wx.StaticBitmap(self, wx.ID_ANY, wx.Bitmap("missing.xpm", wx.BITMAP_TYPE_ANY))
+        sizer_1.Add(bitmap_1, 0, wx.ALL, 5)
+        
+        self.SetSizer(sizer_1)
+        sizer_1.Fit(self)
+        
+        self.Layout()
+        # end wxGlade
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
@@ -0,0 +1,111 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "Notebook_lazy_pages.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetTitle(wxT("frame"));
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    notebook_1 = new wxNotebook(this, wxID_ANY);
+    sizer_1->Add(notebook_1, 1, wxEXPAND, 0);
+    notebook_1_pane_1 = new wxPanel(notebook_1, wxID_ANY);
+    notebook_1->AddPage(notebook_1_pane_1, wxT("First"));
+    wxBoxSizer* sizer_2 = new wxBoxSizer(wxVERTICAL);
+    button_1 = new wxButton(notebook_1_pane_1, wxID_ANY, wxT("button_1"));
+    sizer_2->Add(button_1, 0, wxALL, 5);
+    notebook_1_pane_2 = new wxPanel(notebook_1, wxID_ANY);
+    notebook_1_pane_2->SetMinSize(wxSize(300, 200));
+    notebook_1->AddPage(notebook_1_pane_2, wxT("Deferred"));
+    notebook_1_pane_3 = new wxPanel(notebook_1, wxID_ANY);
+    notebook_1->AddPage(notebook_1_pane_3, wxT("Not sized"));
+    wxBoxSizer* sizer_4 = new wxBoxSizer(wxVERTICAL);
+    checkbox_1 = new wxCheckBox(notebook_1_pane_3, wxID_ANY, wxT("checkbox_1"));
+    sizer_4->Add(checkbox_1, 0, wxALL, 5);
+    notebook_1->Bind(wxEVT_NOTEBOOK_PAGE_CHANGING, &MyFrame::_on_notebook_1_page_changing, this);
+    
+    notebook_1_pane_3->SetSizer(sizer_4);
+    notebook_1_pane_1->SetSizer(sizer_2);
+    SetSizer(sizer_1);
+    sizer_1->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+BEGIN_EVENT_TABLE(MyFrame, wxFrame)
+    // begin wxGlade: MyFrame::event_table
+    EVT_BUTTON(wxID_ANY, MyFrame::on_button_2)
+    // end wxGlade
+END_EVENT_TABLE();
+
+
+void MyFrame::_on_notebook_1_page_changing(wxBookCtrlEvent& event)
+{
+    // begin wxGlade: MyFrame::_on_notebook_1_page_changing
+    // create the content of the page when it is selected the first time
+    int selection = event.GetSelection();
+    wxWindow* page = selection != wxNOT_FOUND ? notebook_1->GetPage(selection) : NULL;
+    if (page == notebook_1_pane_2 && !page->GetSizer()) {
+        _create_notebook_1_page_1();
+    }
+    event.Skip();
+    // end wxGlade
+}
+
+
+void MyFrame::_create_notebook_1_page_1()
+{
+    // begin wxGlade: MyFrame::_create_notebook_1_page_1
+    wxBoxSizer* sizer_3 = new wxBoxSizer(wxVERTICAL);
+    text_ctrl_1 = new wxTextCtrl(notebook_1_pane_2, wxID_ANY, wxEmptyString, wxDefaultPosition, wxDefaultSize, wxTE_MULTILINE);
+    sizer_3->Add(text_ctrl_1, 1, wxALL|wxEXPAND, 5);
+    button_2 = new wxButton(notebook_1_pane_2, wxID_ANY, wxT("button_2"));
+    sizer_3->Add(button_2, 0, wxALL, 5);
+    notebook_1_pane_2->SetSizer(sizer_3);
+    notebook_1_pane_2->Layout();
+    // end wxGlade
+}
+
+
+void MyFrame::on_button_2(wxCommandEvent &event)  // wxGlade: MyFrame.<event_handler>
+{
+    event.Skip();
+    // notify the user that he hasn't implemented the event handler yet
+    wxLogDebug(wxT("Event handler (MyFrame::on_button_2) not implemented yet"));
+}
+
+
+// wxGlade: add MyFrame event handlers
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
@@ -0,0 +1,56 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#ifndef NOTEBOOK_LAZY_PAGES_H
+#define NOTEBOOK_LAZY_PAGES_H
+
+#include <wx/wx.h>
+#include <wx/image.h>
+
+// begin wxGlade: ::dependencies
+#include <wx/notebook.h>
+// end wxGlade
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+class MyFrame: public wxFrame {
+public:
+    // begin wxGlade: MyFrame::ids
+    // end wxGlade
+
+    MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxDEFAULT_FRAME_STYLE);
+
+private:
+
+protected:
+    // begin wxGlade: MyFrame::attributes
+    wxNotebook* notebook_1;
+    wxPanel* notebook_1_pane_1;
+    wxButton* button_1;
+    wxPanel* notebook_1_pane_2;
+    wxTextCtrl* text_ctrl_1;
+    wxButton* button_2;
+    wxPanel* notebook_1_pane_3;
+    wxCheckBox* checkbox_1;
+    void _on_notebook_1_page_changing(wxBookCtrlEvent& event);
+    void _create_notebook_1_page_1();
+    // end wxGlade
+
+    DECLARE_EVENT_TABLE();
+
+public:
+    virtual void on_button_2(wxCommandEvent &event); // wxGlade: <event_handler>
+}; // wxGlade: end class
+
+
+#endif // NOTEBOOK_LAZY_PAGES_H
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        self.SetTitle("frame")
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.notebook_1 = wx.Notebook(self, wx.ID_ANY)
+        sizer_1.Add(self.notebook_1, 1, wx.EXPAND, 0)
+        
+        self.notebook_1_pane_1 = wx.Panel(self.notebook_1, wx.ID_ANY)
+        self.notebook_1.AddPage(self.notebook_1_pane_1, "First")
+        
+        sizer_2 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.button_1 = wx.Button(self.notebook_1_pane_1, wx.ID_ANY, "button_1")
+        sizer_2.Add(self.button_1, 0, wx.ALL, 5)
+        
+        self.notebook_1_pane_2 = wx.Panel(self.notebook_1, wx.ID_ANY)
+        self.notebook_1_pane_2.SetMinSize((300, 200))
+        self.notebook_1.AddPage(self.notebook_1_pane_2, "Deferred")
+        
+        self.notebook_1_pane_3 = wx.Panel(self.notebook_1, wx.ID_ANY)
+        self.notebook_1.AddPage(self.notebook_1_pane_3, "Not sized")
+        
+        sizer_4 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.checkbox_1 = wx.CheckBox(self.notebook_1_pane_3, wx.ID_ANY, "checkbox_1")
+        sizer_4.Add(self.checkbox_1, 0, wx.ALL, 5)
+        
+        self.notebook_1.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGING, self._on_notebook_1_page_changing)
+        
+        self.notebook_1_pane_3.SetSizer(sizer_4)
+        
+        self.notebook_1_pane_1.SetSizer(sizer_2)
+        
+        self.SetSizer(sizer_1)
+        sizer_1.Fit(self)
+        
+        self.Layout()
+
+        # end wxGlade
+
+    def _on_notebook_1_page_changing(self, event):
+        # begin wxGlade: MyFrame._on_notebook_1_page_changing
+        # create the content of the page when it is selected the first time
+        selection = event.GetSelection()
+        page = self.notebook_1.GetPage(selection) if selection != wx.NOT_FOUND else None
+        if page is self.notebook_1_pane_2 and not page.GetSizer():
+            self._create_notebook_1_page_1()
+        event.Skip()
+        # end wxGlade
+
+    def _create_notebook_1_page_1(self):
+        # begin wxGlade: MyFrame._create_notebook_1_page_1
+        sizer_3 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.text_ctrl_1 = wx.TextCtrl(self.notebook_1_pane_2, wx.ID_ANY, "", style=wx.TE_MULTILINE)
+        sizer_3.Add(self.text_ctrl_1, 1, wx.ALL | wx.EXPAND, 5)
+        
+        self.button_2 = wx.Button(self.notebook_1_pane_2, wx.ID_ANY, "button_2")
+        sizer_3.Add(self.button_2, 0, wx.ALL, 5)
+        
+        self.notebook_1_pane_2.SetSizer(sizer_3)
+        
+        self.Bind(wx.EVT_BUTTON, self.on_button_2, self.button_2)
+        self.notebook_1_pane_2.Layout()
+        # end wxGlade
+
+    def on_button_2(self, event):  # wxGlade: MyFrame.<event_handler>
+        print("Event handler 'on_button_2' not implemented!")
+        event.Skip()
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
@@ -0,0 +1,111 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "SharedResources.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyPanel::MyPanel(wxWindow* parent, wxWindowID id, const wxPoint& pos, const wxSize& size, long style):
+    wxPanel(parent, id, pos, size, style)
+{
+    // begin wxGlade: MyPanel::MyPanel
+    wxFont _font_1 = wxFont(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, wxT(""));
+    wxBoxSizer* sizer_2 = new wxBoxSizer(wxVERTICAL);
+    bitmap_button_3 = new wxBitmapButton(this, wxID_ANY, wxBitmap(wxT("icon.xpm"), wxBITMAP_TYPE_ANY), wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_3->SetSize(bitmap_button_3->GetBestSize());
+    sizer_2->Add(bitmap_button_3, 0, wxALL, 5);
+    wxStaticText* label_3 = new wxStaticText(this, wxID_ANY, wxT("label_3"));
+    label_3->SetFont(_font_1);
+    sizer_2->Add(label_3, 0, wxALL, 5);
+    wxStaticText* label_4 = new wxStaticText(this, wxID_ANY, wxT("label_4"));
+    label_4->SetFont(_font_1);
+    sizer_2->Add(label_4, 0, wxALL, 5);
+    
+    SetSizer(sizer_2);
+    // end wxGlade
+}
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    wxBitmap _bitmap_1 = wxBitmap(wxT("icon.xpm"), wxBITMAP_TYPE_ANY);
+    wxFont _font_1 = wxFont(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, wxT(""));
+    SetTitle(wxT("frame"));
+    wxIcon _icon;
+    _icon.CopyFromBitmap(_bitmap_1);
+    SetIcon(_icon);
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    bitmap_button_1 = new wxBitmapButton(this, wxID_ANY, _bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_1->SetSize(bitmap_button_1->GetBestSize());
+    sizer_1->Add(bitmap_button_1, 0, wxALL, 5);
+    wxStaticText* label_1 = new wxStaticText(this, wxID_ANY, wxT("label_1"));
+    label_1->SetFont(_font_1);
+    sizer_1->Add(label_1, 0, wxALL, 5);
+    panel_1 = new MyPanel(this, wxID_ANY);
+    sizer_1->Add(panel_1, 0, wxALL, 5);
+    bitmap_button_2 = new wxBitmapButton(this, wxID_ANY, _bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_2->SetSize(bitmap_button_2->GetBestSize());
+    sizer_1->Add(bitmap_button_2, 0, wxALL, 5);
+    wxStaticText* label_2 = new wxStaticText(this, wxID_ANY, wxT("label_2"));
+    label_2->SetFont(_font_1);
+    sizer_1->Add(label_2, 0, wxALL, 5);
+    
+    SetSizer(sizer_1);
+    sizer_1->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+MyDialog::MyDialog(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxDialog(parent, id, title, pos, size, wxDEFAULT_DIALOG_STYLE)
+{
+    // begin wxGlade: MyDialog::MyDialog
+    wxBitmap _bitmap_1 = wxBitmap(wxT("icon.xpm"), wxBITMAP_TYPE_ANY);
+    SetTitle(wxT("dialog"));
+    wxBoxSizer* sizer_3 = new wxBoxSizer(wxVERTICAL);
+    bitmap_button_4 = new wxBitmapButton(this, wxID_ANY, _bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_4->SetSize(bitmap_button_4->GetBestSize());
+    sizer_3->Add(bitmap_button_4, 0, wxALL, 5);
+    bitmap_button_5 = new wxBitmapButton(this, wxID_ANY, _bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    bitmap_button_5->SetSize(bitmap_button_5->GetBestSize());
+    sizer_3->Add(bitmap_button_5, 0, wxALL, 5);
+    wxStaticText* label_5 = new wxStaticText(this, wxID_ANY, wxT("label_5"));
+    label_5->SetFont(wxFont(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, wxT("")));
+    sizer_3->Add(label_5, 0, wxALL, 5);
+    
+    SetSizer(sizer_3);
+    sizer_3->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
@@ -0,0 +1,76 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#ifndef SHAREDRESOURCES_H
+#define SHAREDRESOURCES_H
+
+#include <wx/wx.h>
+#include <wx/image.h>
+
+// begin wxGlade: ::dependencies
+// end wxGlade
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+class MyPanel: public wxPanel {
+public:
+    // begin wxGlade: MyPanel::ids
+    // end wxGlade
+
+    MyPanel(wxWindow* parent, wxWindowID id, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=0);
+
+private:
+
+protected:
+    // begin wxGlade: MyPanel::attributes
+    wxBitmapButton* bitmap_button_3;
+    // end wxGlade
+}; // wxGlade: end class
+
+
+class MyFrame: public wxFrame {
+public:
+    // begin wxGlade: MyFrame::ids
+    // end wxGlade
+
+    MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxDEFAULT_FRAME_STYLE);
+
+private:
+
+protected:
+    // begin wxGlade: MyFrame::attributes
+    wxBitmapButton* bitmap_button_1;
+    MyPanel* panel_1;
+    wxBitmapButton* bitmap_button_2;
+    // end wxGlade
+}; // wxGlade: end class
+
+
+class MyDialog: public wxDialog {
+public:
+    // begin wxGlade: MyDialog::ids
+    // end wxGlade
+
+    MyDialog(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxDEFAULT_DIALOG_STYLE);
+
+private:
+
+protected:
+    // begin wxGlade: MyDialog::attributes
+    wxBitmapButton* bitmap_button_4;
+    wxBitmapButton* bitmap_button_5;
+    // end wxGlade
+}; // wxGlade: end class
+
+
+#endif // SHAREDRESOURCES_H
@@ -0,0 +1,199 @@
+#!/usr/bin/perl -w -- 
+#
+# generated by wxGlade
+#
+# To get wxPerl visit http://www.wxperl.it
+#
+
+use Wx qw[:allclasses];
+use strict;
+
+# begin wxGlade: dependencies
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+package MyPanel;
+
+use Wx qw[:everything];
+use base qw(Wx::Panel);
+use strict;
+
+sub new {
+    my( $self, $parent, $id, $pos, $size, $style, $name ) = @_;
+    $parent = undef              unless defined $parent;
+    $id     = -1                 unless defined $id;
+    $pos    = wxDefaultPosition  unless defined $pos;
+    $size   = wxDefaultSize      unless defined $size;
+    $name   = ""                 unless defined $name;
+
+    # begin wxGlade: MyPanel::new
+    $self = $self->SUPER::new( $parent, $id, $pos, $size, $style, $name );
+    my $_font_1 = Wx::Font->new(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, "");
+    
+    $self->{sizer_2} = Wx::BoxSizer->new(wxVERTICAL);
+    
+    $self->{bitmap_button_3} = Wx::BitmapButton->new($self, wxID_ANY, Wx::Bitmap->new("icon.xpm", wxBITMAP_TYPE_ANY), wxDefaultPosition, wxDefaultSize, 0);
+    $self->{bitmap_button_3}->SetSize($self->{bitmap_button_3}->GetBestSize());
+    $self->{sizer_2}->Add($self->{bitmap_button_3}, 0, wxALL, 5);
+    
+    my $label_3 = Wx::StaticText->new($self, wxID_ANY, "label_3");
+    $label_3->SetFont($_font_1);
+    $self->{sizer_2}->Add($label_3, 0, wxALL, 5);
+    
+    my $label_4 = Wx::StaticText->new($self, wxID_ANY, "label_4");
+    $label_4->SetFont($_font_1);
+    $self->{sizer_2}->Add($label_4, 0, wxALL, 5);
+    
+    $self->SetSizer($self->{sizer_2});
+    
+    $self->Layout();
+    # end wxGlade
+    return $self;
+
+}
+
+
+# end of class MyPanel
+
+1;
+
+package MyFrame;
+
+use Wx qw[:everything];
+use base qw(Wx::Frame);
+use strict;
+
+sub new {
+    my( $self, $parent, $id, $title, $pos, $size, $style, $name ) = @_;
+    $parent = undef              unless defined $parent;
+    $id     = -1                 unless defined $id;
+    $title  = ""                 unless defined $title;
+    $pos    = wxDefaultPosition  unless defined $pos;
+    $size   = wxDefaultSize      unless defined $size;
+    $name   = ""                 unless defined $name;
+
+    # begin wxGlade: MyFrame::new
+    $style = wxDEFAULT_FRAME_STYLE
+        unless defined $style;
+
+    $self = $self->SUPER::new( $parent, $id, $title, $pos, $size, $style, $name );
+    my $_bitmap_1 = Wx::Bitmap->new("icon.xpm", wxBITMAP_TYPE_ANY);
+    my $_font_1 = Wx::Font->new(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, "");
+    $self->SetTitle("frame");
+    my $icon = &Wx::wxNullIcon;
+    $icon->CopyFromBitmap($_bitmap_1);
+    $self->SetIcon($icon);
+    
+    $self->{sizer_1} = Wx::BoxSizer->new(wxVERTICAL);
+    
+    $self->{bitmap_button_1} = Wx::BitmapButton->new($self, wxID_ANY, $_bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    $self->{bitmap_button_1}->SetSize($self->{bitmap_button_1}->GetBestSize());
+    $self->{sizer_1}->Add($self->{bitmap_button_1}, 0, wxALL, 5);
+    
+    my $label_1 = Wx::StaticText->new($self, wxID_ANY, "label_1");
+    $label_1->SetFont($_font_1);
+    $self->{sizer_1}->Add($label_1, 0, wxALL, 5);
+    
+    $self->{panel_1} = MyPanel->new($self, wxID_ANY);
+    $self->{sizer_1}->Add($self->{panel_1}, 0, wxALL, 5);
+    
+    $self->{bitmap_button_2} = Wx::BitmapButton->new($self, wxID_ANY, $_bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    $self->{bitmap_button_2}->SetSize($self->{bitmap_button_2}->GetBestSize());
+    $self->{sizer_1}->Add($self->{bitmap_button_2}, 0, wxALL, 5);
+    
+    my $label_2 = Wx::StaticText->new($self, wxID_ANY, "label_2");
+    $label_2->SetFont($_font_1);
+    $self->{sizer_1}->Add($label_2, 0, wxALL, 5);
+    
+    $self->SetSizer($self->{sizer_1});
+    $self->{sizer_1}->Fit($self);
+    
+    $self->Layout();
+    # end wxGlade
+    return $self;
+
+}
+
+
+# end of class MyFrame
+
+1;
+
+package MyDialog;
+
+use Wx qw[:everything];
+use base qw(Wx::Dialog);
+use strict;
+
+sub new {
+    my( $self, $parent, $id, $title, $pos, $size, $style, $name ) = @_;
+    $parent = undef              unless defined $parent;
+    $id     = -1                 unless defined $id;
+    $title  = ""                 unless defined $title;
+    $pos    = wxDefaultPosition  unless defined $pos;
+    $size   = wxDefaultSize      unless defined $size;
+    $name   = ""                 unless defined $name;
+
+    # begin wxGlade: MyDialog::new
+    $style = wxDEFAULT_DIALOG_STYLE
+        unless defined $style;
+
+    $self = $self->SUPER::new( $parent, $id, $title, $pos, $size, $style, $name );
+    my $_bitmap_1 = Wx::Bitmap->new("icon.xpm", wxBITMAP_TYPE_ANY);
+    $self->SetTitle("dialog");
+    
+    $self->{sizer_3} = Wx::BoxSizer->new(wxVERTICAL);
+    
+    $self->{bitmap_button_4} = Wx::BitmapButton->new($self, wxID_ANY, $_bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    $self->{bitmap_button_4}->SetSize($self->{bitmap_button_4}->GetBestSize());
+    $self->{sizer_3}->Add($self->{bitmap_button_4}, 0, wxALL, 5);
+    
+    $self->{bitmap_button_5} = Wx::BitmapButton->new($self, wxID_ANY, $_bitmap_1, wxDefaultPosition, wxDefaultSize, 0);
+    $self->{bitmap_button_5}->SetSize($self->{bitmap_button_5}->GetBestSize());
+    $self->{sizer_3}->Add($self->{bitmap_button_5}, 0, wxALL, 5);
+    
+    my $label_5 = Wx::StaticText->new($self, wxID_ANY, "label_5");
+    $label_5->SetFont(Wx::Font->new(12, wxFONTFAMILY_DEFAULT, wxFONTSTYLE_NORMAL, wxFONTWEIGHT_BOLD, 0, ""));
+    $self->{sizer_3}->Add($label_5, 0, wxALL, 5);
+    
+    $self->SetSizer($self->{sizer_3});
+    $self->{sizer_3}->Fit($self);
+    
+    $self->Layout();
+    # end wxGlade
+    return $self;
+
+}
+
+
+# end of class MyDialog
+
+1;
+
+package MyApp;
+
+use base qw(Wx::App);
+use strict;
+
+sub OnInit {
+    my( $self ) = shift;
+
+    Wx::InitAllImageHandlers();
+
+    my $frame = MyFrame->new();
+
+    $self->SetTopWindow($frame);
+    $frame->Show(1);
+
+    return 1;
+}
+# end of class MyApp
+
+package main;
+
+unless(caller){
+    my $app = MyApp->new();
+    $app->MainLoop();
+}
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyPanel(wx.Panel):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyPanel.__init__
+        kwds["style"] = kwds.get("style", 0)
+        wx.Panel.__init__(self, *args, **kwds)
+        _font_1 = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD, 0, "")
+        
+        sizer_2 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.bitmap_button_3 = wx.BitmapButton(self, wx.ID_ANY, wx.Bitmap("icon.xpm", wx.BITMAP_TYPE_ANY), style=0)
+        self.bitmap_button_3.SetSize(self.bitmap_button_3.GetBestSize())
+        sizer_2.Add(self.bitmap_button_3, 0, wx.ALL, 5)
+        
+        label_3 = wx.StaticText(self, wx.ID_ANY, "label_3")
+        label_3.SetFont(_font_1)
+        sizer_2.Add(label_3, 0, wx.ALL, 5)
+        
+        label_4 = wx.StaticText(self, wx.ID_ANY, "label_4")
+        label_4.SetFont(_font_1)
+        sizer_2.Add(label_4, 0, wx.ALL, 5)
+        
+        self.SetSizer(sizer_2)
+        
+        self.Layout()
+        # end wxGlade
+
+# end of class MyPanel
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        _bitmap_1 = wx.Bitmap("icon.xpm", wx.BITMAP_TYPE_ANY)
+        _font_1 = wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD, 0, "")
+        self.SetTitle("frame")
+        _icon = wx.NullIcon
+        _icon.CopyFromBitmap(_bitmap_1)
+        self.SetIcon(_icon)
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.bitmap_button_1 = wx.BitmapButton(self, wx.ID_ANY, _bitmap_1, style=0)
+        self.bitmap_button_1.SetSize(self.bitmap_button_1.GetBestSize())
+        sizer_1.Add(self.bitmap_button_1, 0, wx.ALL, 5)
+        
+        label_1 = wx.StaticText(self, wx.ID_ANY, "label_1")
+        label_1.SetFont(_font_1)
+        sizer_1.Add(label_1, 0, wx.ALL, 5)
+        
+        self.panel_1 = MyPanel(self, wx.ID_ANY)
+        sizer_1.Add(self.panel_1, 0, wx.ALL, 5)
+        
+        self.bitmap_button_2 = wx.BitmapButton(self, wx.ID_ANY, _bitmap_1, style=0)
+        self.bitmap_button_2.SetSize(self.bitmap_button_2.GetBestSize())
+        sizer_1.Add(self.bitmap_button_2, 0, wx.ALL, 5)
+        
+        label_2 = wx.StaticText(self, wx.ID_ANY, "label_2")
+        label_2.SetFont(_font_1)
+        sizer_1.Add(label_2, 0, wx.ALL, 5)
+        
+        self.SetSizer(sizer_1)
+        sizer_1.Fit(self)
+        
+        self.Layout()
+        # end wxGlade
+
+# end of class MyFrame
+
+class MyDialog(wx.Dialog):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyDialog.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_DIALOG_STYLE
+        wx.Dialog.__init__(self, *args, **kwds)
+        _bitmap_1 = wx.Bitmap("icon.xpm", wx.BITMAP_TYPE_ANY)
+        self.SetTitle("dialog")
+        
+        sizer_3 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.bitmap_button_4 = wx.BitmapButton(self, wx.ID_ANY, _bitmap_1, style=0)
+        self.bitmap_button_4.SetSize(self.bitmap_button_4.GetBestSize())
+        sizer_3.Add(self.bitmap_button_4, 0, wx.ALL, 5)
+        
+        self.bitmap_button_5 = wx.BitmapButton(self, wx.ID_ANY, _bitmap_1, style=0)
+        self.bitmap_button_5.SetSize(self.bitmap_button_5.GetBestSize())
+        sizer_3.Add(self.bitmap_button_5, 0, wx.ALL, 5)
+        
+        label_5 = wx.StaticText(self, wx.ID_ANY, "label_5")
+        label_5.SetFont(wx.Font(12, wx.FONTFAMILY_DEFAULT, wx.FONTSTYLE_NORMAL, wx.FONTWEIGHT_BOLD, 0, ""))
+        sizer_3.Add(label_5, 0, wx.ALL, 5)
+        
+        self.SetSizer(sizer_3)
+        sizer_3.Fit(self)
+        
+        self.Layout()
+        # end wxGlade
+
+# end of class MyDialog
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    app = MyApp(0)
+    app.MainLoop()
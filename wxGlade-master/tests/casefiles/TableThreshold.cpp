@@ -0,0 +1,104 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#include "TableThreshold.h"
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+
+MyFrame::MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos, const wxSize& size, long style):
+    wxFrame(parent, id, title, pos, size, wxDEFAULT_FRAME_STYLE)
+{
+    // begin wxGlade: MyFrame::MyFrame
+    SetTitle(_("frame"));
+    wxBoxSizer* sizer_1 = new wxBoxSizer(wxVERTICAL);
+    grid_1 = new wxGrid(this, wxID_ANY);
+    grid_1->CreateGrid(2, 3);
+    {
+        struct wxglade_label_size {
+            int index;
+            bool has_label;
+            wxString label;
+            int size;
+        };
+        const wxglade_label_size wxglade_table[] = {
+            {0, true, _("Name"), 80},
+            {1, true, _("Size"), -1},
+            {2, true, _("Date"), 120},
+        };
+        for (size_t i = 0; i < sizeof(wxglade_table) / sizeof(wxglade_table[0]); i++) {
+            const wxglade_label_size& entry = wxglade_table[i];
+            if (entry.has_label) grid_1->SetColLabelValue(entry.index, entry.label);
+            if (entry.size > 0) grid_1->SetColSize(entry.index, entry.size);
+        }
+    }
+    sizer_1->Add(grid_1, 1, wxEXPAND, 0);
+    list_ctrl_1 = new wxListCtrl(this, wxID_ANY, wxDefaultPosition, wxDefaultSize, wxBORDER_SUNKEN|wxLC_REPORT);
+    {
+        struct wxglade_column {
+            wxString heading;
+            int width;
+        };
+        const wxglade_column wxglade_table[] = {
+            {_("Name"), 80},
+            {_("Size"), -1},
+            {_("Date"), 120},
+        };
+        for (size_t i = 0; i < sizeof(wxglade_table) / sizeof(wxglade_table[0]); i++)
+            list_ctrl_1->AppendColumn(wxglade_table[i].heading, wxLIST_FORMAT_LEFT, wxglade_table[i].width);
+    }
+    sizer_1->Add(list_ctrl_1, 1, wxEXPAND, 0);
+    list_ctrl_2 = new wxListCtrl(this, wxID_ANY, wxDefaultPosition, wxDefaultSize, wxBORDER_SUNKEN|wxLC_REPORT);
+    list_ctrl_2->AppendColumn(_("Key"), wxLIST_FORMAT_LEFT, 80);
+    list_ctrl_2->AppendColumn(_("Value"), wxLIST_FORMAT_LEFT, -1);
+    sizer_1->Add(list_ctrl_2, 1, wxEXPAND, 0);
+    const wxString combo_box_1_choices[] = {
+        _("red"),
+        _("green"),
+        _("blue"),
+        _("yellow"),
+    };
+    combo_box_1 = new wxComboBox(this, wxID_ANY, wxT(""), wxDefaultPosition, wxDefaultSize, 4, combo_box_1_choices, 0);
+    combo_box_1->SetSelection(0);
+    sizer_1->Add(combo_box_1, 0, 0, 0);
+    
+    SetSizer(sizer_1);
+    sizer_1->Fit(this);
+    Layout();
+    // end wxGlade
+}
+
+
+class MyApp: public wxApp {
+public:
+    bool OnInit();
+protected:
+    wxLocale m_locale;  // locale we'll be using
+};
+
+IMPLEMENT_APP(MyApp)
+
+bool MyApp::OnInit()
+{
+    m_locale.Init();
+#ifdef APP_LOCALE_DIR
+    m_locale.AddCatalogLookupPathPrefix(wxT(APP_LOCALE_DIR));
+#endif
+    m_locale.AddCatalog(wxT(APP_CATALOG));
+
+    wxInitAllImageHandlers();
+    MyFrame* frame = new MyFrame(NULL, wxID_ANY, wxEmptyString);
+    SetTopWindow(frame);
+    frame->Show();
+    return true;
+}
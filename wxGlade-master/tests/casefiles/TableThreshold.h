@@ -0,0 +1,52 @@
+// -*- C++ -*-
+//
+// generated by wxGlade
+//
+// Example for compiling a single file project under Linux using g++:
+//  g++ MyApp.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp
+//
+// Example for compiling a multi file project under Linux using g++:
+//  g++ main.cpp $(wx-config --libs) $(wx-config --cxxflags) -o MyApp Dialog1.cpp Frame1.cpp
+//
+
+#ifndef TABLETHRESHOLD_H
+#define TABLETHRESHOLD_H
+
+#include <wx/wx.h>
+#include <wx/image.h>
+#include <wx/intl.h>
+
+#ifndef APP_CATALOG
+#define APP_CATALOG "app"  // replace with the appropriate catalog name
+#endif
+
+
+// begin wxGlade: ::dependencies
+#include <wx/grid.h>
+#include <wx/listctrl.h>
+// end wxGlade
+
+// begin wxGlade: ::extracode
+// end wxGlade
+
+
+class MyFrame: public wxFrame {
+public:
+    // begin wxGlade: MyFrame::ids
+    // end wxGlade
+
+    MyFrame(wxWindow* parent, wxWindowID id, const wxString& title, const wxPoint& pos=wxDefaultPosition, const wxSize& size=wxDefaultSize, long style=wxDEFAULT_FRAME_STYLE);
+
+private:
+
+protected:
+    // begin wxGlade: MyFrame::attributes
+    wxGrid* grid_1;
+    wxListCtrl* list_ctrl_1;
+    wxListCtrl* list_ctrl_2;
+    wxComboBox* combo_box_1;
+    // end wxGlade
+}; // wxGlade: end class
+
+
+#endif // TABLETHRESHOLD_H
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+#
+# generated by wxGlade
+#
+
+import wx
+
+# begin wxGlade: dependencies
+import gettext
+import wx.grid
+# end wxGlade
+
+# begin wxGlade: extracode
+# end wxGlade
+
+
+class MyFrame(wx.Frame):
+    def __init__(self, *args, **kwds):
+        # begin wxGlade: MyFrame.__init__
+        kwds["style"] = kwds.get("style", 0) | wx.DEFAULT_FRAME_STYLE
+        wx.Frame.__init__(self, *args, **kwds)
+        self.SetTitle(_("frame"))
+        
+        sizer_1 = wx.BoxSizer(wx.VERTICAL)
+        
+        self.grid_1 = wx.grid.Grid(self, wx.ID_ANY, size=(1, 1))
+        self.grid_1.CreateGrid(2, 3)
+        for i, label, size in (
+                (0, _("Name"), 80),
+                (1, _("Size"), -1),
+                (2, _("Date"), 120),
+                ):
+            if label is not None: self.grid_1.SetColLabelValue(i, label)
+            if size > 0: self.grid_1.SetColSize(i, size)
+        sizer_1.Add(self.grid_1, 1, wx.EXPAND, 0)
+        
+        self.list_ctrl_1 = wx.ListCtrl(self, wx.ID_ANY, style=wx.BORDER_SUNKEN | wx.LC_REPORT)
+        for i, (heading, width) in enumerate((
+                (_("Name"), 80),
+                (_("Size"), -1),
+                (_("Date"), 120),
+                )):
+            self.list_ctrl_1.AppendColumn(heading, format=wx.LIST_FORMAT_LEFT, width=width)
+        sizer_1.Add(self.list_ctrl_1, 1, wx.EXPAND, 0)
+        
+        self.list_ctrl_2 = wx.ListCtrl(self, wx.ID_ANY, style=wx.BORDER_SUNKEN | wx.LC_REPORT)
+        self.list_ctrl_2.AppendColumn(_("Key"), format=wx.LIST_FORMAT_LEFT, width=80)
+        self.list_ctrl_2.AppendColumn(_("Value"), format=wx.LIST_FORMAT_LEFT, width=-1)
+        sizer_1.Add(self.list_ctrl_2, 1, wx.EXPAND, 0)
+        
+        self.combo_box_1 = wx.ComboBox(self, wx.ID_ANY, choices=[_("red"), _("green"), _("blue"), _("yellow")], style=0)
+        self.combo_box_1.SetSelection(0)
+        sizer_1.Add(self.combo_box_1, 0, 0, 0)
+        
+        self.SetSizer(sizer_1)
+        sizer_1.Fit(self)
+        
+        self.Layout()
+        # end wxGlade
+
+# end of class MyFrame
+
+class MyApp(wx.App):
+    def OnInit(self):
+        self.frame = MyFrame(None, wx.ID_ANY, "")
+        self.SetTopWindow(self.frame)
+        self.frame.Show()
+        return True
+
+# end of class MyApp
+
+if __name__ == "__main__":
+    gettext.install("app") # replace with the appropriate catalog name
+
+    app = MyApp(0)
+    app.MainLoop()
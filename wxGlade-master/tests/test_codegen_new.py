@@ -13,7 +13,7 @@ import unittest
 from testsupport_new import WXGladeCLITest
 
 # import project modules
-import common, config, compat, errors, misc
+import common, config, compat, errors, misc, plugins
 import xrc2wxg
 
 
@@ -1011,6 +1011,27 @@ class TestCodeGen(WXGladeCLITest):
         self.assertNotEqual( id(old_gen.codegen.for_version), id(new_gen.codegen.for_version),
                             'for_version used by widget generators are not different' )
 
+    def test_widget_manifests(self):
+        "Test that the widget manifests list all bases and classes that are registered by the widget modules"
+        registry = plugins.registry
+        registry.load_all()
+        dicts = [common.widget_classes, common.widgets, common.widgets_from_xml, common.class_names]
+        listed = set()
+        for widget_dir, module_name in registry.modules:
+            manifest = registry.get_manifest(widget_dir, module_name)
+            for base in manifest["bases"]:
+                self.assertTrue( [d for d in dicts if dict.__contains__(d, base)],
+                                 '%s: base "%s" is not registered'%(module_name, base) )
+            for klass in manifest["classes"]:
+                self.assertTrue( [w for w in common.code_writers.values() if dict.__contains__(w.obj_builders, klass)],
+                                 '%s: class "%s" is not registered'%(module_name, klass) )
+            listed.update(manifest["bases"])
+        self.assertFalse( registry.pending )
+        # sizers are not loaded lazily
+        for d in dicts:
+            unlisted = [name for name in dict.keys(d) if name not in listed and not "Sizer" in name]
+            self.assertFalse( unlisted, "not listed in a manifest: %s"%unlisted )
+
     @unittest.skip("XXX")
     def test_xrc2wxg(self):
         "Test converting XRC files into WXG files"
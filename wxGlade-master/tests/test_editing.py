@@ -46,6 +46,24 @@ class TestEditing(WXGladeGUITest):
         common.app_tree.root.generate_code()
         self._compare_files(expected_filename, generated_filename, check_mtime=True)
 
+    def test_paste_multiple(self):
+        "paste multiple copies at once; the names are allocated from one set of counters"
+        infilename = self._get_casefile_path('crash_on_cut_paste.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        path = ['App', 'frame', 'sizer_limit', 'panel_3']
+        editor = common.root.find_widget_from_path(path)
+        common.app_tree.show_toplevel( None, common.root.find_widget_from_path(path[:2]) )
+        self._process_wx_events()
+        sizer = editor.parent
+
+        for n in range(3):
+            sizer._insert_slot(1)
+        self.assertTrue( clipboard._paste_multiple(sizer, [1,2,3], clipboard.dump_widget(editor)) )
+        self._process_wx_events()
+
+        self.assertEqual( [c.name for c in sizer.children], ["panel_3", "panel_4", "panel_5", "panel_6"] )
+        self.assertEqual( [c.children[0].name for c in sizer.children], ["sizer_8", "sizer_9", "sizer_10", "sizer_11"] )
+
 
 if __name__ == '__main__':
     unittest.main(exit=False)
@@ -12,7 +12,7 @@ from testsupport_new import WXGladeGUITest
 import wx, wx.xrc
 import xrc2wxg
 import common, compat
-import glob, os, sys, unittest
+import glob, os, subprocess, sys, unittest
 
 
 class TestGui(WXGladeGUITest):
@@ -332,14 +332,31 @@ class TestGui(WXGladeGUITest):
         generated_filename = self._get_outputfile_path("PythonSubclass/PythonSubclass.py")
         self._compare_files(expected_filename, generated_filename)
 
-    def test_WxgXRCMultipleFilesNotSupported(self):
-        "Test for multi file XRC projects."
-        infilename = self._get_casefile_path('Python_Preferences.wxg')
+    def test_XRCMultipleFiles(self):
+        "Test for multi file XRC projects: one file per toplevel window, an index file and the XRS archive"
+        infilename = self._get_casefile_path('ComplexExample_30.wxg')
         common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
-        common.app_tree.root.properties["multiple_files"].set(1)
-        common.app_tree.root.properties["language"].set("XRC")
-        common.app_tree.root.generate_code()
-        self._assert_error_message( "XRC code cannot be split into multiple files" )
+        app = common.app_tree.root
+        app.properties["multiple_files"].set(1)
+        app.properties["language"].set("XRC")
+        app.properties["xrc_archive"].set(True)
+        out_path = self._get_outputfile_path("ComplexExample_30_XRC")
+        if not os.path.isdir(out_path): os.mkdir(out_path)
+        app.properties["output_path"].set(out_path)
+        app.generate_code()
+        self._assert_info_message(u'Code generation completed successfully')
+
+        filenames = ["Mp3_To_Ogg.xrc", "FrameGrid.xrc", "ComplexExampleApp_index.xml"]
+        for filename in filenames:
+            self.assertTrue( os.path.isfile(os.path.join(out_path, filename)), filename )
+        with open( os.path.join(out_path, "ComplexExampleApp_index.xml") ) as f:
+            self.assertIn('<object class="wxFrame" name="FrameGrid" file="FrameGrid.xrc"/>', f.read())
+        import zipfile
+        with zipfile.ZipFile( os.path.join(out_path, "ComplexExampleApp.xrs") ) as archive:
+            self.assertEqual(archive.namelist(), filenames)
+        # each file can be loaded on its own
+        res = wx.xrc.XmlResource()
+        self.assertTrue( res.Load( os.path.join(out_path, "FrameGrid.xrc") ) )
 
     def test_WxgTemplateCodegenNotPossible(self):
         "Test for code generation from a template"
@@ -526,6 +543,172 @@ class TestGui(WXGladeGUITest):
         common.main._save_app(generated_filename)
         self._compare_files(compare_filename, generated_filename)
 
+    def test_lazy_imports(self):
+        "Test Python option 'lazy_imports': wx submodules are imported by the constructors; measure the import time"
+        infilename = self._get_casefile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        app = common.app_tree.root
+        app.properties["language"].set("python")
+        # import the generated module in a new interpreter; print the import time and whether wx.grid was imported
+        code = ( "import sys, time; sys.path.insert(0, %r); import wx; start = time.time(); import %s; "
+                 "print(time.time() - start); print('wx.grid' in sys.modules)" )
+        timings = {}
+        for lazy in (False, True):
+            module = "AllWidgets_30_lazy%d" % lazy
+            app.properties["lazy_imports"].set(lazy)
+            app.properties["output_path"].set( self._get_outputfile_path(module + ".py") )
+            app.generate_code()
+            self._assert_info_message(u'Code generation completed successfully')
+            output = subprocess.check_output( [sys.executable, "-c", code % (self.outDirectory, module)] )
+            timing, grid_imported = output.decode("ascii").split()
+            timings[lazy] = float(timing)
+            self.assertEqual( grid_imported, "False" if lazy else "True" )
+        # the generated module must not become slower to import; the tolerance is for timer resolution and noise
+        self.assertLess( timings[True], timings[False] + 0.1,
+                         "import time %.3fs with lazy imports, %.3fs without" % (timings[True], timings[False]) )
+
+    def test_minimal_includes(self):
+        "Test C++ options 'minimal_includes' and 'precompiled_header': headers include only what they need"
+        infilename = self._get_casefile_path('ComplexExample_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        app = common.app_tree.root
+        app.properties["language"].set("C++")
+        app.properties["multiple_files"].set(1)
+        app.properties["minimal_includes"].set(True)
+        app.properties["precompiled_header"].set(True)
+        out_path = self._get_outputfile_path("ComplexExample_30_minimal")
+        if not os.path.isdir(out_path): os.mkdir(out_path)
+        app.properties["output_path"].set(out_path)
+        app.generate_code()
+        self._assert_info_message(u'Code generation completed successfully')
+
+        def read(filename):
+            with open( os.path.join(out_path, filename) ) as f:
+                return f.read()
+        header = read("PyOgg2_MyFrame.h")
+        self.assertNotIn("#include <wx/wx.h>", header)
+        self.assertIn("#include <wx/frame.h>", header)
+        self.assertIn("class wxButton;", header)
+        # member types with an entry in _CLASS_HEADERS are included, never forward declared
+        for wx_class, include in (("wxToolBar", "<wx/toolbar.h>"), ("wxPanel", "<wx/panel.h>")):
+            self.assertIn("#include %s\n" % include, header)
+            self.assertNotIn("class %s;" % wx_class, header)
+        source = read("PyOgg2_MyFrame.cpp")
+        self.assertIn('#include "ComplexExampleApp_pch.h"\n#include "PyOgg2_MyFrame.h"\n', source)
+        self.assertIn("#include <wx/wx.h>", read("ComplexExampleApp_pch.h"))
+
+    def test_progressive_loading(self):
+        "Test loading in steps: the result must be the same as for loading at once"
+        infilename = self._get_casefile_path('BasesEtc.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        expected = []
+        common.app_tree.root.write(expected)
+
+        common.main._open_app(infilename, add_to_history=False, progressive=True)
+        for i in range(100):
+            if not common.main.is_loading(): break
+            self._process_wx_events()
+        self.assertFalse( common.main.is_loading() )
+        app = common.app_tree.root
+        self.assertTrue( app.saved )
+        for toplevel in app.children:
+            self.assertTrue( toplevel.item is not None and toplevel.item.IsOk() )
+        generated = []
+        app.write(generated)
+        self.assertEqual( "".join(expected[1:]), "".join(generated[1:]) )
+
+    def test_notebook_pages_created_on_selection(self):
+        "Test that the widgets on notebook pages are created when the page is shown the first time"
+        import depfile, misc
+        infilename = self._get_casefile_path('AllWidgets_30.wxg')
+        common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+        app = common.app_tree.root
+        app.children[0].create_widgets()
+        self._process_wx_events()
+        notebook = [w for w in depfile.iter_widgets(app) if w.WX_CLASS=="wxNotebook"][0]
+        first, second = notebook.children[:2]
+        self.assertTrue( first.children[0].widget )
+        self.assertTrue( second.widget )  # the page itself is required for the tab
+        self.assertFalse( second.children[0].widget )
+
+        # selecting a widget on the page will show the page
+        misc.set_focused_widget(second.children[0])
+        self._process_wx_events()
+        self.assertTrue( second.children[0].widget )
+        self.assertEqual( notebook.widget.GetSelection(), 1 )
+
+    def test_share_resources(self):
+        "Test application option 'share_resources': fonts and bitmaps used more than once are created once per class"
+        # MyPanel is a nested class of MyFrame; the frame must continue to use its own variables after MyPanel
+        self.load_and_generate('SharedResources', included=["python", "C++", "perl"], test_GUI=False)
+
+    def test_notebook_lazy_pages(self):
+        "Test notebook option 'lazy_pages': the content of sized pages is created by methods called on selection"
+        self.load_and_generate('Notebook_lazy_pages', included=["python", "C++"], test_GUI=False)
+
+    def test_table_threshold(self):
+        "Test application option 'table_threshold': grid and list control columns as table plus loop"
+        # list_ctrl_2 is below the threshold; the choices are not affected without option 'choices_file'
+        self.load_and_generate('TableThreshold', included=["python", "C++"], test_GUI=False)
+
+    def test_choices_file(self):
+        "Test application option 'choices_file': large choice lists are loaded from a data file, also on lazy pages"
+        self.load_and_generate('ChoicesFile', included=["python", "C++"], test_GUI=False)
+        # choice_2 is below the threshold and stays in the source file
+        self._compare_files( self._get_casefile_path("ChoicesFile_choices.json"),
+                             self._get_outputfile_path("ChoicesFile_choices.json") )
+
+    def test_DataTable(self):
+        "Test menubar and toolbar option 'data_table' for bars of a frame and toplevel bars, with the unrolled code"
+        self.load_and_generate('DataTable', included=["python", "C++"], test_GUI=False)
+        self.load_and_generate('DataTable_unrolled', included=["python", "C++"], test_GUI=False)
+
+    def test_embed_images(self):
+        "Test application option 'embed_images': the bitmaps are created from the data in a generated images module"
+        import ast, base64, zlib
+        # the C++ header includes the images header with the header extension of the application
+        self.load_and_generate('EmbedImages', included=["python", "C++"], test_GUI=False)
+
+        # the compressed data depends on the zlib version, so the data is compared after decoding
+        with open(self._get_outputfile_path("EmbedImages_images.py")) as f:
+            module = ast.parse(f.read())
+        values = {}
+        for node in module.body:
+            if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+        # missing files are loaded at runtime
+        self.assertEqual( values["_images"], {"../casefiles/icon.xpm": 0} )
+        with open(self._get_casefile_path("icon.xpm"), "rb") as f:
+            content = f.read()
+        self.assertEqual( zlib.decompress( base64.b64decode(values["_data"][0]) ), content )
+
+    def test_search_replace(self):
+        "Test the property index: searching and replacing event handlers and labels"
+        import search
+        search.start()
+        try:
+            infilename = self._get_casefile_path('AllWidgets_30.wxg')
+            common.main._open_app(infilename, use_progress_dialog=False, add_to_history=False)
+            found = search.find("handler", "OnNotebookPageChanged")
+            self.assertEqual( [(w.name, name) for w, prop, name, value in found], [("notebook_1", "handler")] )
+            notebook = found[0][0]
+            self.assertEqual( len(search.find("EVT_NOTEBOOK_PAGE_CHANGED", "OnNotebook*")), 1 )
+
+            self.assertEqual( search.replace("handler", "OnNotebookPageChanged", "OnPageChanged"), 1 )
+            self.assertEqual( search.find("handler", "OnNotebookPageChanged"), [] )
+            self.assertEqual( search.find(None, "OnPageChanged")[0][0], notebook )
+            self.assertTrue( "OnPageChanged" in [handler for event, handler in notebook.properties["events"].get()] )
+
+            # edits are tracked; deleted widgets are removed
+            checkbox = search.find("label", "three")[0][0]
+            checkbox.properties["label"].set("3")
+            self.assertEqual( search.find("label", "three"), [] )
+            self.assertEqual( search.find("label", "3")[0][0], checkbox )
+            checkbox.remove()
+            self.assertEqual( search.find("label", "3"), [] )
+        finally:
+            search.stop()
+
     def stop(self):
         print("XXX")  # nothing to do
 
@@ -0,0 +1,57 @@
+"""\
+Test the log handlers
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+from testsupport_new import WXGladeBaseTest
+
+import json, logging, sys
+import log
+
+
+class TestLog(WXGladeBaseTest):
+    "Test StringHandler and JSONFormatter"
+
+    def _make_record(self, msg, level=logging.WARNING, exc_info=None):
+        return logging.LogRecord("test", level, __file__, 42, msg, None, exc_info)
+
+    def test_StringHandler_ring_buffer(self):
+        "Test that the StringHandler keeps only the last records and reports the number of dropped ones"
+        handler = log.StringHandler(storeAsUnicode=False, capacity=3)
+        handler.setFormatter( logging.Formatter('%(levelname)s: %(message)s') )
+        for i in range(5):
+            handler.emit( self._make_record("message %d" % i) )
+        self.assertEqual( handler.getBufferAsList(clean=False),
+                          ["(2 older messages dropped)",
+                           "WARNING: message 2", "WARNING: message 3", "WARNING: message 4"] )
+        # reading with clean=True empties the buffer and resets the counter
+        self.assertEqual( len(handler.getBufferAsList()), 4 )
+        self.assertEqual( handler.getBufferAsList(), [] )
+        handler.emit( self._make_record("message 5") )
+        self.assertEqual( handler.getBufferAsString(), "WARNING: message 5" )
+
+    def test_StringHandler_exception(self):
+        "Test that exceptions are formatted when emitted and the traceback is not kept"
+        handler = log.StringHandler(storeAsUnicode=False)
+        try:
+            raise ValueError("test exception")
+        except ValueError:
+            record = self._make_record("failed", logging.ERROR, sys.exc_info())
+        handler.emit(record)
+        self.assertTrue( record.exc_info is not None )  # the record itself is left to the other handlers
+        self.assertTrue( handler.buffer[0].exc_info is None )
+        message = handler.getBufferAsString()
+        self.assertIn( "failed", message )
+        self.assertIn( "ValueError: test exception", message )
+
+    def test_JSONFormatter(self):
+        "Test that each record is formatted as one line of JSON"
+        formatter = log.JSONFormatter()
+        line = formatter.format( self._make_record("first line\nsecond line") )
+        self.assertNotIn("\n", line)
+        entry = json.loads(line)
+        self.assertEqual( entry["level"], "WARNING" )
+        self.assertEqual( entry["message"], "first line\nsecond line" )
+        self.assertEqual( entry["line"], 42 )
+        self.assertNotIn( "exception", entry )
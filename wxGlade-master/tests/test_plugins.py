@@ -0,0 +1,65 @@
+"""\
+Test the cached plugin index
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+from testsupport_new import WXGladeBaseTest
+
+import os, shutil, tempfile, time
+import plugins
+
+
+class TestPluginIndex(WXGladeBaseTest):
+
+    def setUp(self):
+        WXGladeBaseTest.setUp(self)
+        self.widget_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.widget_dir, "widgets.txt"), "w") as f:
+            f.write("[Controls]\nmybutton\nmylabel\n")
+        os.mkdir( os.path.join(self.widget_dir, "mybutton") )
+        os.mkdir( os.path.join(self.widget_dir, "mylabel") )
+        self._write_manifest("mybutton", "bases = EditMyButton\nclasses = wxMyButton\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.widget_dir)
+        WXGladeBaseTest.tearDown(self)
+
+    def _write_manifest(self, module_name, content, mtime=None):
+        filename = os.path.join(self.widget_dir, module_name, plugins.WidgetRegistry.manifest_filename)
+        with open(filename, "w") as f:
+            f.write(content)
+        # make sure that the modification time differs from the one stored in the index
+        if mtime is None: mtime = time.time() + 10
+        os.utime(filename, (mtime, mtime))
+
+    def _get_index(self, previous=None):
+        # a new index, as on the next start; previous: the index of the last session, as loaded from the file
+        index = plugins.PluginIndex()
+        index.directories = previous.directories  if previous else  {}
+        return index
+
+    def test_manifest_modified(self):
+        "Test that the index is rebuilt when a manifest is modified or added"
+        index = self._get_index()
+        self.assertEqual( index.get_manifest(self.widget_dir, "mybutton")["classes"], ["wxMyButton"] )
+        self.assertEqual( index.get_manifest(self.widget_dir, "mylabel"), None )
+        self.assertTrue( index.modified )
+
+        # unchanged: the cached data is used
+        index = self._get_index(index)
+        self.assertEqual( index.get_manifest(self.widget_dir, "mybutton")["classes"], ["wxMyButton"] )
+        self.assertFalse( index.modified )
+
+        # modified manifest
+        self._write_manifest("mybutton", "bases = EditMyButton\nclasses = wxMyButton wxMyOtherButton\n")
+        index = self._get_index(index)
+        self.assertEqual( index.get_manifest(self.widget_dir, "mybutton")["classes"],
+                          ["wxMyButton", "wxMyOtherButton"] )
+        self.assertTrue( index.modified )
+
+        # added manifest
+        self._write_manifest("mylabel", "bases = EditMyLabel\nclasses = wxMyLabel\n", time.time() + 20)
+        index = self._get_index(index)
+        self.assertEqual( index.get_manifest(self.widget_dir, "mylabel")["classes"], ["wxMyLabel"] )
+        self.assertTrue( index.modified )
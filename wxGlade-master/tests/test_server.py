@@ -0,0 +1,72 @@
+"""\
+Test the code generation server and its client; see server.py
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+from testsupport_new import WXGladeBaseTest
+
+import os, shutil, socket, subprocess, sys, tempfile, time, unittest
+import config, server
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+class TestServer(WXGladeBaseTest):
+
+    def setUp(self):
+        WXGladeBaseTest.setUp(self)
+        self.directory = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.directory, "wxglade.sock")
+        self.process = None
+
+    def tearDown(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        shutil.rmtree(self.directory)
+        WXGladeBaseTest.tearDown(self)
+
+    def _start_server(self):
+        args = [sys.executable, os.path.join(config.wxglade_path, "wxglade.py"),
+                "--server=%s" % self.socket_path, "--server-workers=1"]
+        self.process = subprocess.Popen(args)
+        for i in range(300):
+            if os.path.exists(self.socket_path): return
+            self.assertEqual( self.process.poll(), None, "server terminated" )
+            time.sleep(0.1)
+        self.fail("server did not create the socket")
+
+    def test_generate(self):
+        "Test a generate request through server.Client on a Unix domain socket"
+        self._start_server()
+        infilename = self._get_casefile_path('Tool_Menu_EventBinding.wxg')
+        generated_filename = self._get_outputfile_path('Tool_Menu_EventBinding_server.py')
+        if os.path.exists(generated_filename): os.remove(generated_filename)
+
+        with server.Client(self.socket_path) as client:
+            result = client.call("generate", project=infilename, language="python", out_path=generated_filename)
+            self.assertEqual( result["messages"], [] )
+            self.assertEqual( result["stats"]["counters"]["files written"], 1 )
+            self._compare_files( self._get_casefile_path('Tool_Menu_EventBinding.py'), generated_filename )
+
+            # errors are returned as JSON-RPC errors
+            with self.assertRaises(server.RemoteError) as context:
+                client.call("generate", project=infilename, language="COBOL")
+            self.assertEqual( context.exception.code, server.INVALID_PARAMS )
+            with self.assertRaises(server.RemoteError) as context:
+                client.call("unknown")
+            self.assertEqual( context.exception.code, server.METHOD_NOT_FOUND )
+
+            self.assertEqual( client.call("stats")["requests"]["generate"]["requests"], 2 )
+            self.assertEqual( client.call("shutdown"), None )
+        self.assertEqual( self.process.wait(), 0 )
+        self.assertFalse( os.path.exists(self.socket_path) )
+
+    def test_socket_path_not_a_socket(self):
+        "Test that the server refuses to start if the socket path is a regular file and keeps the file"
+        with open(self.socket_path, "w") as f:
+            f.write("not a socket")
+        args = [sys.executable, os.path.join(config.wxglade_path, "wxglade.py"), "--server=%s" % self.socket_path]
+        self.assertEqual( subprocess.call(args), 1 )
+        with open(self.socket_path) as f:
+            self.assertEqual( f.read(), "not a socket" )
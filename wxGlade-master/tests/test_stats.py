@@ -0,0 +1,76 @@
+"""\
+Test the timings and counters of command line code generation; see option --stats
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+from testsupport_new import WXGladeBaseTest
+
+import json, os, subprocess, sys
+import config, stats
+
+if sys.version_info[0]==2:
+    from StringIO import StringIO
+else:
+    from io import StringIO
+
+
+class TestStats(WXGladeBaseTest):
+
+    def tearDown(self):
+        stats.stop()
+        WXGladeBaseTest.tearDown(self)
+
+    def test_inactive(self):
+        "Test that the hooks do nothing until stats.start() has been called"
+        self.assertFalse( stats.active() )
+        with stats.timer("parse"):
+            stats.count("widgets")
+        self.assertEqual( stats.as_dict(), None )
+        stream = StringIO()
+        stats.report(stream)
+        self.assertEqual( stream.getvalue(), "" )
+
+    def test_timings_and_counters(self):
+        "Test that timings and counters are accumulated and reported"
+        stats.start("json")
+        for i in range(2):
+            with stats.timer("generate frame"):
+                stats.count("widgets", 3)
+        stats.count("files written")
+        stream = StringIO()
+        stats.report(stream)
+        data = json.loads( stream.getvalue() )
+        self.assertEqual( list(data["timings"]), ["generate frame"] )
+        self.assertEqual( data["counters"], {"widgets": 6, "files written": 1} )
+        self.assertGreaterEqual( data["total"], data["timings"]["generate frame"] )
+
+        # reset() keeps the output format
+        stats.reset()
+        self.assertEqual( stats.as_dict()["counters"], {} )
+        stats.count("widgets")
+        stream = StringIO()
+        stats.report(stream)
+        self.assertEqual( json.loads( stream.getvalue() )["counters"], {"widgets": 1} )
+
+    def test_command_line(self):
+        "Test option --stats=json: the phases and counters of a code generation; unchanged files are not written"
+        infilename = self._get_casefile_path('Tool_Menu_EventBinding.wxg')
+        generated_filename = self._get_outputfile_path('Tool_Menu_EventBinding_stats.py')
+        if os.path.exists(generated_filename): os.remove(generated_filename)
+        command = [sys.executable, os.path.join(config.wxglade_path, "wxglade.py"), "--stats=json",
+                   "-g", "python", "-o", generated_filename, infilename]
+        for run in range(2):
+            output = subprocess.check_output(command)
+            data = json.loads( output.decode("utf-8") )
+            for phase in ("init", "parse", "generate frame", "finalize"):
+                self.assertIn(phase, data["timings"])
+            counters = data["counters"]
+            self.assertEqual( counters["widgets"], 4 )
+            if run==0:
+                self.assertEqual( counters["files written"], 1 )
+                self.assertNotIn( "files unchanged", counters )
+            else:
+                self.assertEqual( counters["files unchanged"], 1 )
+                self.assertNotIn( "files written", counters )
+        self.assertTrue( os.path.isfile(generated_filename) )
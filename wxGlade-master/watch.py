@@ -0,0 +1,176 @@
+"""\
+Watch mode: keep the code writers and widget plugins loaded and re-generate code whenever a .wxg file or a bitmap
+referenced by it changes; see command line option --watch
+
+Files are polled by modification time. A change is processed only once the files have not been modified for the
+debounce delay, so an editor writing a file in several steps or a burst of saves results in one code generation.
+In multi-file mode, only the files of the toplevel windows that have changed are re-generated.
+
+@license: MIT (see LICENSE.txt) - THIS PROGRAM COMES WITH NO WARRANTY
+"""
+
+import logging, os, time
+
+import common, config, depfile, stats
+
+
+def _get_mtime(filename):
+    try:
+        return os.stat(filename).st_mtime
+    except EnvironmentError:
+        return None
+
+
+class Project(object):
+    "State of a watched .wxg file"
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.mtimes = {}        # filename -> mtime, for the .wxg file and the referenced bitmaps
+        self.settings = None    # XML of the application settings, i.e. without the toplevel windows
+        self.toplevels = None   # OrderedDict toplevel name -> XML, as of the last code generation
+        self.bitmaps = None     # bitmap filename -> mtime, as of the last code generation
+        self.changed = None     # time of the last modification that has not been processed yet
+
+    def get_changes(self):
+        "returns True if the .wxg file or one of the referenced bitmaps was modified, created or deleted"
+        filenames = set(self.mtimes)
+        filenames.add(self.filename)
+        for filename in filenames:
+            if _get_mtime(filename) != self.mtimes.get(filename):
+                return True
+        return False
+
+    def update_mtimes(self, bitmaps):
+        "store the current mtimes of the .wxg file and the given bitmap files"
+        self.mtimes = dict( (filename, _get_mtime(filename)) for filename in [self.filename] + list(bitmaps) )
+
+
+class Watcher(object):
+    "Polls the .wxg files in a directory tree and generates code for modified ones"
+    def __init__(self, directory, language, out_path=None, interval=0.5, delay=1.0):
+        self.directory = directory
+        self.language = language
+        self.out_path = out_path  # optional output directory; otherwise the projects' output paths are used
+        self.interval = interval  # polling interval in seconds
+        self.delay = delay        # debounce delay in seconds
+        self.projects = {}        # filename -> Project
+
+    def scan(self):
+        "returns the filenames of all .wxg files in the directory tree"
+        ret = []
+        for dirpath, dirnames, filenames in os.walk(self.directory):
+            dirnames[:] = [dn for dn in dirnames if not dn.startswith(".")]
+            ret.extend( os.path.join(dirpath, fn) for fn in filenames if fn.endswith(".wxg") )
+        return sorted(ret)
+
+    def poll(self):
+        "check all files once and process the projects that have not been modified for the debounce delay"
+        now = time.time()
+        filenames = self.scan()
+        for filename in set(self.projects) - set(filenames):
+            logging.info( _('Project removed: "%s"'), filename )
+            del self.projects[filename]
+        for filename in filenames:
+            project = self.projects.get(filename)
+            if project is None:
+                project = self.projects[filename] = Project(filename)
+                project.changed = now
+            elif project.get_changes():
+                project.update_mtimes( [fn for fn in project.mtimes if fn!=filename] )
+                project.changed = now  # (re-)start the debounce delay
+
+        ret = []
+        for filename in filenames:
+            project = self.projects[filename]
+            if project.changed is None or now - project.changed < self.delay: continue
+            project.changed = None
+            if self.process(project):
+                ret.append(filename)
+        return ret
+
+    def process(self, project):
+        "load and generate code for the changed parts; returns True if code was generated"
+        import application, wxglade
+        common.root = app = application.Application()
+        if not wxglade._guiless_open_app(project.filename):
+            # e.g. the file is still being written; keep the previous state and wait for the next modification
+            project.update_mtimes( [fn for fn in project.mtimes if fn!=project.filename] )
+            return False
+        project.update_mtimes( depfile.get_bitmaps(app) )
+        if app.is_template: return False
+
+        settings, toplevels = self.serialize(app)
+        bitmaps = dict( (fn, mtime) for fn, mtime in project.mtimes.items() if fn!=project.filename )
+        if settings==project.settings and toplevels==project.toplevels and bitmaps==project.bitmaps:
+            logging.info( _('"%s": no changes'), project.filename )
+            return False
+        widgets = None  # all
+        if settings==project.settings and bitmaps==project.bitmaps and app.multiple_files and \
+                project.toplevels is not None and list(toplevels)==list(project.toplevels):
+            # only the files for the changed toplevel windows need to be re-generated
+            widgets = [c for c in app.children if toplevels[c.name]!=project.toplevels[c.name]]
+
+        logging.info( _('Generating %s code for "%s"'), self.language, project.filename )
+        try:
+            self.generate(app, widgets)
+        except Exception:
+            if config.debugging: raise
+            logging.exception( _('Internal Error') )
+            return False
+        project.settings = settings
+        project.toplevels = toplevels
+        project.bitmaps = bitmaps
+        return True
+
+    def generate(self, app, widgets=None):
+        if self.language=="lisp" and app.for_version!="2.8":
+            logging.warning( _('"%s": Lisp supports wx 2.8 only'), app.filename )
+        app.properties["language"].set(self.language)
+        out_path = None
+        if self.out_path:
+            if app.multiple_files:
+                out_path = self.out_path
+            else:
+                basename = os.path.splitext(os.path.basename(app.filename))[0]
+                extension = common.code_writers[self.language].default_extensions[0]
+                out_path = os.path.join(self.out_path, "%s.%s" % (basename, extension))
+        if widgets is None:
+            app.generate_code(out_path=out_path)
+            return
+        for widget in widgets:
+            # the code writer records "generate <name>" itself; this includes writing the file
+            with stats.timer("watch cycle %s" % widget.name):
+                app.generate_code(out_path=out_path, widget=widget)
+
+    @staticmethod
+    def serialize(app):
+        "returns the XML of the application settings and an OrderedDict toplevel name -> XML"
+        from collections import OrderedDict
+        toplevels = OrderedDict()
+        for c in app.children:
+            output = []
+            c.write(output, 1)
+            toplevels[c.name] = "".join(output)
+        output = []
+        app.write(output)
+        settings = "".join(output[1:])  # without the header with the time stamp
+        for xml in toplevels.values():
+            settings = settings.replace(xml, "")
+        return settings, toplevels
+
+    def run(self):
+        "poll until interrupted by Ctrl-C; returns the exit code"
+        if not os.path.isdir(self.directory):
+            logging.error( _('Directory "%s" does not exist'), self.directory )
+            return 1
+        logging.info( _('Watching "%s" for changes; press Ctrl-C to stop'), self.directory )
+        try:
+            while True:
+                stats.reset()  # report the timings of each round separately
+                if self.poll():
+                    stats.report()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
@@ -518,21 +518,26 @@ class BaseWidgetWriter(StylesMixin, BaseCodeWriter):
                                                'bitmap': self.codegen.quote_path(preview_icon),
                                                'bitmap_type': self.codegen.cn('wxBITMAP_TYPE_XPM') }
 
+        if bitmap.startswith('code:'):  return '%s' % self.codegen.cn(bitmap[5:].strip())
+
         if bitmap.startswith('var:'):
-            return self.tmpl_inline_bitmap % { 'name': self.codegen.cn('wxBitmap'),
+            stmt = self.tmpl_inline_bitmap % { 'name': self.codegen.cn('wxBitmap'),
                                                'bitmap': bitmap[4:].strip(),
                                                'bitmap_type': self.codegen.cn('wxBITMAP_TYPE_ANY') }
-
-        if bitmap.startswith('empty:'): return self.get_inline_stmt_emptybitmap(bitmap)
-        if bitmap.startswith('art:'):   return self.get_inline_stmt_artprovider(bitmap) 
-        if bitmap.startswith('code:'):  return '%s' % self.codegen.cn(bitmap[5:].strip())
-
-        if preview:
-            bitmap = misc.get_absolute_path(bitmap, True)
-
-        return self.tmpl_inline_bitmap % { 'name': self.codegen.cn('wxBitmap'),
-                                           'bitmap': self.codegen.quote_path(bitmap),
-                                           'bitmap_type': self.codegen.cn('wxBITMAP_TYPE_ANY') }
+        elif bitmap.startswith('empty:'):
+            stmt = self.get_inline_stmt_emptybitmap(bitmap)
+        elif bitmap.startswith('art:'):
+            stmt = self.get_inline_stmt_artprovider(bitmap)
+        else:
+            stmt = self.codegen.get_embedded_image(bitmap)
+            if stmt is not None: return stmt  # cached by the images module already
+            if preview:
+                bitmap = misc.get_absolute_path(bitmap, True)
+            stmt = self.tmpl_inline_bitmap % { 'name': self.codegen.cn('wxBitmap'),
+                                               'bitmap': self.codegen.quote_path(bitmap),
+                                               'bitmap_type': self.codegen.cn('wxBITMAP_TYPE_ANY') }
+        # the same bitmap may be used by several widgets
+        return self.codegen._get_shared_resource('bitmap', stmt)
 
     def get_code(self, obj):
         """Generates language specific code for the wxWidget object from a template by filling variables
@@ -982,6 +987,14 @@ class PythonWidgetCodeWriter(PythonMixin, BaseWidgetWriter):
 
         return
 
+    def _prepare_choice(self, obj):
+        BaseWidgetWriter._prepare_choice(self, obj)
+        # large choice lists may be loaded from the choices file; the templates put the choices into a list display
+        choices = self.codegen.get_choices_from_file(obj)
+        if choices:
+            fmt = '_(s) for s in %s'  if self.codegen._use_gettext else  's for s in %s'
+            self.tmpl_dict['choices'] = fmt % choices
+
 
 
 class XrcWidgetCodeWriter(XRCMixin, BaseWidgetWriter):
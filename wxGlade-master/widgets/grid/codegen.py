@@ -12,6 +12,22 @@ import wcodegen
 from wcodegen.taghandler import BaseCodeWriterTagHandler
 
 
+def _get_labels_sizes(prop):
+    "returns a list of (index, label or None, size) for the rows or columns with non-default label or size"
+    ret = []
+    for i, (label, size) in enumerate(prop.value):
+        label = label.replace('\\n', '\n')  if prop._check_label(label, i) else  None
+        if label is not None or size>0:
+            ret.append( (i, label, size) )
+    return ret
+
+
+def _use_table(codegen, entries):
+    # the number of statements to be replaced by a table and a loop
+    count = sum( (label is not None) + (size>0) for i, label, size in entries )
+    return codegen.use_table(count)
+
+
 class PythonCodeGenerator(wcodegen.PythonWidgetCodeWriter):
     import_modules = ['import wx.grid\n']
 
@@ -70,25 +86,33 @@ class PythonCodeGenerator(wcodegen.PythonWidgetCodeWriter):
             sel_mode = sel_mode.replace('wxGrid.wxGrid','')
             out.append('%s.SetSelectionMode(%s)\n' % (name, self.cn('wxGrid') + "." + sel_mode))
 
-        # set columns
-        for i, (label, size) in enumerate(columns):
-            if cols_p._check_label(label, i):
-                label = label.replace('\\n', '\n')
-                out.append( '%s.SetColLabelValue(%s, %s)\n' % (name, i, self.codegen.quote_str(label)) )
-            if size>0:
-                out.append( '%s.SetColSize(%s, %s)\n' % (name, i, size) )
-
-        # set rows
-        for i, (label, size) in enumerate(rows):
-            if rows_p._check_label(label, i):
-                label = label.replace('\\n', '\n')
-                out.append( '%s.SetRowLabelValue(%s, %s)\n' % (name, i, self.codegen.quote_str(label)) )
-            if size>0:
-                out.append( '%s.SetRowSize(%s, %s)\n' % (name, i, size) )
+        # set columns and rows
+        for what, prop in (("Col", cols_p), ("Row", rows_p)):
+            entries = _get_labels_sizes(prop)
+            if _use_table(self.codegen, entries):
+                out.extend( self.get_table_code(name, what, entries) )
+                continue
+            for i, label, size in entries:
+                if label is not None:
+                    out.append( '%s.Set%sLabelValue(%s, %s)\n' % (name, what, i, self.codegen.quote_str(label)) )
+                if size>0:
+                    out.append( '%s.Set%sSize(%s, %s)\n' % (name, what, i, size) )
 
         out.extend(self.codegen.generate_code_common_properties(obj))
         return out
 
+    def get_table_code(self, name, what, entries):
+        "the labels and sizes of the columns or rows (what is 'Col' or 'Row') as table of tuples plus loop"
+        tab = self.codegen.tabs(1)
+        out = ['for i, label, size in (\n']
+        for i, label, size in entries:
+            label = 'None'  if label is None else  self.codegen.quote_str(label)
+            out.append( '%s(%s, %s, %s),\n' % (tab*2, i, label, size) )
+        out += [tab*2 + '):\n',
+                tab + 'if label is not None: %s.Set%sLabelValue(i, label)\n' % (name, what),
+                tab + 'if size > 0: %s.Set%sSize(i, size)\n' % (name, what)]
+        return out
+
 
 
 class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
@@ -139,24 +163,46 @@ class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
         if sel_mode and sel_mode != 'wxGrid::wxGridSelectCells':
             out.append('%s->SetSelectionMode(%s);\n' % (name, sel_mode))
 
-        # set columns
-        for i, (label, size) in enumerate(columns):
-            if cols_p._check_label(label, i):
-                label = label.replace('\\n', '\n')
-                out.append('%s->SetColLabelValue(%s, %s);\n' % (name, i, self.codegen.quote_str(label)))
-            if size>0:
-                out.append('%s->SetColSize(%s, %s);\n' % (name, i, size))
-        # set rows
-        for i, (label, size) in enumerate(rows):
-            if rows_p._check_label(label, i):
-                label = label.replace('\\n', '\n')
-                out.append('%s->SetRowLabelValue(%s, %s);\n' % (name, i, self.codegen.quote_str(label)))
-            if size>0:
-                out.append('%s->SetRowSize(%s, %s);\n' % (name, i, size))
+        # set columns and rows
+        for what, prop in (("Col", cols_p), ("Row", rows_p)):
+            entries = _get_labels_sizes(prop)
+            if _use_table(self.codegen, entries):
+                out.extend( self.get_table_code(name, what, entries) )
+                continue
+            for i, label, size in entries:
+                if label is not None:
+                    out.append('%s->Set%sLabelValue(%s, %s);\n' % (name, what, i, self.codegen.quote_str(label)))
+                if size>0:
+                    out.append('%s->Set%sSize(%s, %s);\n' % (name, what, i, size))
 
         out.extend(self.codegen.generate_code_common_properties(obj))
         return out
 
+    def get_table_code(self, name, what, entries):
+        "the labels and sizes of the columns or rows (what is 'Col' or 'Row') as array of structs plus loop"
+        tab = self.codegen.tabs(1)
+        out = ['{\n',
+               tab + 'struct wxglade_label_size {\n',
+               tab*2 + 'int index;\n',
+               tab*2 + 'bool has_label;\n',
+               tab*2 + 'wxString label;\n',
+               tab*2 + 'int size;\n',
+               tab + '};\n',
+               tab + 'const wxglade_label_size wxglade_table[] = {\n']
+        for i, label, size in entries:
+            if label is None:
+                out.append( '%s{%s, false, wxEmptyString, %s},\n' % (tab*2, i, size) )
+            else:
+                out.append( '%s{%s, true, %s, %s},\n' % (tab*2, i, self.codegen.quote_str(label), size) )
+        out += [tab + '};\n',
+                tab + 'for (size_t i = 0; i < sizeof(wxglade_table) / sizeof(wxglade_table[0]); i++) {\n',
+                tab*2 + 'const wxglade_label_size& entry = wxglade_table[i];\n',
+                tab*2 + 'if (entry.has_label) %s->Set%sLabelValue(entry.index, entry.label);\n' % (name, what),
+                tab*2 + 'if (entry.size > 0) %s->Set%sSize(entry.index, entry.size);\n' % (name, what),
+                tab + '}\n',
+                '}\n']
+        return out
+
 
 
 def xrc_code_generator(obj):
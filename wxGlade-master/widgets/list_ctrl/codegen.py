@@ -25,9 +25,12 @@ class ListCtrlPropertyGeneratorMixin(object):
         cols_p = obj.properties["columns"]
         columns = cols_p.value
 
-        for i, (heading,width) in enumerate(columns):
-            values = {"name":name, "heading":self.codegen.quote_str(heading), "width":width, "col":i}
-            out.append( self.tmpl_append_column % values )
+        if self.codegen.use_table( len(columns) ):
+            out.extend( self.get_table_code(name, columns) )
+        else:
+            for i, (heading,width) in enumerate(columns):
+                values = {"name":name, "heading":self.codegen.quote_str(heading), "width":width, "col":i}
+                out.append( self.tmpl_append_column % values )
 
         if self.codegen.preview:
             for r in range(rows_number):
@@ -41,17 +44,46 @@ class PythonListCtrlGenerator(ListCtrlPropertyGeneratorMixin, wcodegen.PythonWid
 
     # templates for adding columns and rows (rows are for preview only)
     if compat.IS_PHOENIX:
-        tmpl_append_column = '%(name)s.AppendColumn(%(heading)s, format=wx.LIST_FORMAT_LEFT, width=%(width)d)\n'
+        tmpl_append_column = '%(name)s.AppendColumn(%(heading)s, format=wx.LIST_FORMAT_LEFT, width=%(width)s)\n'
         tmpl_append_row = '%s.InsertItem(%d, "")\n'
     else:
-        tmpl_append_column ='%(name)s.InsertColumn(%(col)d, %(heading)s, format=wx.LIST_FORMAT_LEFT, width=%(width)d)\n'
+        tmpl_append_column ='%(name)s.InsertColumn(%(col)s, %(heading)s, format=wx.LIST_FORMAT_LEFT, width=%(width)s)\n'
         tmpl_append_row = '%s.InsertStringItem(%d, "")\n'
 
+    def get_table_code(self, name, columns):
+        "the columns as table of tuples plus loop"
+        tab = self.codegen.tabs(1)
+        out = ['for i, (heading, width) in enumerate((\n']
+        for heading, width in columns:
+            out.append( '%s(%s, %s),\n' % (tab*2, self.codegen.quote_str(heading), width) )
+        values = {"name":name, "heading":"heading", "width":"width", "col":"i"}
+        out += [tab*2 + ')):\n',
+                tab + self.tmpl_append_column % values]
+        return out
+
 
 class CppListCtrlGenerator(ListCtrlPropertyGeneratorMixin, wcodegen.CppWidgetCodeWriter):
     import_modules = ['<wx/listctrl.h>']
     tmpl = '%(name)s = new %(klass)s(%(parent)s, %(id)s%(style)s);\n'
-    tmpl_append_column = '%(name)s->AppendColumn(%(heading)s, wxLIST_FORMAT_LEFT, %(width)d);\n'
+    tmpl_append_column = '%(name)s->AppendColumn(%(heading)s, wxLIST_FORMAT_LEFT, %(width)s);\n'
+
+    def get_table_code(self, name, columns):
+        "the columns as array of structs plus loop"
+        tab = self.codegen.tabs(1)
+        out = ['{\n',
+               tab + 'struct wxglade_column {\n',
+               tab*2 + 'wxString heading;\n',
+               tab*2 + 'int width;\n',
+               tab + '};\n',
+               tab + 'const wxglade_column wxglade_table[] = {\n']
+        for heading, width in columns:
+            out.append( '%s{%s, %s},\n' % (tab*2, self.codegen.quote_str(heading), width) )
+        values = {"name":name, "heading":"wxglade_table[i].heading", "width":"wxglade_table[i].width", "col":"i"}
+        out += [tab + '};\n',
+                tab + 'for (size_t i = 0; i < sizeof(wxglade_table) / sizeof(wxglade_table[0]); i++)\n',
+                tab*2 + self.tmpl_append_column % values,
+                '}\n']
+        return out
 
 
 def xrc_code_generator(obj):
@@ -15,7 +15,17 @@ class PythonMenubarGenerator(wcodegen.PythonWidgetCodeWriter):
     def get_properties_code(self, obj):
         return []
 
+    def _get_id(self, item, id_declarations):
+        # returns the id argument and the id to bind the handler to, or None to use item.GetId()
+        id_declaration, val = self.codegen.generate_code_id(None, item.id)
+        if self.codegen.preview or (not id_declaration and ( not val or val == '-1')):
+            return self.cn('wxNewId()'), None
+        if id_declaration: id_declarations.append(id_declaration)
+        return val, (val if val!='wx.ID_ANY' else None)
+
     def get_init_code(self, obj):
+        if obj.data_table:
+            return self.get_table_code(obj)
         cn = self.cn
         out = []
         quote_str = self.codegen.quote_str
@@ -29,14 +39,7 @@ class PythonMenubarGenerator(wcodegen.PythonWidgetCodeWriter):
                     out.append('%s.AppendSeparator()\n' % menu)
                     continue
 
-                id_access = None  # default: access via item.GetId()
-                id_declaration, val = self.codegen.generate_code_id(None, item.id)
-                if self.codegen.preview or (not id_declaration and ( not val or val == '-1')):
-                    id = cn('wxNewId()')
-                else:
-                    if id_declaration: id_declarations.append(id_declaration)
-                    id = val
-                    if val!='wx.ID_ANY': id_access = val
+                id, id_access = self._get_id(item, id_declarations)
 
                 label = quote_str(item.label)
                 help_str = quote_str(item.help_str)
@@ -91,6 +94,74 @@ class PythonMenubarGenerator(wcodegen.PythonWidgetCodeWriter):
 
         return id_declarations + out
 
+    def get_table_code(self, obj):
+        "like get_init_code, but the menus are stored in a table of tuples that is processed by a loop"
+        cn = self.cn
+        quote_str = self.codegen.quote_str
+        tab = self.codegen.tabs(1)
+        id_declarations = []
+        if not obj.menus: return []
+
+        def format_items(items, level):
+            # one tuple (id, label, help, kind, attribute name, handler, sub items) per item; None for separators
+            ret = []
+            indent = tab*level
+            for item in items:
+                if item.name == '---':
+                    ret.append( '%sNone,\n' % indent )
+                    continue
+                id, id_access = self._get_id(item, id_declarations)
+                args = [id, quote_str(item.label), quote_str(item.help_str)]
+                if item.children:
+                    args += ['None', 'None', 'None']
+                    ret.append( '%s(%s, (\n' % (indent, ", ".join(args)) )
+                    ret.extend( format_items(item.children, level+1) )
+                    ret.append( '%s)),\n' % (tab*(level+1)) )
+                    continue
+                if item.checkable:  args.append( cn('wxITEM_CHECK') )
+                elif item.radio:    args.append( cn('wxITEM_RADIO') )
+                else:               args.append( cn('wxITEM_NORMAL') )
+                args.append( '"%s"'%item.name if item.name else 'None' )
+                if item.handler:
+                    args.append( item.handler if "." in item.handler else "self.%s"%item.handler )
+                else:
+                    args.append( 'None' )
+                ret.append( '%s(%s, None),\n' % (indent, ", ".join(args)) )
+            return ret
+
+        table = []
+        for m in obj.menus:
+            menu = m.root
+            name = '"%s"'%menu.name if menu.name else 'None'
+            table.append( '%s(%s, %s, (\n' % (tab*2, quote_str(menu.label), name) )
+            table.extend( format_items(menu.children or [], 3) )
+            table.append( '%s)),\n' % (tab*3) )
+
+        obj_name = self.format_widget_access(obj)
+        append_menu = 'Append' if compat.IS_PHOENIX else 'AppendMenu'
+        out = ['def wxglade_append_items(menu, items):\n',
+               tab + 'for item in items:\n',
+               tab*2 + 'if item is None:\n',
+               tab*3 + 'menu.AppendSeparator()\n',
+               tab*3 + 'continue\n',
+               tab*2 + 'id, label, help_str, kind, name, handler, sub_items = item\n',
+               tab*2 + 'if sub_items is not None:\n',
+               tab*3 + 'sub_menu = %s()\n' % cn('wxMenu'),
+               tab*3 + 'wxglade_append_items(sub_menu, sub_items)\n',
+               tab*3 + 'menu.%s(id, label, sub_menu, help_str)\n' % append_menu,
+               tab*3 + 'continue\n',
+               tab*2 + 'item = menu.Append(id, label, help_str, kind)\n',
+               tab*2 + 'if name: setattr(%s, name, item)\n' % obj_name,
+               tab*2 + 'if handler: self.Bind(wx.EVT_MENU, handler, id=item.GetId())\n',
+               'for label, name, items in (\n']
+        out.extend(table)
+        out.append( tab*2 + '):\n' )
+        out.append( tab + 'wxglade_tmp_menu = %s()\n' % cn('wxMenu') )
+        out.append( tab + 'if name: setattr(self, name, wxglade_tmp_menu)\n' )
+        out.append( tab + 'wxglade_append_items(wxglade_tmp_menu, items)\n' )
+        out.append( tab + '%s.Append(wxglade_tmp_menu, label)\n' % obj_name )
+        return id_declarations + out
+
     def get_code(self, obj):
         if obj.klass == obj.WX_CLASS:
             klass = self.cn(obj.klass)
@@ -180,12 +251,37 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
 
     def get_code(self, obj):
         init = [ '%s = new %s();\n' % (obj.name, obj.klass) ]
-        init.extend(self.get_properties_code(obj))
+        if not obj.IS_CLASS:  # if it's a class, then the menus will be generated in the class code
+            init.extend(self.get_properties_code(obj))
         init.append('SetMenuBar(%s);\n' % obj.name)
         ids = self.get_ids_code(obj)
         return init, ids, []
 
+    def _get_id(self, item):
+        # returns the id argument and the id to bind the handler to, or None to use item->GetId()
+        name, val = self.codegen.generate_code_id(None, item.id)
+        if not name and val == '-1':
+            return 'wxNewId()', None
+        return val, (val if val!='wxID_ANY' else None)
+
+    def _get_class(self, obj):
+        # the class that holds the attributes and handlers: the menubar itself if it's a class, e.g. a toplevel one
+        return obj if obj.IS_CLASS else obj.parent
+
+    def _get_handlers(self, items):
+        ret = []
+        for item in items:
+            if item.handler and item.name != '---': ret.append(item.handler)
+            if item.children: ret.extend( self._get_handlers(item.children) )
+        return ret
+
     def get_properties_code(self, obj):
+        code_obj = self._get_class(obj)
+        if obj.data_table:
+            # the handlers are stored as member function pointers of the class
+            handlers = self._get_handlers( [m.root for m in obj.menus] )
+            if all(h.rsplit("::", 1)[0]==code_obj.klass for h in handlers if "::" in h):
+                return self.get_table_code(obj)
         out = []
         quote_str = self.codegen.quote_str
 
@@ -194,14 +290,7 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
                 if item.name == '---':  # item is a separator
                     out.append('%s->AppendSeparator();\n' % menu)
                     continue
-                id_access = None
-                name, val = self.codegen.generate_code_id(None, item.id)
-                if not name and val == '-1':
-                    id = 'wxNewId()'
-                else:
-                    #if name: ids.append(name)
-                    id = val
-                    if val!='wxID_ANY': id_access = val
+                id, id_access = self._get_id(item)
 
                 label = quote_str(item.label)
                 help_str = quote_str(item.help_str)
@@ -218,7 +307,7 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
 
                     if item.name:
                         # assign to attribute
-                        self.codegen.classes[obj.parent].sub_objs.append( ('wxMenuItem',item.name) )
+                        self.codegen.classes[code_obj].sub_objs.append( ('wxMenuItem',item.name) )
                         assignment = '%s = '%item.name
                         if not id_access:
                             id_access = "%s->GetId()"%item.name
@@ -236,7 +325,7 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
                         out.append( '%s%s->Append(%s, %s, %s);\n' % (assignment, menu, id, label, help_str) )
 
                     if item.handler:
-                        handler = item.handler if "::" in item.handler else '%s::%s'%(obj.parent.klass, item.handler)
+                        handler = item.handler if "::" in item.handler else '%s::%s'%(code_obj.klass, item.handler)
 
                         if self.codegen.for_version==(2,8):
                             tmpl = 'Connect(%(id)s, wxEVT_COMMAND_MENU_SELECTED, wxCommandEventHandler(%(handler)s));\n'
@@ -253,7 +342,7 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
             if menu.name:
                 # assign to attribute
                 name = menu.name
-                self.codegen.classes[obj.parent].sub_objs.append( ('wxMenu',menu.name) )
+                self.codegen.classes[code_obj].sub_objs.append( ('wxMenu',menu.name) )
             else:
                 name = 'wxglade_tmp_menu'
             out.append('%s = new wxMenu();\n' % name)
@@ -264,6 +353,106 @@ class CppMenubarGenerator(wcodegen.CppWidgetCodeWriter):
             out.insert(1, "wxMenuItem *wxglade_tmp_item;\n" )
         return out
 
+    def get_table_code(self, obj):
+        """like get_properties_code, but the menus are stored in an array of structs that is processed by a loop;
+        nested menus are enclosed in begin and end entries"""
+        if not obj.menus: return []
+        quote_str = self.codegen.quote_str
+        tab = self.codegen.tabs(1)
+        code_obj = self._get_class(obj)
+        klass = code_obj.klass
+        entries = []
+        depth = [0]
+
+        def add_entry(type_, id='0', label='wxEmptyString', help_str='wxEmptyString', kind='wxITEM_NORMAL',
+                      menu='NULL', item='NULL', handler='NULL'):
+            entries.append( '%s{%s},\n' % (tab, ", ".join([type_, id, label, help_str, kind, menu, item, handler])) )
+
+        def add_items(items, level):
+            depth[0] = max(depth[0], level)
+            for item in items:
+                if item.name == '---':
+                    add_entry('1')
+                    continue
+                id, id_access = self._get_id(item)
+                if item.children:
+                    add_entry('2', id, quote_str(item.label), quote_str(item.help_str))
+                    add_items(item.children, level+1)
+                    add_entry('3')
+                    continue
+                if item.checkable: kind = 'wxITEM_CHECK'
+                elif item.radio:   kind = 'wxITEM_RADIO'
+                else:              kind = 'wxITEM_NORMAL'
+                attribute = 'NULL'
+                if item.name:
+                    self.codegen.classes[code_obj].sub_objs.append( ('wxMenuItem',item.name) )
+                    attribute = '&%s' % item.name
+                handler = 'NULL'
+                if item.handler:
+                    handler = '&' + (item.handler if "::" in item.handler else '%s::%s'%(klass, item.handler))
+                add_entry('0', id, quote_str(item.label), quote_str(item.help_str), kind, item=attribute,
+                          handler=handler)
+
+        for m in obj.menus:
+            menu = m.root
+            attribute = 'NULL'
+            if menu.name:
+                self.codegen.classes[code_obj].sub_objs.append( ('wxMenu',menu.name) )
+                attribute = '&%s' % menu.name
+            add_entry('2', label=quote_str(menu.label), menu=attribute)
+            add_items(menu.children or [], 1)
+            add_entry('3')
+
+        if self.codegen.for_version==(2,8):
+            bind = 'Connect(wxglade_item->GetId(), wxEVT_COMMAND_MENU_SELECTED, ' \
+                   '(wxObjectEventFunction)(wxEventFunction)' \
+                   'wxStaticCastEvent(wxCommandEventFunction, entry.handler));\n'
+        else:
+            bind = 'Bind(wxEVT_MENU, entry.handler, this, wxglade_item->GetId());\n'
+        obj_name = self.codegen.format_generic_access(obj)
+        size = depth[0] + 1
+        out = ['struct wxglade_menu_entry {\n',
+               tab + 'int type;  // 0: item, 1: separator, 2: begin of a menu or sub menu, 3: end of a menu\n',
+               tab + 'long id;\n',
+               tab + 'wxString label;\n',
+               tab + 'wxString help;\n',
+               tab + 'wxItemKind kind;\n',
+               tab + 'wxMenu** menu;      // attribute to store the menu or NULL\n',
+               tab + 'wxMenuItem** item;  // attribute to store the item or NULL\n',
+               tab + 'void (%s::*handler)(wxCommandEvent&);\n' % klass,
+               '};\n',
+               'const wxglade_menu_entry wxglade_menu_entries[] = {\n']
+        out.extend(entries)
+        out.extend( ['};\n',
+                     'wxMenu* wxglade_menus[%d];\n' % size,
+                     'size_t wxglade_menu_starts[%d];\n' % size,
+                     'int wxglade_level = -1;\n',
+                     'for (size_t i = 0; i < sizeof(wxglade_menu_entries) / sizeof(wxglade_menu_entries[0]); i++) {\n',
+                     tab + 'const wxglade_menu_entry& entry = wxglade_menu_entries[i];\n',
+                     tab + 'if (entry.type == 2) {\n',
+                     tab*2 + 'wxglade_menus[++wxglade_level] = new wxMenu();\n',
+                     tab*2 + 'wxglade_menu_starts[wxglade_level] = i;\n',
+                     tab*2 + 'if (entry.menu) *entry.menu = wxglade_menus[wxglade_level];\n',
+                     tab + '} else if (entry.type == 3) {\n',
+                     tab*2 + 'const wxglade_menu_entry& start = '
+                             'wxglade_menu_entries[wxglade_menu_starts[wxglade_level]];\n',
+                     tab*2 + 'wxMenu* wxglade_tmp_menu = wxglade_menus[wxglade_level--];\n',
+                     tab*2 + 'if (wxglade_level < 0)\n',
+                     tab*3 + '%sAppend(wxglade_tmp_menu, start.label);\n' % obj_name,
+                     tab*2 + 'else\n',
+                     tab*3 + 'wxglade_menus[wxglade_level]->Append(start.id, start.label, wxglade_tmp_menu, '
+                             'start.help);\n',
+                     tab + '} else if (entry.type == 1) {\n',
+                     tab*2 + 'wxglade_menus[wxglade_level]->AppendSeparator();\n',
+                     tab + '} else {\n',
+                     tab*2 + 'wxMenuItem* wxglade_item = wxglade_menus[wxglade_level]->Append(entry.id, entry.label, '
+                             'entry.help, entry.kind);\n',
+                     tab*2 + 'if (entry.item) *entry.item = wxglade_item;\n',
+                     tab*2 + 'if (entry.handler) ' + bind,
+                     tab + '}\n',
+                     '}\n'] )
+        return out
+
     def get_ids_code(self, obj):
         ids = []
 
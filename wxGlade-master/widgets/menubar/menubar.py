@@ -716,9 +716,14 @@ class EditMenuBar(EditBase, PreviewMixin):
 
     WX_CLASS = "wxMenuBar"
     CAN_BE_CLASS = True
-    _PROPERTIES = ["menus", "preview"]
+    _PROPERTIES = ["menus", "data_table", "preview"]
     PROPERTIES = EditBase.PROPERTIES + _PROPERTIES + EditBase.EXTRA_PROPERTIES
     CHILDREN = 0
+    _PROPERTY_LABELS = {"data_table":"Generate data table"}
+    _PROPERTY_HELP = {"data_table":"Python and C++ only:\n"
+                                   "Generate a table of the menu items and a loop to create them,\n"
+                                   "instead of one or more statements per item.\n"
+                                   "This keeps the generated code short for large menus."}
 
     def __init__(self, name, klass, parent):
         if parent.IS_ROOT:
@@ -732,6 +737,7 @@ class EditMenuBar(EditBase, PreviewMixin):
         EditBase.__init__(self, name, klass, parent, custom_class, pos)
 
         self.menus = MenuProperty()
+        self.data_table = np.CheckBoxProperty(False, default_value=False)
         self.window_id = None  # just a dummy for code generation
 
         self._mb = None  # the real menubar
@@ -11,7 +11,24 @@ import common
 import wcodegen
 
 
-class PythonNotebookGenerator(wcodegen.PythonWidgetCodeWriter):
+class LazyPagesMixin(object):
+    "Code for the property lazy_pages: the content of pages is created when the page is selected the first time"
+
+    def is_lazy_page(self, obj, page):
+        "called by codegen.BaseLangCodeWriter._is_lazy_page() for each child of the notebook obj"
+        if not obj.check_prop_truth("lazy_pages"): return False
+        if page.IS_SLOT or page is obj.children[0]: return False  # the first page is visible initially
+        # the empty page keeps its size as minimum size, i.e. the notebook is sized from the created pages and the
+        # sizes of the deferred ones, as it would be with content
+        if not page.check_prop("size"): return False
+        # the sizer of the page is used to find out whether the content has been created already
+        return any(c is not None and c.IS_SIZER for c in page.get_all_children())
+
+    def _get_page_method_name(self, obj, page):
+        return "_create_%s_page_%d" % (obj.name, obj.children.index(page))
+
+
+class PythonNotebookGenerator(LazyPagesMixin, wcodegen.PythonWidgetCodeWriter):
     def get_code(self, window):
         self._reset_vars()
         wcodegen.PythonWidgetCodeWriter._prepare_tmpl_content(self, window)
@@ -52,6 +69,35 @@ class PythonNotebookGenerator(wcodegen.PythonWidgetCodeWriter):
         notebook = self.format_widget_access(obj)  # 'self' or 'self.%s'%obj.name
         return ['%s.AddPage(%s, %s)\n'%(notebook, tab_win, self.codegen.quote_str(label))]
 
+    def get_lazy_pages_code(self, obj, pages, klass):
+        """pages: list of (page, init lines, final lines, event handler index range) as collected by the code writer;
+        adds a method per page and the event handler calling them to klass.methods; returns the code to bind it"""
+        notebook = self.format_widget_access(obj)
+        handler_name = "_on_%s_page_changing" % obj.name
+        tab = self.codegen.tabs(1)
+        not_found = self.cn("wxNOT_FOUND")
+        handler_code = ["# create the content of the page when it is selected the first time\n",
+                        "selection = event.GetSelection()\n",
+                        "page = %s.GetPage(selection) if selection != %s else None\n" % (notebook, not_found)]
+        methods = [(handler_name, "self, event", handler_code)]
+        for i, (page, init, final, (first, last)) in enumerate(pages):
+            page_access = self.format_widget_access(page)
+            method_name = self._get_page_method_name(obj, page)
+            handler_code.append( "%s page is %s and not page.GetSizer():\n" % (i and "elif" or "if", page_access) )
+            handler_code.append( tab + "self.%s()\n" % method_name )
+            code = init[1:] if init[:1]==["\n"] else init[:]
+            if final: code += ["\n"] + final
+            while code and code[-1]=="\n": del code[-1]
+            # the event handlers can only be bound after the widgets have been created
+            handlers = klass.event_handlers[first:last]
+            code += self.codegen.generate_code_event_bind(page, "", handlers)
+            klass.event_handlers[first:last] = [(None,) + handler[1:] for handler in handlers]  # just the stubs
+            code.append("%s.Layout()\n" % page_access)
+            methods.append( (method_name, "self", code) )
+        handler_code.append("event.Skip()\n")
+        klass.methods.extend(methods)
+        return ["\n", "%s.Bind(%s, self.%s)\n" % (notebook, self.cn("EVT_NOTEBOOK_PAGE_CHANGING"), handler_name)]
+
 
 def xrc_code_generator(obj):
     xrcgen = common.code_writers['XRC']
@@ -84,7 +130,7 @@ def xrc_code_generator(obj):
     return NotebookXrcObject(obj)
 
 
-class CppNotebookGenerator(wcodegen.CppWidgetCodeWriter):
+class CppNotebookGenerator(LazyPagesMixin, wcodegen.CppWidgetCodeWriter):
     constructor = [('wxWindow*', 'parent'), ('wxWindowID', 'id'),
                    ('const wxPoint&', 'pos', 'wxDefaultPosition'),
                    ('const wxSize&', 'size', 'wxDefaultSize'),
@@ -127,6 +173,38 @@ class CppNotebookGenerator(wcodegen.CppWidgetCodeWriter):
             return ['AddPage(%s, %s);\n' % (child.name, label)]
         return ['%s->AddPage(%s, %s);\n' % (obj.name, child.name, label)]
 
+    def is_lazy_page(self, obj, page):
+        # the event handler is connected using Bind(), which is not available with wxWidgets 2.8
+        if self.codegen.for_version < (3, 0): return False
+        return LazyPagesMixin.is_lazy_page(self, obj, page)
+
+    def get_lazy_pages_code(self, obj, pages, klass):
+        """pages: list of (page, init lines, final lines, event handler index range) as collected by the code writer;
+        adds a method per page and the event handler calling them to klass.methods; returns the code to bind it"""
+        # the event table entries of the page widgets work without changes, as they refer to the ids
+        notebook = self.codegen.format_generic_access(obj)  # '' or 'notebook_1->'
+        code_obj = obj
+        while not code_obj.IS_CLASS:
+            code_obj = code_obj.parent
+        handler_name = "_on_%s_page_changing" % obj.name
+        tab = self.codegen.tabs(1)
+        handler_code = ["// create the content of the page when it is selected the first time\n",
+                        "int selection = event.GetSelection();\n",
+                        "wxWindow* page = selection != wxNOT_FOUND ? %sGetPage(selection) : NULL;\n" % notebook]
+        methods = [(handler_name, "wxBookCtrlEvent& event", handler_code)]
+        for i, (page, init, final, handlers) in enumerate(pages):
+            method_name = self._get_page_method_name(obj, page)
+            handler_code.append( "%sif (page == %s && !page->GetSizer()) {\n" % (i and "} else " or "", page.name) )
+            handler_code.append( tab + "%s();\n" % method_name )
+            code = [line for line in init + final if line!="\n"]  # no empty lines, like in the constructor
+            code.append("%s->Layout();\n" % page.name)
+            methods.append( (method_name, "", code) )
+        handler_code.append("}\n")
+        handler_code.append("event.Skip();\n")
+        klass.methods.extend(methods)
+        klass_name = self.codegen.cn_class(code_obj.klass)
+        return ["%sBind(wxEVT_NOTEBOOK_PAGE_CHANGING, &%s::%s, this);\n" % (notebook, klass_name, handler_name)]
+
 
 def initialize():
     klass = 'wxNotebook'
@@ -74,8 +74,19 @@ class EditNotebook(ManagedBase, EditStylesMixin):
 
     WX_CLASS = "wxNotebook"
     CAN_BE_CLASS = True
-    _PROPERTIES = ["Widget", "no_custom_class", "style", "tabs"]
+    _PROPERTIES = ["Widget", "no_custom_class", "style", "tabs", "lazy_pages"]
     PROPERTIES = ManagedBase.PROPERTIES + _PROPERTIES + ManagedBase.EXTRA_PROPERTIES
+    _PROPERTY_LABELS = {"lazy_pages":"Create pages on selection"}
+    _PROPERTY_HELP = {"lazy_pages":"Python and C++ (wxWidgets 3) only:\n"
+                                   "Generate code that creates the content of the pages when a page is selected "
+                                   "the first time, not in the constructor. Before, the pages are empty panels.\n"
+                                   "Only pages with a sizer and a size are deferred; the first page is always "
+                                   "created.\n"
+                                   "The size is kept as minimum size of the empty page, such that the notebook is "
+                                   "sized from the created pages and the sizes of the deferred ones.\n"
+                                   "The content of page N is created by a method _create_<notebook>_page_N.\n"
+                                   "Pages must be selected via the user interface or SetSelection, not "
+                                   "ChangeSelection, as only EVT_NOTEBOOK_PAGE_CHANGING is handled."}
 
     def __init__(self, name, parent, style, pos):
         ManagedBase.__init__(self, name, 'wxNotebook', parent, pos)
@@ -90,6 +101,7 @@ class EditNotebook(ManagedBase, EditStylesMixin):
         tab_cols = [('Tab label', np.GridProperty.STRING)]
         self.tabs = NotebookPagesProperty(tabs, tab_cols)
         self.no_custom_class = np.CheckBoxProperty(False, default_value=False)
+        self.lazy_pages = np.CheckBoxProperty(False, default_value=False)
 
     def create_widget(self):
         self.widget = wx.Notebook( self.parent_window.widget, self.id, style=self.style )
@@ -97,6 +109,20 @@ class EditNotebook(ManagedBase, EditStylesMixin):
             c.create()
             if c.IS_SLOT:
                 self.widget.AddPage(c.widget, label)
+        self.widget.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.on_page_changed)
+
+    def _is_hidden_child(self, child):
+        # the content of the other pages is created when they are selected the first time
+        if not self.widget or child is None or child.IS_SLOT: return False
+        selection = self.widget.GetSelection()
+        return self.children.index(child) != max(selection, 0)
+
+    def on_page_changed(self, event):
+        if event.GetEventObject() is self.widget:
+            index = event.GetSelection()
+            if 0 <= index < len(self.children) and self.children[index] is not None:
+                self.children[index].create_deferred_widgets()
+        event.Skip()
 
     def on_load(self, child=None):
         ManagedBase.on_load(self)
@@ -257,7 +283,7 @@ class EditNotebook(ManagedBase, EditStylesMixin):
         if added is not None and self.widget:
             self.widget.SetSelection(added)
 
-        common.app_tree.build(self, recursive=False)
+        if common.app_tree: common.app_tree.build(self, recursive=False)
 
     def _free_slot(self, pos, force_layout=True):
         "Replaces the element at pos with an empty slot"
@@ -12,6 +12,14 @@ import wcodegen
 from .tool import *
 
 
+def _get_kind(tool):
+    kinds = ['wxITEM_NORMAL', 'wxITEM_CHECK', 'wxITEM_RADIO']
+    try:
+        return kinds[int(tool.type)]
+    except (IndexError, ValueError):
+        return 'wxITEM_NORMAL'
+
+
 class PythonCodeGenerator(wcodegen.PythonWidgetCodeWriter):
     def get_properties_code(self, obj):
         out = []
@@ -30,37 +38,36 @@ class PythonCodeGenerator(wcodegen.PythonWidgetCodeWriter):
 
         return out
 
+    def _get_id(self, tool, ids):
+        # returns the id argument and the id to bind the handler to, or None to use tool.GetId()
+        id_declaration, val = self.codegen.generate_code_id(None, tool.id)
+        if self.codegen.preview or (not id_declaration and (not val or val == '-1')):
+            return self.cn('wxNewId()'), None
+        if id_declaration: ids.append( id_declaration )
+        return val, (val if val!='wx.ID_ANY' else None)
+
+    def _get_bitmaps(self, tool):
+        if tool.bitmap1:
+            bmp1 = self.generate_code_bitmap(tool.bitmap1, required=self.codegen.preview)
+        else:
+            bmp1 = self.generate_code_bitmap("empty:16,16")
+        return bmp1, self.generate_code_bitmap(tool.bitmap2)
+
     def get_init_code(self, obj):
+        if obj.data_table:
+            return self.get_table_code(obj)
         out = []
         ids = []
 
         obj_name = self.format_widget_access(obj)
 
-        bmp1 = self.generate_code_bitmap("empty:16,16")
-
         for tool in obj.tools:
             if tool.id == '---':  # item is a separator
                 out.append( '%s.AddSeparator()\n' % obj_name )
             else:
-                id_access = None  # default: access via item.GetId()
-                id_declaration, val = self.codegen.generate_code_id(None, tool.id)
-                if self.codegen.preview or (not id_declaration and (not val or val == '-1')):
-                    wid = self.cn('wxNewId()')
-                else:
-                    if id_declaration: ids.append( id_declaration )
-                    wid = val
-                    if val!='wx.ID_ANY': id_access = val
-
-                kinds = ['wxITEM_NORMAL', 'wxITEM_CHECK', 'wxITEM_RADIO']
-                try:
-                    kind = kinds[int(tool.type)]
-                except (IndexError, ValueError):
-                    kind = 'wxITEM_NORMAL'
-                if tool.bitmap1:
-                    bmp1 = self.generate_code_bitmap(tool.bitmap1, required=self.codegen.preview)
-                else:
-                    bmp1 = self.generate_code_bitmap("empty:16,16")
-                bmp2 = self.generate_code_bitmap(tool.bitmap2)
+                wid, id_access = self._get_id(tool, ids)
+                kind = _get_kind(tool)
+                bmp1, bmp2 = self._get_bitmaps(tool)
                 
                 # append and optionally assign the returned item to a temporary variable
                 if False: # tool.name:
@@ -88,6 +95,38 @@ class PythonCodeGenerator(wcodegen.PythonWidgetCodeWriter):
 
         return ids + out
 
+    def get_table_code(self, obj):
+        "like get_init_code, but the tools are stored in a table of tuples that is processed by a loop"
+        if not obj.tools: return []
+        quote_str = self.codegen.quote_str
+        tab = self.codegen.tabs(1)
+        obj_name = self.format_widget_access(obj)
+        ids = []
+        # one tuple (id, label, bitmap, disabled bitmap, kind, short help, long help, handler) per tool
+        out = ['for tool in (\n']
+        for tool in obj.tools:
+            if tool.id == '---':  # item is a separator
+                out.append( tab*2 + 'None,\n' )
+                continue
+            wid, id_access = self._get_id(tool, ids)
+            bmp1, bmp2 = self._get_bitmaps(tool)
+            if tool.handler:
+                handler = tool.handler if "." in tool.handler else "self.%s"%tool.handler
+            else:
+                handler = 'None'
+            args = [wid, quote_str(tool.label), bmp1, bmp2, self.cn(_get_kind(tool)),
+                    quote_str(tool.short_help), quote_str(tool.long_help), handler]
+            out.append( '%s(%s),\n' % (tab*2, ", ".join(args)) )
+        method = "AddLabelTool" if compat.IS_CLASSIC else "AddTool"
+        out += [tab*2 + '):\n',
+                tab + 'if tool is None:\n',
+                tab*2 + '%s.AddSeparator()\n' % obj_name,
+                tab*2 + 'continue\n',
+                tab + 'id, label, bmp1, bmp2, kind, short_help, long_help, handler = tool\n',
+                tab + 'tool = %s.%s(id, label, bmp1, bmp2, kind, short_help, long_help)\n' % (obj_name, method),
+                tab + 'if handler: self.Bind(wx.EVT_TOOL, handler, id=tool.GetId())\n']
+        return ids + out
+
     def get_code(self, obj):
         "function that generates Python code for the menubar of a wxFrame"
         style = obj.properties['style'].get_string_value()
@@ -203,8 +242,9 @@ class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
             style = ', wxDefaultPosition, wxDefaultSize, wxTB_HORIZONTAL|' + style
         else:
             style = ''
-        init = ['%s = new %s(this, -1%s);\n' % (obj.name, obj.klass, style), 'SetToolBar(%s);\n' % obj.name
-                ] + self.get_properties_code(obj) + self.get_layout_code(obj)
+        init = ['%s = new %s(this, -1%s);\n' % (obj.name, obj.klass, style), 'SetToolBar(%s);\n' % obj.name]
+        if not obj.IS_CLASS:  # if it's a class, then the tools will be generated in the class code
+            init += self.get_properties_code(obj) + self.get_layout_code(obj)
         ids = self.get_ids_code(obj)
         return init, ids, []
 
@@ -229,24 +269,17 @@ class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
         if obj.properties["separation"].is_active():
             out.append('%sSetToolSeparation(%s);\n' % (obj_name, obj.separation))
 
+        if obj.data_table and self._can_use_table(obj):
+            return out + self.get_table_code(obj)
+
         need_tmp = False
 
         for tool in obj.tools:
             if tool.id == '---':  # item is a separator
                 out.append('%sAddSeparator();\n' % obj_name)
             else:
-                id_access = None
-                name, val = self.codegen.generate_code_id(None, tool.id)
-                if not name and (not val or val == '-1'):
-                    wid = 'wxNewId()'
-                else:
-                    wid = val
-                    if val!='wxID_ANY': id_access = val
-                kinds = ['wxITEM_NORMAL', 'wxITEM_CHECK', 'wxITEM_RADIO']
-                try:
-                    kind = kinds[int(tool.type)]
-                except (IndexError, ValueError):
-                    kind = 'wxITEM_NORMAL'
+                wid, id_access = self._get_id(tool)
+                kind = _get_kind(tool)
                 bmp1 = self.generate_code_bitmap(tool.bitmap1)
                 bmp2 = self.generate_code_bitmap(tool.bitmap2)
 
@@ -272,7 +305,7 @@ class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
                              self.codegen.quote_str(tool.long_help)))
 
                 if tool.handler:
-                    handler = tool.handler if "::" in tool.handler else '%s::%s'%(obj.parent.klass, tool.handler)
+                    handler = tool.handler if "::" in tool.handler else '%s::%s'%(self._get_class(obj), tool.handler)
 
                     if self.codegen.for_version==(2,8):
                         tmpl = 'Connect(%(id)s, wxEVT_TOOL, %(handler)s);\n'
@@ -285,6 +318,78 @@ class CppCodeGenerator(wcodegen.CppWidgetCodeWriter):
 
         return out
 
+    def _get_id(self, tool):
+        # returns the id argument and the id to bind the handler to, or None to use tool->GetId()
+        name, val = self.codegen.generate_code_id(None, tool.id)
+        if not name and (not val or val == '-1'):
+            return 'wxNewId()', None
+        return val, (val if val!='wxID_ANY' else None)
+
+    def _get_class(self, obj):
+        # the name of the class that holds the handlers: the toolbar itself if it's a class, e.g. a toplevel one
+        return obj.klass if obj.IS_CLASS else obj.parent.klass
+
+    def _can_use_table(self, obj):
+        # the handlers are stored as member function pointers of the class
+        klass = self._get_class(obj)
+        handlers = [tool.handler for tool in obj.tools if tool.handler and tool.id != '---']
+        return all(h.rsplit("::", 1)[0]==klass for h in handlers if "::" in h)
+
+    def get_table_code(self, obj):
+        "like the tool part of get_properties_code, but the tools are stored in an array that is processed by a loop"
+        if not obj.tools: return []
+        quote_str = self.codegen.quote_str
+        tab = self.codegen.tabs(1)
+        klass = self._get_class(obj)
+        obj_name = self.codegen.format_generic_access(obj)
+        entries = []
+        for tool in obj.tools:
+            if tool.id == '---':  # item is a separator
+                entries.append( tab + '{true, 0, wxEmptyString, wxNullBitmap, wxNullBitmap, wxITEM_NORMAL, '
+                                      'wxEmptyString, wxEmptyString, NULL},\n' )
+                continue
+            wid, id_access = self._get_id(tool)
+            handler = 'NULL'
+            if tool.handler:
+                handler = '&' + (tool.handler if "::" in tool.handler else '%s::%s'%(klass, tool.handler))
+            args = ['false', wid, quote_str(tool.label),
+                    self.generate_code_bitmap(tool.bitmap1), self.generate_code_bitmap(tool.bitmap2),
+                    _get_kind(tool), quote_str(tool.short_help), quote_str(tool.long_help), handler]
+            entries.append( '%s{%s},\n' % (tab, ", ".join(args)) )
+
+        if self.codegen.for_version==(2,8):
+            bind = 'Connect(wxglade_tool->GetId(), wxEVT_COMMAND_TOOL_CLICKED, ' \
+                   '(wxObjectEventFunction)(wxEventFunction)' \
+                   'wxStaticCastEvent(wxCommandEventFunction, entry.handler));\n'
+        else:
+            bind = 'Bind(wxEVT_TOOL, entry.handler, this, wxglade_tool->GetId());\n'
+        out = ['struct wxglade_tool_entry {\n',
+               tab + 'bool separator;\n',
+               tab + 'long id;\n',
+               tab + 'wxString label;\n',
+               tab + 'wxBitmap bitmap;\n',
+               tab + 'wxBitmap bitmap_disabled;\n',
+               tab + 'wxItemKind kind;\n',
+               tab + 'wxString short_help;\n',
+               tab + 'wxString long_help;\n',
+               tab + 'void (%s::*handler)(wxCommandEvent&);\n' % klass,
+               '};\n',
+               'const wxglade_tool_entry wxglade_tool_entries[] = {\n']
+        out.extend(entries)
+        out.extend( ['};\n',
+                     'for (size_t i = 0; i < sizeof(wxglade_tool_entries) / sizeof(wxglade_tool_entries[0]); i++) {\n',
+                     tab + 'const wxglade_tool_entry& entry = wxglade_tool_entries[i];\n',
+                     tab + 'if (entry.separator) {\n',
+                     tab*2 + '%sAddSeparator();\n' % obj_name,
+                     tab*2 + 'continue;\n',
+                     tab + '}\n',
+                     tab + 'wxToolBarToolBase* wxglade_tool = %sAddTool(entry.id, entry.label, entry.bitmap, '
+                           'entry.bitmap_disabled,\n' % obj_name,
+                     tab*2 + 'entry.kind, entry.short_help, entry.long_help);\n',
+                     tab + 'if (entry.handler) ' + bind,
+                     '}\n'] )
+        return out
+
     def get_ids_code(self, obj):
         ids = []
 
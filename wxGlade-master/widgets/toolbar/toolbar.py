@@ -559,9 +559,15 @@ class EditToolBar(EditBase, PreviewMixin, EditStylesMixin, BitmapMixin):
 
     WX_CLASS = 'wxToolBar'
     CAN_BE_CLASS = True
-    _PROPERTIES = ["Widget", "bitmapsize", "margins", "packing", "separation", "style", "tools", "preview"]
+    _PROPERTIES = ["Widget", "bitmapsize", "margins", "packing", "separation", "style", "tools", "data_table",
+                   "preview"]
     PROPERTIES = EditBase.PROPERTIES + _PROPERTIES + EditBase.EXTRA_PROPERTIES
     CHILDREN = 0
+    _PROPERTY_LABELS = {"data_table":"Generate data table"}
+    _PROPERTY_HELP = {"data_table":"Python and C++ only:\n"
+                                   "Generate a table of the tools and a loop to create them,\n"
+                                   "instead of one or more statements per item.\n"
+                                   "This keeps the generated code short for large toolbars."}
 
     def __init__(self, name, klass, parent):
         if parent.IS_ROOT:
@@ -581,6 +587,7 @@ class EditToolBar(EditBase, PreviewMixin, EditStylesMixin, BitmapMixin):
         self.packing    = np.SpinPropertyD(1, val_range=(0,100), default_value=1, immediate=True)
         self.separation = np.SpinPropertyD(5, val_range=(0,100), default_value=5, immediate=True)
         self.tools = ToolsProperty()  # incl. the Edit button
+        self.data_table = np.CheckBoxProperty(False, default_value=False)
 
         self.window_id = None  # just a dummy for code generation
 
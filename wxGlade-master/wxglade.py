@@ -44,7 +44,7 @@ def my_displayhook(value):
 sys.displayhook = my_displayhook
 
 
-import common, config, compat, log
+import common, config, compat, depfile, log, profiling, stats
 
 
 def parse_command_line():
@@ -63,6 +63,9 @@ def parse_command_line():
                 "             <http://www.opensource.org/licenses/mit-license.php>") % config.get_version()
     usage = _("Usage: wxglade <WXG File>             start the wxGlade GUI\n"
               " or:   wxglade <Options> <WXG File>   generate code from command line\n"
+              " or:   wxglade --watch DIR -g LANG    re-generate code whenever a .wxg file in DIR changes\n"
+              " or:   wxglade --server[=SOCKET]      serve JSON-RPC requests on stdin/stdout or a Unix socket\n"
+              " or:   wxglade --find QUERY <File>    list the widgets with matching property values\n"
               " or:   wxglade --version              show programs version number and exit\n"
               " or:   wxglade -h|--help              show this help message and exit")
     parser = optparse.OptionParser( add_help_option=False, version=version, usage=usage )
@@ -77,7 +80,48 @@ def parse_command_line():
     parser.add_option("-c", "--use-config", dest="rc_file",
                             help=_("use specified wxgladerc config file instead of the default one") )
 
-    options, args = parser.parse_args()
+    parser.add_option("--log-json", metavar="FILE", dest="log_json",
+                            help=_("(optional) write all log messages as JSON lines to FILE; '-' for stdout") )
+
+    parser.add_option("--stats", type="choice", choices=["text", "json"], metavar="FORMAT", dest="stats",
+                            help=_("(optional) print timings and counters of the code generation; "
+                                   "--stats=json for JSON output") )
+
+    parser.add_option("--depfile", metavar="FILE", dest="depfile",
+                            help=_("(optional) write the input and output files of the code generation to FILE, "
+                                   "as dependency rule for make or ninja") )
+
+    parser.add_option("--profile", metavar="DIR", dest="profile",
+                            help=_("(optional) profile loading, code generation and saving; write .pstats files to DIR"))
+    parser.add_option("--memprofile", action="store_true", dest="memprofile",
+                            help=_("(optional) write tracemalloc statistics for loading, code generation and saving "
+                                   "to the --profile directory or to the profiles directory in the application data") )
+
+    parser.add_option("--watch", metavar="DIR", dest="watch",
+                            help=_("(optional) keep running and re-generate code for the .wxg files in DIR and its "
+                                   "sub-directories whenever they or the bitmaps used by them are modified; "
+                                   "-o specifies an output directory for all projects") )
+    parser.add_option("--watch-interval", type="float", metavar="SECONDS", dest="watch_interval", default=0.5,
+                            help=_("(optional) polling interval for --watch; default: 0.5") )
+    parser.add_option("--watch-delay", type="float", metavar="SECONDS", dest="watch_delay", default=1.0,
+                            help=_("(optional) for --watch, wait until files have not been modified for this "
+                                   "time; default: 1.0") )
+
+    parser.add_option("--server", metavar="SOCKET", dest="server",
+                            help=_("(optional) run a code generation server speaking JSON-RPC on stdin/stdout or, "
+                                   "with --server=SOCKET, on a Unix domain socket; see server.py") )
+    parser.add_option("--server-workers", type="int", metavar="N", dest="server_workers",
+                            help=_("(optional) number of worker processes for --server; default: number of CPUs") )
+
+    parser.add_option("--find", metavar="QUERY", dest="find", action="append",
+                            help=_("(optional) print the widgets with a matching property value, e.g. "
+                                   "--find handler=OnSave or --find label=Cancel; without name, all properties are "
+                                   "searched; * and ? are wildcards; may be given multiple times") )
+
+    # --stats without a value is the same as --stats=text; --server without a value is the same as --server=stdio
+    defaults = {"--stats":"--stats=text", "--server":"--server=stdio"}
+    argv = [defaults.get(arg, arg) for arg in sys.argv[1:]]
+    options, args = parser.parse_args(argv)
 
     # print epilog because OptionParser.epilog isn't available to Python 2.3
     if options.help:
@@ -106,7 +150,31 @@ def parse_command_line():
     #     - one file            -> cmdline code generation
     #     - no / > one files    -> usage
     #  - no language            -> start gui
-    if options.language:
+    if options.server:
+        if args:
+            msg = _("--server does not accept a wxg file.\n")
+            logging.error(msg)
+            parser.print_help()
+            sys.exit(msg)
+        if options.server!="stdio":
+            options.server = os.path.abspath(os.path.expanduser(options.server))
+        options.start_gui = False
+    elif options.find:
+        if options.language or len(args)!=1:
+            msg = _("--find requires one wxg file and no language.\n")
+            logging.error(msg)
+            parser.print_help()
+            sys.exit(msg)
+        options.start_gui = False
+    elif options.watch:
+        if not options.language or args:
+            msg = _("--watch requires a language and no wxg file.\n")
+            logging.error(msg)
+            parser.print_help()
+            sys.exit(msg)
+        options.watch = os.path.normpath(os.path.abspath(os.path.expanduser(options.watch)))
+        options.start_gui = False
+    elif options.language:
         if len(args) == 1:
             options.start_gui = False
         elif len(args) == 0:
@@ -198,11 +266,12 @@ def _guiless_open_app(filename):
 
             p = XmlWidgetBuilder(filename, input_file_version)
 
-            if infile is not None:
-                p.parse(infile)
-            else:
-                p.parse_string(filename)
-                filename = None
+            with stats.timer("parse"), profiling.profile("load"):
+                if infile is not None:
+                    p.parse(infile)
+                else:
+                    p.parse_string(filename)
+                    filename = None
         except (EnvironmentError, SAXParseException, XmlParsingError) as msg:
             if config.debugging: raise
             if infile is not None:
@@ -251,12 +320,13 @@ def _guiless_open_app(filename):
 
     
 
-def command_line_code_generation(filename, language, out_path=None):
+def command_line_code_generation(filename, language, out_path=None, depfile_name=None):
     """Starts a code generator without starting the GUI.
 
     filename: Name of wxg file to generate code from
     language: Code generator language
-    out_path: output file / output directory"""
+    out_path: output file / output directory
+    depfile_name: optional name of a dependency file to write"""
     import application, tree
     # Instead of instantiating a main.wxGlade() object, that is
     # derived from wx.App, we must do the equivalent work.  The
@@ -277,7 +347,13 @@ def command_line_code_generation(filename, language, out_path=None):
         if language not in common.code_writers:
             raise ValueError('Code writer for "%s" is not available.'%language)
         common.root.properties["language"].set(language)
+        if depfile_name: depfile.start()
         common.root.generate_code(out_path=out_path)
+        if depfile_name:
+            depfile.add_project(common.root)
+            if not depfile.write(depfile_name):
+                logging.warning( _("No code generated; dependency file %s not written"), depfile_name )
+        stats.report()
     except errors.WxgBaseException as inst:
         if config.debugging: raise
         logging.error(inst)
@@ -291,6 +367,43 @@ def command_line_code_generation(filename, language, out_path=None):
     sys.exit(0)
 
 
+def command_line_find(filename, queries):
+    """Prints the widgets with property values matching the queries, without starting the GUI.
+    Exits with status 1 if nothing was found.
+
+    filename: Name of wxg file to search
+    queries:  list of queries like "handler=OnSave"; see search.parse_query()"""
+    import application, search
+    common.init_preferences()
+    common.root = application.Application()
+    search.start()
+    if not _guiless_open_app(filename):
+        sys.exit(1)
+    found = 0
+    for query in queries:
+        for widget, prop, name, value in search.find(*search.parse_query(query)):
+            print( "%s: %s=%s" % ("/".join(widget.get_path()), name, value.replace("\n", "\\n")) )
+            found += 1
+    sys.exit(0 if found else 1)
+
+
+def command_line_watch(directory, language, out_path=None, interval=0.5, delay=1.0):
+    """Re-generates code whenever a .wxg file in the directory tree is modified, without starting the GUI.
+
+    directory: directory to watch
+    language:  code generator language
+    out_path:  output directory; default is the output path of each project
+    interval:  polling interval in seconds
+    delay:     debounce delay in seconds"""
+    import watch
+    if language not in common.code_writers:
+        msg = 'Code writer for "%s" is not available.'%language
+        logging.error(msg)
+        sys.exit(msg)
+    watcher = watch.Watcher(directory, language, out_path and os.path.abspath(out_path), interval, delay)
+    sys.exit( watcher.run() )
+
+
 def init_stage1(options):
     """Initialise paths for wxGlade (first stage)
     Initialisation is split because the test suite doesn't work with proper initialised paths."""
@@ -298,7 +411,8 @@ def init_stage1(options):
     common.init_paths(options)
 
     # initialise own logging extensions
-    log.init(filename=config.log_file, encoding='utf-8', level='INFO')
+    log.init(filename=config.log_file, encoding='utf-8', level='INFO',
+             json_filename=options and getattr(options, "log_json", None))
     atexit.register(log.deinit)
 
     # print versions
@@ -364,24 +478,40 @@ def init_stage2(use_gui):
     else:
         # use_gui has to be set before importing config
         common.init_preferences()
-        common.init_codegen()
+        with stats.timer("plugins"):
+            common.init_codegen()
 
 
 def run_main():
     "This main procedure is started by calling either wxglade.py or wxglade.pyw on windows."
     # check command line parameters first
     options = parse_command_line()
+    if options.stats and not options.start_gui:
+        stats.start(options.stats)
 
     # initialise wxGlade (first stage and second stage)
-    init_stage1(options)
-    init_stage2(options.start_gui)
+    with stats.timer("init"):
+        init_stage1(options)
+        init_stage2(options.start_gui)
+
+    if options.profile or options.memprofile:
+        profiling.enable(options.profile, options.memprofile)
 
     if options.start_gui:
         # late import of main (imported wx) for using wxversion  in init_stage2()
         import main
         main.main(options.filename)
+    elif options.server:
+        import server
+        sys.exit( server.run(options.server, options.server_workers) )
+    elif options.find:
+        command_line_find(options.filename, options.find)
+    elif options.watch:
+        command_line_watch(options.watch, options.language, options.output,
+                           options.watch_interval, options.watch_delay)
     else:
-        command_line_code_generation( filename=options.filename, language=options.language, out_path=options.output )
+        command_line_code_generation( filename=options.filename, language=options.language, out_path=options.output,
+                                      depfile_name=options.depfile )
 
 if __name__ == "__main__":
     run_main()
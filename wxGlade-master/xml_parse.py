@@ -15,7 +15,7 @@ from xml.sax.handler import ContentHandler
 
 import time
 
-import common, config
+import common, config, stats
 
 
 class XmlParsingError(SAXException):
@@ -133,6 +133,53 @@ class XmlParser(ContentHandler):
             mark_blocks = True
         res['mark_blocks'] = bool(mark_blocks)
 
+        try:
+            share_resources = int(attrs['share_resources'])
+        except (KeyError, ValueError):
+            share_resources = False
+        res['share_resources'] = bool(share_resources)
+
+        try:
+            embed_images = int(attrs['embed_images'])
+        except (KeyError, ValueError):
+            embed_images = False
+        res['embed_images'] = bool(embed_images)
+
+        try:
+            table_threshold = int(attrs['table_threshold'])
+        except (KeyError, ValueError):
+            table_threshold = None
+        res['table_threshold'] = table_threshold
+
+        try:
+            choices_file = int(attrs['choices_file'])
+        except (KeyError, ValueError):
+            choices_file = False
+        res['choices_file'] = bool(choices_file)
+
+        try:
+            lazy_imports = int(attrs['lazy_imports'])
+        except (KeyError, ValueError):
+            lazy_imports = False
+        res['lazy_imports'] = bool(lazy_imports)
+
+        try:
+            minimal_includes = int(attrs['minimal_includes'])
+        except (KeyError, ValueError):
+            minimal_includes = False
+        res['minimal_includes'] = bool(minimal_includes)
+
+        try:
+            precompiled_header = int(attrs['precompiled_header'])
+        except (KeyError, ValueError):
+            precompiled_header = False
+        res['precompiled_header'] = bool(precompiled_header)
+
+        try:
+            xrc_archive = int(attrs['xrc_archive'])
+        except (KeyError, ValueError):
+            xrc_archive = False
+        res['xrc_archive'] = bool(xrc_archive)
 
         res['path'] = attrs.get('path')
 
@@ -196,12 +243,25 @@ class XmlWidgetBuilder(XmlParser):
             p["is_template"].set( attrs['is_template'] )
             p["overwrite"].set( attrs['overwrite'] )
             p["mark_blocks"].set( attrs['mark_blocks'] )
+            p["share_resources"].set( attrs['share_resources'] )
+            p["embed_images"].set( attrs['embed_images'] )
+            if attrs['table_threshold'] is None:
+                p["table_threshold"].set( 100, deactivate=True )
+            else:
+                p["table_threshold"].set( attrs['table_threshold'], activate=True )
+            p["choices_file"].set( attrs['choices_file'] )
+            p["lazy_imports"].set( attrs['lazy_imports'] )
+            p["minimal_includes"].set( attrs['minimal_includes'] )
+            p["precompiled_header"].set( attrs['precompiled_header'] )
+            p["xrc_archive"].set( attrs['xrc_archive'] )
             p["indent_mode"].set( attrs['indent_symbol'] )
             p["indent_amount"].set( attrs['indent_amount'] )
             p["for_version"].set( attrs['for_version'] )
 
             modified = ["encoding", "output_path", "class", "name", "multiple_files", "language", "top_window",
-                        "use_gettext", "is_template", "overwrite", "mark_blocks",
+                        "use_gettext", "is_template", "overwrite", "mark_blocks", "share_resources", "embed_images",
+                        "table_threshold", "choices_file", "lazy_imports",
+                        "minimal_includes", "precompiled_header", "xrc_archive",
                         "indent_mode", "indent_amount", "for_version"]
 
             source_extension = attrs['source_extension']
@@ -349,6 +409,39 @@ class ProgressXmlWidgetBuilder(XmlWidgetBuilder):
                 self.progress = None
 
 
+class IncrementalXmlWidgetBuilder(XmlWidgetBuilder):
+    """Loads the lines of a file in steps, such that the GUI can be used while a large project is loading.
+    on_toplevel(editor) is called for each toplevel window as soon as it has been loaded; see main._open_app()"""
+    LINES = 200  # lines fed to the parser at once
+
+    def __init__(self, filename, input_file_version, lines, on_toplevel):
+        XmlWidgetBuilder.__init__(self, filename, input_file_version)
+        self.lines = lines
+        self.position = 0  # index of the next line to be fed
+        self.on_toplevel = on_toplevel
+
+    def parse_step(self, duration=0.05):
+        "feed lines for about the given number of seconds; returns True when the file has been loaded completely"
+        end = time.time() + duration
+        while self.position < len(self.lines):
+            lines = self.lines[self.position:self.position+self.LINES]
+            self.position += self.LINES
+            self.parser.feed( "".join(lines) )
+            if time.time() > end: return False
+        self.parser.close()
+        return True
+
+    def get_progress(self):
+        "returns the loaded part in percent"
+        return min(100, self.position * 100 // (len(self.lines) or 1))
+
+    def endElement(self, name):
+        obj = self.top()  if name=="object" else  None
+        XmlWidgetBuilder.endElement(self, name)
+        if obj is not None and not (obj.IS_SIZERITEM or obj.IS_SLOT) and obj.obj.parent is common.root:
+            self.on_toplevel(obj.obj)
+
+
 class _own_dict(dict):
     pass  # just be able to add attributes
 
@@ -362,16 +455,21 @@ class ClipboardXmlWidgetBuilder(XmlWidgetBuilder):
         they keep info about the destination of the hierarchy of widgets (i.e. the target of the 'paste' command)
       - The first widget built must be hidden and shown again at the end of the operation"""
 
-    def __init__(self, parent, pos, proportion, span, flag, border):
+    def __init__(self, parent, pos, proportion, span, flag, border, have_names=None, name_counters=None):
+        # have_names and name_counters may be shared between builders when the same XML is pasted multiple times
         XmlWidgetBuilder.__init__(self)
         self._renamed = {}
         self._object_counter = 0
         self.parent = parent
-        if not parent:
+        if have_names is not None:
+            self.have_names = have_names
+        elif not parent:
             # e.g. a frame is pasted: update with the top level names
             self.have_names = set(child.name for child in common.root.children)
         else:
             self.have_names = set(parent.toplevel_parent.names)
+        # per-template counters for _get_free_name, e.g. {"button_%s":5}
+        self._name_counters = {} if name_counters is None else name_counters
 
         class XmlClipboardObject(object):
             def __init__(self, **kwds):
@@ -415,55 +513,41 @@ class ClipboardXmlWidgetBuilder(XmlWidgetBuilder):
             self.have_names.add(oldname)
             return oldname
         if self._renamed:
-            # e.g. if notebook_1 was renamed to notebook_2, try notebook_1_panel_1 -> notebook_2_panel_1 first
-            for old,new in self._renamed.items():
-                if oldname.startswith(old):
-                    newname = new + oldname[len(old):]
+            # e.g. if notebook_1 was renamed to notebook_2, try notebook_1_panel_1 -> notebook_2_panel_1 first;
+            # only prefixes up to an underscore are candidates, so look these up instead of scanning all of _renamed
+            end = oldname.find("_")
+            while end!=-1:
+                new = self._renamed.get(oldname[:end])
+                if new is not None:
+                    newname = new + oldname[end:]
                     if not newname in self.have_names:
+                        self.have_names.add(newname)
                         return newname
+                end = oldname.find("_", end+1)
 
-        newname = oldname
         if "_" in oldname:
             # if the old name ends with an underscore and a number, just increase the number
-            try:
-                template, i = oldname.rsplit("_", 1)
-                i = int(i)
-                template = template + '_%s'
-                if self.parent is not None:
-                    while newname in self.have_names:
-                        newname = template%i
-                        i += 1
-                    self.have_names.add(newname)
-                    return newname
-                # top level, e.g. a new frame is pasted
-                while newname in self.have_names:
-                    newname = template%i
-                    i += 1
-                self.have_names.add(newname)
-                return newname
-            except:
-                pass
+            template, i = oldname.rsplit("_", 1)
+            if i.isdigit():
+                return self._get_free_name(template + '_%s', int(i))
 
         # add _copy or _copy_N to the old name
         if oldname.endswith('_copy'): oldname = oldname[:-5]
-        i = 0
-        if self.parent is not None:
-            while newname in self.have_names:
-                if not i:
-                    newname = '%s_copy' % oldname
-                else:
-                    newname = '%s_copy_%s' % (oldname, i)
-                i += 1
+        newname = '%s_copy' % oldname
+        if not newname in self.have_names:
             self.have_names.add(newname)
             return newname
+        return self._get_free_name(oldname + '_copy_%s', 1)
 
-        # top level, e.g. a new frame is pasted
+    def _get_free_name(self, template, i):
+        # return the first free name template%n with n>=i; the search continues where the last one for this
+        # template stopped, so pasting N copies does not probe the same names again and again
+        i = max(i, self._name_counters.get(template, i))
+        newname = template%i
         while newname in self.have_names:
-            if not i:
-                newname = '%s_copy' % oldname
-            else:
-                newname = '%s_copy_%s' % (oldname, i)
             i += 1
+            newname = template%i
+        self._name_counters[template] = i + 1
         self.have_names.add(newname)
         return newname
 
@@ -519,6 +603,41 @@ class ClipboardXmlWidgetBuilder(XmlWidgetBuilder):
                 self._logger.exception( _('Exception caused by obj: %s'), self.top_obj )
 
 
+class XmlEventRecorder(ContentHandler):
+    """Parses XML once and records the SAX events, such that they can be replayed into several builders;
+    used e.g. to paste multiple copies of the same clipboard data"""
+
+    def __init__(self):
+        ContentHandler.__init__(self)
+        self.events = []
+        self.parser = make_parser()
+        self.parser.setContentHandler(self)
+
+    def parse_string(self, source):
+        self.parser.feed(source)
+        self.parser.close()
+
+    def startElement(self, name, attrs):
+        self.events.append( (0, name, dict(attrs)) )
+
+    def endElement(self, name):
+        self.events.append( (1, name, None) )
+
+    def characters(self, data):
+        if not data or data.isspace(): return
+        self.events.append( (2, data, None) )
+
+    def replay(self, handler):
+        "feed the recorded events into handler, e.g. a ClipboardXmlWidgetBuilder"
+        for event, data, attrs in self.events:
+            if event==0:
+                handler.startElement(data, _own_dict(attrs))  # a fresh copy, as the builders modify attrs
+            elif event==1:
+                handler.endElement(data)
+            else:
+                handler.characters(data)
+
+
 class XmlWidgetObject(object):
     "A class to encapsulate widget attributes read from a XML file, to store them until the widget can be created"
 
@@ -574,6 +693,7 @@ class XmlWidgetObject(object):
             builder = common.widgets_from_xml.get(base, None)
             if builder is None: raise XmlParsingError("Widget '%s' not supported."%base)
             self.obj = builder(attrs, sizer or parent, pos)
+            stats.count("widgets")
             p = self.obj.properties.get("class")
             if p and not p.readonly:  # can happen when pasting a standalone ToolBar or MenuBar to a Frame
                 p.set(self.klass)
@@ -611,6 +731,7 @@ class XmlWidgetObject(object):
             return
         prop.load(val, activate=True)
         self._properties_added.append(name)
+        stats.count("properties")
 
     def notify_owner(self):
         # notify owner about the added properties